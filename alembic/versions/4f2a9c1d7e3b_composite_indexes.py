@@ -0,0 +1,95 @@
+"""composite_indexes
+
+Revision ID: 4f2a9c1d7e3b
+Revises: b1cc668221ca
+Create Date: 2026-10-18 09:12:41.208314
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '4f2a9c1d7e3b'
+down_revision: Union[str, Sequence[str], None] = 'b1cc668221ca'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+OPEN_STATUSES_SQL = "status IN ('PENDING', 'ACTIVE')"
+
+
+def upgrade() -> None:
+    # An item may be auctioned again once its previous auction is over
+    op.drop_index("ix_auctions_item_id", table_name="auctions")
+    op.create_index("ix_auctions_item_id", "auctions", ["item_id"])
+    op.create_index(
+        "uq_auctions_item_id_open",
+        "auctions",
+        ["item_id"],
+        unique=True,
+        postgresql_where=sa.text(OPEN_STATUSES_SQL),
+        sqlite_where=sa.text(OPEN_STATUSES_SQL),
+    )
+
+    # Lifecycle scans and status-filtered listings; the leading status column
+    # makes the single-column index redundant
+    op.drop_index("ix_auctions_status", table_name="auctions")
+    op.create_index(
+        "ix_auctions_status_start_time", "auctions", ["status", "start_time"]
+    )
+    op.create_index("ix_auctions_status_end_time", "auctions", ["status", "end_time"])
+    op.create_index(
+        "ix_auctions_status_created_at",
+        "auctions",
+        ["status", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_auctions_created_at",
+        "auctions",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+    # Top bid per auction and bid history
+    op.drop_index("ix_bids_auction_id", table_name="bids")
+    op.create_index(
+        "ix_bids_auction_id_amount",
+        "bids",
+        ["auction_id", sa.text("amount DESC"), sa.text("id DESC")],
+    )
+
+    # Catalog browsing
+    op.create_index(
+        "ix_items_category_size_condition_created_at",
+        "items",
+        [
+            "category",
+            "size",
+            "condition",
+            sa.text("created_at DESC"),
+            sa.text("id DESC"),
+        ],
+    )
+    op.create_index(
+        "ix_items_created_at",
+        "items",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_items_created_at", table_name="items")
+    op.drop_index("ix_items_category_size_condition_created_at", table_name="items")
+
+    op.drop_index("ix_bids_auction_id_amount", table_name="bids")
+    op.create_index("ix_bids_auction_id", "bids", ["auction_id"])
+
+    op.drop_index("ix_auctions_created_at", table_name="auctions")
+    op.drop_index("ix_auctions_status_created_at", table_name="auctions")
+    op.drop_index("ix_auctions_status_end_time", table_name="auctions")
+    op.drop_index("ix_auctions_status_start_time", table_name="auctions")
+    op.create_index("ix_auctions_status", "auctions", ["status"])
+
+    op.drop_index("uq_auctions_item_id_open", table_name="auctions")
+    op.drop_index("ix_auctions_item_id", table_name="auctions")
+    op.create_index("ix_auctions_item_id", "auctions", ["item_id"], unique=True)
@@ -0,0 +1,47 @@
+"""event_outbox
+
+Revision ID: 8d3e61b0a9f4
+Revises: 4f2a9c1d7e3b
+Create Date: 2026-10-18 10:41:07.553120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '8d3e61b0a9f4'
+down_revision: Union[str, Sequence[str], None] = '4f2a9c1d7e3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_outbox",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("event_type", sa.String(50), nullable=False),
+        sa.Column("auction_id", sa.Integer(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column("delivered_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+    )
+    op.create_index(
+        "ix_event_outbox_undelivered",
+        "event_outbox",
+        ["id"],
+        postgresql_where=sa.text("delivered_at IS NULL"),
+        sqlite_where=sa.text("delivered_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("event_outbox")
@@ -0,0 +1,65 @@
+"""auction_bid_counters
+
+Revision ID: a9d2c4e6f813
+Revises: e5a1f3c8b2d7
+Create Date: 2026-10-18 17:48:12.336904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'a9d2c4e6f813'
+down_revision: Union[str, Sequence[str], None] = 'e5a1f3c8b2d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# An auction's bids are either all live or all archived, so each counter is
+# the live value with the archived one as fallback.
+BACKFILL = """
+UPDATE auctions SET
+    bid_count =
+        (SELECT count(*) FROM bids WHERE bids.auction_id = auctions.id)
+        + (SELECT count(*) FROM bids_archive WHERE bids_archive.auction_id = auctions.id),
+    last_bid_at = coalesce(
+        (SELECT max(created_at) FROM bids WHERE bids.auction_id = auctions.id),
+        (SELECT max(created_at) FROM bids_archive
+         WHERE bids_archive.auction_id = auctions.id)
+    ),
+    leading_bidder_id = coalesce(
+        (SELECT bidder_id FROM bids WHERE bids.auction_id = auctions.id
+         ORDER BY amount DESC, id DESC LIMIT 1),
+        (SELECT bidder_id FROM bids_archive WHERE bids_archive.auction_id = auctions.id
+         ORDER BY amount DESC, id DESC LIMIT 1)
+    )
+WHERE id IN (SELECT auction_id FROM bids UNION SELECT auction_id FROM bids_archive)
+"""
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("auctions") as batch_op:
+        batch_op.add_column(
+            sa.Column("bid_count", sa.Integer(), server_default="0", nullable=False)
+        )
+        batch_op.add_column(
+            sa.Column("last_bid_at", sa.DateTime(timezone=True), nullable=True)
+        )
+        batch_op.add_column(
+            sa.Column(
+                "leading_bidder_id",
+                sa.Integer(),
+                sa.ForeignKey("users.id", name="fk_auctions_leading_bidder_id"),
+                nullable=True,
+            )
+        )
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("auctions") as batch_op:
+        batch_op.drop_constraint("fk_auctions_leading_bidder_id", type_="foreignkey")
+        batch_op.drop_column("leading_bidder_id")
+        batch_op.drop_column("last_bid_at")
+        batch_op.drop_column("bid_count")
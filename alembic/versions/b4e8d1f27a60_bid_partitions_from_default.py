@@ -0,0 +1,78 @@
+"""bid_partitions_from_default
+
+Revision ID: b4e8d1f27a60
+Revises: a9d2c4e6f813
+Create Date: 2026-10-18 20:04:37.118452
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'b4e8d1f27a60'
+down_revision: Union[str, Sequence[str], None] = 'a9d2c4e6f813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same as before, except that a month whose bids already landed in
+# bids_default (the maintenance job missed it) no longer fails: creating its
+# partition would violate the default partition's implied constraint, so the
+# default partition is detached, the month created, its rows moved across and
+# the default partition attached again.
+CREATE_BID_PARTITIONS = """
+CREATE OR REPLACE FUNCTION create_bid_partitions(first_month date, last_month date)
+RETURNS integer LANGUAGE plpgsql AS $$
+DECLARE
+    part_month date := date_trunc('month', first_month)::date;
+    part_name text;
+    lower_bound timestamptz;
+    upper_bound timestamptz;
+    stranded boolean;
+    created integer := 0;
+BEGIN
+    WHILE part_month <= last_month LOOP
+        part_name := format('bids_%s', to_char(part_month, 'YYYY_MM'));
+        lower_bound := part_month::timestamp AT TIME ZONE 'UTC';
+        upper_bound := (part_month + interval '1 month')::timestamp AT TIME ZONE 'UTC';
+        IF to_regclass(part_name) IS NULL THEN
+            stranded := to_regclass('bids_default') IS NOT NULL AND EXISTS (
+                SELECT 1 FROM bids_default
+                WHERE created_at >= lower_bound AND created_at < upper_bound
+            );
+            IF stranded THEN
+                ALTER TABLE bids DETACH PARTITION bids_default;
+            END IF;
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF bids FOR VALUES FROM (%L) TO (%L)',
+                part_name, lower_bound, upper_bound
+            );
+            IF stranded THEN
+                WITH moved AS (
+                    DELETE FROM bids_default
+                    WHERE created_at >= lower_bound AND created_at < upper_bound
+                    RETURNING id, auction_id, bidder_id, amount, created_at
+                )
+                INSERT INTO bids (id, auction_id, bidder_id, amount, created_at)
+                SELECT id, auction_id, bidder_id, amount, created_at FROM moved;
+                ALTER TABLE bids ATTACH PARTITION bids_default DEFAULT;
+                RAISE NOTICE 'Moved bids of % out of bids_default', part_name;
+            END IF;
+            created := created + 1;
+        END IF;
+        part_month := (part_month + interval '1 month')::date;
+    END LOOP;
+    RETURN created;
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(CREATE_BID_PARTITIONS)
+
+
+def downgrade() -> None:
+    # The new function behaves like the old one whenever the old one worked
+    pass
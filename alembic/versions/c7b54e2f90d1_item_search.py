@@ -0,0 +1,69 @@
+"""item_search
+
+Revision ID: c7b54e2f90d1
+Revises: 8d3e61b0a9f4
+Create Date: 2026-10-18 12:03:55.418022
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'c7b54e2f90d1'
+down_revision: Union[str, Sequence[str], None] = '8d3e61b0a9f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            "ALTER TABLE items ADD COLUMN search_vector tsvector "
+            f"GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"
+        )
+        op.execute(
+            "CREATE INDEX ix_items_search_vector ON items USING gin (search_vector)"
+        )
+        return
+
+    op.execute(
+        "CREATE VIRTUAL TABLE items_fts USING fts5("
+        "title, description, content='items', content_rowid='id', "
+        "tokenize='porter unicode61')"
+    )
+    op.execute(
+        "CREATE TRIGGER items_fts_ai AFTER INSERT ON items BEGIN "
+        "INSERT INTO items_fts(rowid, title, description) "
+        "VALUES (new.id, new.title, new.description); END"
+    )
+    op.execute(
+        "CREATE TRIGGER items_fts_ad AFTER DELETE ON items BEGIN "
+        "INSERT INTO items_fts(items_fts, rowid, title, description) "
+        "VALUES ('delete', old.id, old.title, old.description); END"
+    )
+    op.execute(
+        "CREATE TRIGGER items_fts_au AFTER UPDATE OF title, description ON items BEGIN "
+        "INSERT INTO items_fts(items_fts, rowid, title, description) "
+        "VALUES ('delete', old.id, old.title, old.description); "
+        "INSERT INTO items_fts(rowid, title, description) "
+        "VALUES (new.id, new.title, new.description); END"
+    )
+    op.execute("INSERT INTO items_fts(items_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_items_search_vector", table_name="items")
+        op.drop_column("items", "search_vector")
+        return
+
+    op.execute("DROP TRIGGER items_fts_au")
+    op.execute("DROP TRIGGER items_fts_ad")
+    op.execute("DROP TRIGGER items_fts_ai")
+    op.execute("DROP TABLE items_fts")
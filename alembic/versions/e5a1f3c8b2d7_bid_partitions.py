@@ -0,0 +1,147 @@
+"""bid_partitions
+
+Revision ID: e5a1f3c8b2d7
+Revises: c7b54e2f90d1
+Create Date: 2026-10-18 16:22:41.907315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'e5a1f3c8b2d7'
+down_revision: Union[str, Sequence[str], None] = 'c7b54e2f90d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Creates the monthly partitions bids_YYYY_MM covering first_month..last_month
+# (UTC), skipping existing ones. Also used by the maintenance command.
+CREATE_BID_PARTITIONS = """
+CREATE OR REPLACE FUNCTION create_bid_partitions(first_month date, last_month date)
+RETURNS integer LANGUAGE plpgsql AS $$
+DECLARE
+    part_month date := date_trunc('month', first_month)::date;
+    part_name text;
+    created integer := 0;
+BEGIN
+    WHILE part_month <= last_month LOOP
+        part_name := format('bids_%s', to_char(part_month, 'YYYY_MM'));
+        IF to_regclass(part_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF bids FOR VALUES FROM (%L) TO (%L)',
+                part_name,
+                part_month::timestamp AT TIME ZONE 'UTC',
+                (part_month + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+            );
+            created := created + 1;
+        END IF;
+        part_month := (part_month + interval '1 month')::date;
+    END LOOP;
+    RETURN created;
+END
+$$
+"""
+
+
+def _create_bid_indexes() -> None:
+    op.create_index(
+        "ix_bids_auction_id_amount",
+        "bids",
+        ["auction_id", sa.text("amount DESC"), sa.text("id DESC")],
+    )
+    op.create_index("ix_bids_bidder_id", "bids", ["bidder_id"])
+
+
+def upgrade() -> None:
+    op.create_table(
+        "bids_archive",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column(
+            "auction_id", sa.Integer(), sa.ForeignKey("auctions.id"), nullable=False
+        ),
+        sa.Column(
+            "bidder_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False
+        ),
+        sa.Column("amount", sa.Numeric(10, 2), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_bids_archive_auction_id_amount",
+        "bids_archive",
+        ["auction_id", sa.text("amount DESC"), sa.text("id DESC")],
+    )
+    op.create_index("ix_bids_archive_bidder_id", "bids_archive", ["bidder_id"])
+
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    # Rebuild bids as a table range-partitioned by created_at month. The
+    # partition key has to be part of the primary key.
+    op.drop_index("ix_bids_auction_id_amount", table_name="bids")
+    op.drop_index("ix_bids_bidder_id", table_name="bids")
+    op.execute("ALTER TABLE bids RENAME TO bids_unpartitioned")
+    op.execute(
+        "ALTER TABLE bids_unpartitioned RENAME CONSTRAINT bids_pkey "
+        "TO bids_unpartitioned_pkey"
+    )
+    op.execute(
+        "CREATE TABLE bids ("
+        "id integer NOT NULL DEFAULT nextval('bids_id_seq'), "
+        "auction_id integer NOT NULL REFERENCES auctions (id), "
+        "bidder_id integer NOT NULL REFERENCES users (id), "
+        "amount numeric(10, 2) NOT NULL, "
+        "created_at timestamp with time zone NOT NULL DEFAULT now(), "
+        "PRIMARY KEY (id, created_at)"
+        ") PARTITION BY RANGE (created_at)"
+    )
+    op.execute(CREATE_BID_PARTITIONS)
+    op.execute(
+        "SELECT create_bid_partitions("
+        "(coalesce((SELECT min(created_at) FROM bids_unpartitioned), now()) "
+        "AT TIME ZONE 'UTC')::date, "
+        "((now() + interval '3 months') AT TIME ZONE 'UTC')::date)"
+    )
+    # Safety net for rows outside every monthly partition; the maintenance
+    # command keeps future months created ahead so it stays empty.
+    op.execute("CREATE TABLE bids_default PARTITION OF bids DEFAULT")
+    op.execute(
+        "INSERT INTO bids (id, auction_id, bidder_id, amount, created_at) "
+        "SELECT id, auction_id, bidder_id, amount, created_at FROM bids_unpartitioned"
+    )
+    op.execute("ALTER SEQUENCE bids_id_seq OWNED BY bids.id")
+    op.drop_table("bids_unpartitioned")
+    _create_bid_indexes()
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_bids_auction_id_amount", table_name="bids")
+        op.drop_index("ix_bids_bidder_id", table_name="bids")
+        op.execute("ALTER TABLE bids RENAME TO bids_partitioned")
+        op.execute(
+            "ALTER TABLE bids_partitioned RENAME CONSTRAINT bids_pkey "
+            "TO bids_partitioned_pkey"
+        )
+        op.execute(
+            "CREATE TABLE bids ("
+            "id integer NOT NULL DEFAULT nextval('bids_id_seq') PRIMARY KEY, "
+            "auction_id integer NOT NULL REFERENCES auctions (id), "
+            "bidder_id integer NOT NULL REFERENCES users (id), "
+            "amount numeric(10, 2) NOT NULL, "
+            "created_at timestamp with time zone NOT NULL DEFAULT now()"
+            ")"
+        )
+        op.execute(
+            "INSERT INTO bids (id, auction_id, bidder_id, amount, created_at) "
+            "SELECT id, auction_id, bidder_id, amount, created_at FROM bids_partitioned"
+        )
+        op.execute("ALTER SEQUENCE bids_id_seq OWNED BY bids.id")
+        op.execute("DROP TABLE bids_partitioned CASCADE")
+        op.execute("DROP FUNCTION create_bid_partitions(date, date)")
+        _create_bid_indexes()
+
+    op.drop_index("ix_bids_archive_bidder_id", table_name="bids_archive")
+    op.drop_index("ix_bids_archive_auction_id_amount", table_name="bids_archive")
+    op.drop_table("bids_archive")
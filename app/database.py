@@ -1,11 +1,209 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import asyncio
+import itertools
+import logging
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import exc, make_url, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
+from app.cache import TTLCache
 from app.config import settings
+from app.metrics import DB_POOL_CHECKOUT_WAIT
+
+logger = logging.getLogger(__name__)
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+            DB_POOL_CHECKOUT_WAIT.observe(waited)
+
+
+def _engine_options(url: str) -> dict:
+    # In-memory SQLite needs its single-connection StaticPool
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": TimedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
 
-engine = create_async_engine(settings.DATABASE_URL, echo=False)
+engine = create_async_engine(
+    settings.DATABASE_URL, echo=False, **_engine_options(settings.DATABASE_URL)
+)
 async_session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+async def prefill_pool(bind: AsyncEngine = engine, size: int = settings.DB_POOL_SIZE) -> int:
+    """Open up to ``size`` pooled connections ahead of the first requests."""
+    pool = bind.pool
+    if not isinstance(pool, QueuePool):
+        return 0
+    size = min(size, pool.size())
+    # Hold every connection at once so the pool has to open distinct ones.
+    # Wait for all of them, even after a failure, so none is left checked out.
+    results = await asyncio.gather(
+        *(bind.connect().start() for _ in range(size)), return_exceptions=True
+    )
+    for result in results:
+        if not isinstance(result, BaseException):
+            await result.close()
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return size
+
+
+def pool_stats(bind: AsyncEngine = engine) -> dict:
+    pool = bind.pool
+    stats = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            timeout_seconds=pool.timeout(),
+        )
+    if isinstance(pool, TimedQueuePool):
+        stats.update(
+            checkouts=pool.checkouts,
+            timeouts=pool.timeouts,
+            wait_seconds_total=round(pool.wait_total, 6),
+            wait_seconds_max=round(pool.wait_max, 6),
+        )
+    return stats
+
+
+class ReplicaSet:
+    """Routes read-only sessions round-robin over healthy read replicas.
+
+    Replicas failing their periodic ``SELECT 1`` are skipped until they pass
+    again; with none configured or healthy, reads go to the primary. Users
+    who just wrote are pinned to the primary for ``read_your_writes``
+    seconds so they never read a replica that hasn't caught up yet; at most
+    ``max_writers`` users are tracked, least recent first out.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        primary: async_sessionmaker[AsyncSession] = async_session_factory,
+        check_interval: float = settings.DATABASE_REPLICA_CHECK_SECONDS,
+        read_your_writes: float = settings.READ_YOUR_WRITES_SECONDS,
+        max_writers: int = settings.REPLICA_STICKY_MAX_WRITERS,
+    ):
+        self.primary = primary
+        self.check_interval = check_interval
+        self.read_your_writes = read_your_writes
+        self.engines = [create_async_engine(url, **_engine_options(url)) for url in urls]
+        self.factories = [
+            async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+            for engine in self.engines
+        ]
+        self.healthy = [True] * len(self.engines)
+        self._recent_writers: TTLCache[int, bool] = TTLCache(
+            maxsize=max_writers, ttl=read_your_writes
+        )
+        self._turn = itertools.count()
+
+    def session_factory(self, user_id: int | None = None) -> async_sessionmaker[AsyncSession]:
+        factories = [
+            factory for factory, healthy in zip(self.factories, self.healthy) if healthy
+        ]
+        if not factories or self.pinned(user_id):
+            return self.primary
+        return factories[next(self._turn) % len(factories)]
+
+    def pinned(self, user_id: int | None) -> bool:
+        return user_id is not None and self._recent_writers.get(user_id) is not None
+
+    def mark_write(self, user_id: int) -> None:
+        if self.engines:
+            self._recent_writers.set(user_id, True)
+
+    async def _ping(self, index: int) -> None:
+        try:
+            async with self.engines[index].connect() as conn:
+                await asyncio.wait_for(
+                    conn.execute(text("SELECT 1")), timeout=self.check_interval
+                )
+        except Exception:
+            if self.healthy[index]:
+                logger.warning("Read replica %d is unavailable", index, exc_info=True)
+            self.healthy[index] = False
+        else:
+            if not self.healthy[index]:
+                logger.info("Read replica %d is available again", index)
+            self.healthy[index] = True
+
+    async def check(self) -> None:
+        await asyncio.gather(*(self._ping(index) for index in range(len(self.engines))))
+
+    async def run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self.check_interval)
+
+    async def close(self) -> None:
+        for engine in self.engines:
+            await engine.dispose()
+
+
+_replicas: ReplicaSet | None = None
+
+
+def get_replica_set() -> ReplicaSet:
+    global _replicas
+    if _replicas is None:
+        _replicas = ReplicaSet(settings.DATABASE_REPLICA_URLS)
+    return _replicas
+
+
+async def shutdown_replica_set() -> None:
+    global _replicas
+    if _replicas is not None:
+        await _replicas.close()
+        _replicas = None
+
+
 class Base(DeclarativeBase):
     pass
+
+
+# Python-side timestamps keep microsecond precision on every backend, which
+# keyset pagination on created_at relies on.
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
@@ -1,16 +1,17 @@
 from typing import AsyncGenerator
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.database import async_session_factory
+from app.database import ReplicaSet, async_session_factory, get_replica_set
 from app.exceptions import unauthorized
 from app.models.user import User
-from app.services.auth import decode_access_token, get_user_by_id
+from app.services.auth import decode_access_token, get_cached_user
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -18,6 +19,34 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+# For work that outlives the request's own session, e.g. streamed responses
+def get_read_session_factory(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials | None = Depends(optional_security),
+    replicas: ReplicaSet = Depends(get_replica_set),
+) -> async_sessionmaker[AsyncSession]:
+    if not replicas.engines:
+        return replicas.primary
+    # The reader's identity only matters for pinning recent writers to the primary
+    user_id = None
+    if credentials is not None:
+        user_id = decode_access_token(credentials.credentials)
+    session_factory = replicas.session_factory(user_id)
+    if replicas.pinned(user_id):
+        # A cached response may predate their write
+        request.state.skip_response_cache = True
+    elif session_factory is not replicas.primary:
+        request.state.max_staleness = replicas.read_your_writes
+    return session_factory
+
+
+async def get_read_db(
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_read_session_factory),
+) -> AsyncGenerator[AsyncSession, None]:
+    async with session_factory() as session:
+        yield session
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
@@ -25,7 +54,7 @@ async def get_current_user(
     user_id = decode_access_token(credentials.credentials)
     if user_id is None:
         raise unauthorized("Invalid or expired token")
-    user = await get_user_by_id(db, user_id)
+    user = await get_cached_user(db, user_id)
     if user is None:
         raise unauthorized("User not found")
     return user
@@ -1,23 +1,76 @@
 from app.config import settings
+from app.events.buffered import BufferedEventPublisher
+from app.events.composite import CompositeEventPublisher
+from app.events.hub import EventHub
 from app.events.interface import EventPublisher
 from app.events.noop import NoOpEventPublisher
 
 _publisher: EventPublisher | None = None
+_push_publisher: EventPublisher | None = None
+_buffered_publisher: BufferedEventPublisher | None = None
+_hub: EventHub | None = None
 
 
-def get_event_publisher() -> EventPublisher:
-    global _publisher
-    if _publisher is not None:
-        return _publisher
+def get_event_hub() -> EventHub:
+    global _hub
+    if _hub is None:
+        _hub = EventHub(settings.EVENT_STREAM_QUEUE_SIZE)
+    return _hub
+
+
+def get_push_publisher() -> EventPublisher:
+    global _push_publisher
+    if _push_publisher is not None:
+        return _push_publisher
 
     if settings.FIREBASE_CREDENTIALS_PATH and settings.FIREBASE_PROJECT_ID:
         from app.events.firebase import FirebaseEventPublisher
 
-        _publisher = FirebaseEventPublisher(
+        _push_publisher = FirebaseEventPublisher(
             settings.FIREBASE_CREDENTIALS_PATH,
             settings.FIREBASE_PROJECT_ID,
         )
     else:
-        _publisher = NoOpEventPublisher()
+        _push_publisher = NoOpEventPublisher()
+
+    return _push_publisher
+
+
+def get_buffered_publisher() -> BufferedEventPublisher | None:
+    return _buffered_publisher
+
 
+def get_event_publisher() -> EventPublisher:
+    global _publisher, _buffered_publisher
+    if _publisher is not None:
+        return _publisher
+
+    # Live streams are always fed in-process, whatever the push backend is
+    publishers: list[EventPublisher] = [get_event_hub()]
+    if not settings.EVENT_OUTBOX_ENABLED:
+        backend = get_push_publisher()
+        if settings.EVENT_BUFFER_ENABLED and not isinstance(backend, NoOpEventPublisher):
+            backend = BufferedEventPublisher(
+                backend,
+                batch_size=settings.EVENT_BUFFER_BATCH_SIZE,
+                linger_ms=settings.EVENT_BUFFER_LINGER_MS,
+                max_queue=settings.EVENT_BUFFER_MAX_SIZE,
+                overflow=settings.EVENT_BUFFER_OVERFLOW,
+            )
+            _buffered_publisher = backend
+        publishers.append(backend)
+    # Otherwise push delivery goes through the outbox relay
+
+    _publisher = CompositeEventPublisher(publishers)
     return _publisher
+
+
+async def shutdown_event_publisher() -> None:
+    global _publisher, _push_publisher, _buffered_publisher
+    if _publisher is not None:
+        await _publisher.close()
+        _publisher = None
+        _buffered_publisher = None
+    if _push_publisher is not None:
+        await _push_publisher.close()
+        _push_publisher = None
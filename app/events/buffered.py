@@ -0,0 +1,125 @@
+import asyncio
+import logging
+from collections.abc import Sequence
+from datetime import datetime
+from decimal import Decimal
+from typing import Literal
+
+from app.events.interface import AuctionEndedEvent, BidPlacedEvent, Event, EventPublisher
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedEventPublisher(EventPublisher):
+    """Queues events and forwards them to ``inner`` in batches.
+
+    Publishing returns as soon as the event is queued. A background task
+    sends up to ``batch_size`` events per ``inner.publish_batch`` call,
+    waiting at most ``linger_ms`` for a batch to fill. When the queue is
+    full, ``overflow="drop"`` discards the event and ``overflow="block"``
+    makes the caller wait for room.
+    """
+
+    def __init__(
+        self,
+        inner: EventPublisher,
+        batch_size: int = 100,
+        linger_ms: float = 50,
+        max_queue: int = 10000,
+        overflow: Literal["drop", "block"] = "drop",
+    ):
+        self.inner = inner
+        self.batch_size = batch_size
+        self.linger = linger_ms / 1000
+        self.overflow = overflow
+        self.dropped = 0
+        self._queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=max_queue)
+        self._task: asyncio.Task | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    async def _enqueue(self, event: Event) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        if self.overflow == "block":
+            await self._queue.put(event)
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(
+                "Event queue full, dropped %s for auction %s",
+                event.type,
+                event.auction_id,
+            )
+
+    async def _next_batch(self) -> list[Event]:
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.linger
+        while len(batch) < self.batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self.inner.publish_batch(batch)
+            except Exception:
+                logger.exception("Failed to publish %d events", len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def publish_bid_placed(
+        self,
+        auction_id: int,
+        bid_id: int,
+        bidder_id: int,
+        amount: Decimal,
+        new_end_time: datetime,
+        was_extended: bool,
+    ) -> None:
+        await self._enqueue(
+            BidPlacedEvent(auction_id, bid_id, bidder_id, amount, new_end_time, was_extended)
+        )
+
+    async def publish_auction_ended(
+        self,
+        auction_id: int,
+        winner_id: int | None,
+        final_price: Decimal | None,
+    ) -> None:
+        await self._enqueue(AuctionEndedEvent(auction_id, winner_id, final_price))
+
+    async def publish_batch(self, events: Sequence[Event]) -> None:
+        for event in events:
+            await self._enqueue(event)
+
+    async def flush(self) -> None:
+        if self._task is not None and not self._task.done():
+            await self._queue.join()
+
+    async def close(self) -> None:
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.inner.close()
@@ -0,0 +1,65 @@
+import logging
+from collections.abc import Sequence
+from datetime import datetime
+from decimal import Decimal
+
+from app.events.interface import Event, EventPublisher
+
+logger = logging.getLogger(__name__)
+
+
+class CompositeEventPublisher(EventPublisher):
+    # A failing publisher must not prevent the others from receiving events
+    def __init__(self, publishers: Sequence[EventPublisher]):
+        self.publishers = list(publishers)
+
+    async def publish_bid_placed(
+        self,
+        auction_id: int,
+        bid_id: int,
+        bidder_id: int,
+        amount: Decimal,
+        new_end_time: datetime,
+        was_extended: bool,
+    ) -> None:
+        for publisher in self.publishers:
+            try:
+                await publisher.publish_bid_placed(
+                    auction_id=auction_id,
+                    bid_id=bid_id,
+                    bidder_id=bidder_id,
+                    amount=amount,
+                    new_end_time=new_end_time,
+                    was_extended=was_extended,
+                )
+            except Exception:
+                logger.exception("%s failed to publish bid", type(publisher).__name__)
+
+    async def publish_auction_ended(
+        self,
+        auction_id: int,
+        winner_id: int | None,
+        final_price: Decimal | None,
+    ) -> None:
+        for publisher in self.publishers:
+            try:
+                await publisher.publish_auction_ended(
+                    auction_id=auction_id,
+                    winner_id=winner_id,
+                    final_price=final_price,
+                )
+            except Exception:
+                logger.exception(
+                    "%s failed to publish auction end", type(publisher).__name__
+                )
+
+    async def publish_batch(self, events: Sequence[Event]) -> None:
+        for publisher in self.publishers:
+            try:
+                await publisher.publish_batch(events)
+            except Exception:
+                logger.exception("%s failed to publish batch", type(publisher).__name__)
+
+    async def close(self) -> None:
+        for publisher in self.publishers:
+            await publisher.close()
@@ -1,11 +1,42 @@
 import asyncio
+import random
+import time
+from collections.abc import Sequence
 from datetime import datetime
 from decimal import Decimal
 
 import firebase_admin
 from firebase_admin import credentials, db as firebase_db
 
-from app.events.interface import EventPublisher
+from app.events.interface import AuctionEndedEvent, BidPlacedEvent, Event, EventPublisher
+
+PUSH_CHARS = "-0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz"
+
+
+class _PushKeyGenerator:
+    # Same layout as Firebase push ids (8 timestamp chars + 12 random chars), so
+    # keys written by a batched update sort chronologically with pushed ones.
+    def __init__(self):
+        self._last_ms = 0
+        self._last_random: list[int] = []
+
+    def __call__(self) -> str:
+        now = int(time.time() * 1000)
+        if now == self._last_ms:
+            for i in range(11, -1, -1):
+                if self._last_random[i] != 63:
+                    self._last_random[i] += 1
+                    break
+                self._last_random[i] = 0
+        else:
+            self._last_random = [random.randrange(64) for _ in range(12)]
+        self._last_ms = now
+
+        stamp = []
+        for _ in range(8):
+            stamp.append(PUSH_CHARS[now % 64])
+            now //= 64
+        return "".join(reversed(stamp)) + "".join(PUSH_CHARS[i] for i in self._last_random)
 
 
 class FirebaseEventPublisher(EventPublisher):
@@ -16,11 +47,15 @@ class FirebaseEventPublisher(EventPublisher):
                 cred,
                 {"databaseURL": f"https://{project_id}-default-rtdb.firebaseio.com"},
             )
+        self._push_key = _PushKeyGenerator()
 
     def _push_sync(self, path: str, data: dict) -> None:
         ref = firebase_db.reference(path)
         ref.push(data)
 
+    def _update_sync(self, updates: dict) -> None:
+        firebase_db.reference("/").update(updates)
+
     async def publish_bid_placed(
         self,
         auction_id: int,
@@ -30,14 +65,9 @@ class FirebaseEventPublisher(EventPublisher):
         new_end_time: datetime,
         was_extended: bool,
     ) -> None:
-        data = {
-            "type": "bid_placed",
-            "bid_id": bid_id,
-            "bidder_id": bidder_id,
-            "amount": str(amount),
-            "new_end_time": new_end_time.isoformat(),
-            "was_extended": was_extended,
-        }
+        data = BidPlacedEvent(
+            auction_id, bid_id, bidder_id, amount, new_end_time, was_extended
+        ).payload()
         await asyncio.to_thread(
             self._push_sync, f"/auctions/{auction_id}/events", data
         )
@@ -48,11 +78,17 @@ class FirebaseEventPublisher(EventPublisher):
         winner_id: int | None,
         final_price: Decimal | None,
     ) -> None:
-        data = {
-            "type": "auction_ended",
-            "winner_id": winner_id,
-            "final_price": str(final_price) if final_price else None,
-        }
+        data = AuctionEndedEvent(auction_id, winner_id, final_price).payload()
         await asyncio.to_thread(
             self._push_sync, f"/auctions/{auction_id}/events", data
         )
+
+    async def publish_batch(self, events: Sequence[Event]) -> None:
+        if not events:
+            return
+        # One multi-path update instead of one push per event
+        updates = {
+            f"auctions/{event.auction_id}/events/{self._push_key()}": event.payload()
+            for event in events
+        }
+        await asyncio.to_thread(self._update_sync, updates)
@@ -0,0 +1,105 @@
+import asyncio
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from decimal import Decimal
+
+from app.events.interface import AuctionEndedEvent, BidPlacedEvent, Event, EventPublisher
+
+
+class Subscription:
+    def __init__(self, auction_id: int, queue_size: int):
+        self.auction_id = auction_id
+        self.queue_size = queue_size
+        # The bound is enforced by offer() so the end-of-stream marker always fits
+        self._queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+
+    def offer(self, frame: bytes) -> bool:
+        if self._queue.qsize() >= self.queue_size:
+            return False
+        self._queue.put_nowait(frame)
+        return True
+
+    def close(self, discard_pending: bool = False) -> None:
+        if discard_pending:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+    async def get(self) -> bytes | None:
+        return await self._queue.get()
+
+
+class EventHub(EventPublisher):
+    """In-process fan-out of auction events to Server-Sent Events streams.
+
+    Each event is serialized once into an SSE frame shared by every
+    subscriber. Subscribers have bounded queues; one that falls behind is
+    dropped (its stream ends) instead of slowing down the publisher.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subscribers: dict[int, set[Subscription]] = {}
+
+    def subscribe(self, auction_id: int) -> Subscription:
+        subscription = Subscription(auction_id, self.queue_size)
+        self._subscribers.setdefault(auction_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._subscribers.get(subscription.auction_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.auction_id]
+
+    def subscriber_count(self, auction_id: int | None = None) -> int:
+        if auction_id is None:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+        return len(self._subscribers.get(auction_id, ()))
+
+    def broadcast(self, event: Event) -> None:
+        subscribers = self._subscribers.get(event.auction_id)
+        if not subscribers:
+            return
+
+        data = json.dumps({"auction_id": event.auction_id, **event.payload()})
+        frame = f"event: {event.type}\ndata: {data}\n\n".encode()
+        for subscription in list(subscribers):
+            if not subscription.offer(frame):
+                # Slow consumer: end its stream rather than buffer without bound
+                self.unsubscribe(subscription)
+                subscription.close(discard_pending=True)
+
+        # Nothing follows the end of an auction
+        if isinstance(event, AuctionEndedEvent):
+            for subscription in list(subscribers):
+                self.unsubscribe(subscription)
+                subscription.close()
+
+    async def publish_bid_placed(
+        self,
+        auction_id: int,
+        bid_id: int,
+        bidder_id: int,
+        amount: Decimal,
+        new_end_time: datetime,
+        was_extended: bool,
+    ) -> None:
+        self.broadcast(
+            BidPlacedEvent(auction_id, bid_id, bidder_id, amount, new_end_time, was_extended)
+        )
+
+    async def publish_auction_ended(
+        self,
+        auction_id: int,
+        winner_id: int | None,
+        final_price: Decimal | None,
+    ) -> None:
+        self.broadcast(AuctionEndedEvent(auction_id, winner_id, final_price))
+
+    async def publish_batch(self, events: Sequence[Event]) -> None:
+        for event in events:
+            self.broadcast(event)
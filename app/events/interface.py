@@ -1,8 +1,51 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
 from decimal import Decimal
 from datetime import datetime
 
 
+@dataclass(frozen=True)
+class BidPlacedEvent:
+    auction_id: int
+    bid_id: int
+    bidder_id: int
+    amount: Decimal
+    new_end_time: datetime
+    was_extended: bool
+
+    type = "bid_placed"
+
+    def payload(self) -> dict:
+        return {
+            "type": self.type,
+            "bid_id": self.bid_id,
+            "bidder_id": self.bidder_id,
+            "amount": str(self.amount),
+            "new_end_time": self.new_end_time.isoformat(),
+            "was_extended": self.was_extended,
+        }
+
+
+@dataclass(frozen=True)
+class AuctionEndedEvent:
+    auction_id: int
+    winner_id: int | None
+    final_price: Decimal | None
+
+    type = "auction_ended"
+
+    def payload(self) -> dict:
+        return {
+            "type": self.type,
+            "winner_id": self.winner_id,
+            "final_price": str(self.final_price) if self.final_price else None,
+        }
+
+
+Event = BidPlacedEvent | AuctionEndedEvent
+
+
 class EventPublisher(ABC):
     @abstractmethod
     async def publish_bid_placed(
@@ -22,3 +65,25 @@ class EventPublisher(ABC):
         winner_id: int | None,
         final_price: Decimal | None,
     ) -> None: ...
+
+    # Publishers with a cheaper multi-event write path should override this.
+    async def publish_batch(self, events: Sequence[Event]) -> None:
+        for event in events:
+            if isinstance(event, BidPlacedEvent):
+                await self.publish_bid_placed(
+                    auction_id=event.auction_id,
+                    bid_id=event.bid_id,
+                    bidder_id=event.bidder_id,
+                    amount=event.amount,
+                    new_end_time=event.new_end_time,
+                    was_extended=event.was_extended,
+                )
+            else:
+                await self.publish_auction_ended(
+                    auction_id=event.auction_id,
+                    winner_id=event.winner_id,
+                    final_price=event.final_price,
+                )
+
+    async def close(self) -> None:
+        pass
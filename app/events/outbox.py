@@ -0,0 +1,203 @@
+import asyncio
+import logging
+import types
+from collections.abc import Sequence
+from dataclasses import fields
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from sqlalchemy import delete, event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import async_session_factory
+from app.events.interface import AuctionEndedEvent, BidPlacedEvent, Event, EventPublisher
+from app.models.outbox import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+EVENT_TYPES = {cls.type: cls for cls in (BidPlacedEvent, AuctionEndedEvent)}
+
+_STAGED_KEY = "outbox_staged"
+
+
+def _field_type(annotation) -> type:
+    if isinstance(annotation, types.UnionType):
+        return next(arg for arg in annotation.__args__ if arg is not type(None))
+    return annotation
+
+
+def serialize_event(event: Event) -> dict:
+    data = {}
+    for field in fields(event):
+        value = getattr(event, field.name)
+        if isinstance(value, Decimal):
+            value = str(value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        data[field.name] = value
+    return data
+
+
+def deserialize_event(event_type: str, data: dict) -> Event:
+    cls = EVENT_TYPES[event_type]
+    kwargs = {}
+    for field in fields(cls):
+        value = data[field.name]
+        field_type = _field_type(field.type)
+        if value is not None and field_type is Decimal:
+            value = Decimal(value)
+        elif value is not None and field_type is datetime:
+            value = datetime.fromisoformat(value)
+        kwargs[field.name] = value
+    return cls(**kwargs)
+
+
+def stage_events(db: AsyncSession, events: Sequence[Event]) -> None:
+    # Outbox rows commit (or roll back) together with the change they describe
+    if not settings.EVENT_OUTBOX_ENABLED or not events:
+        return
+    db.add_all(
+        OutboxEvent(
+            event_type=e.type,
+            auction_id=e.auction_id,
+            payload=serialize_event(e),
+        )
+        for e in events
+    )
+    db.info[_STAGED_KEY] = True
+
+
+class OutboxRelay:
+    """Delivers committed outbox rows to the push publisher.
+
+    Rows are read in id order in batches of ``batch_size`` and marked
+    delivered once ``publisher.publish_batch`` succeeds, so delivery is
+    at-least-once. Run a single relay when strict ordering matters: several
+    relays split the backlog between them with ``SKIP LOCKED``.
+    """
+
+    def __init__(
+        self,
+        publisher: EventPublisher,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+        batch_size: int = settings.EVENT_OUTBOX_BATCH_SIZE,
+        poll_interval: float = settings.EVENT_OUTBOX_POLL_SECONDS,
+        retention: timedelta = timedelta(hours=settings.EVENT_OUTBOX_RETENTION_HOURS),
+    ):
+        self.publisher = publisher
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self._wakeup = asyncio.Event()
+
+    def notify(self) -> None:
+        self._wakeup.set()
+
+    async def drain_once(self) -> int:
+        async with self.session_factory() as db:
+            result = await db.scalars(
+                select(OutboxEvent)
+                .where(OutboxEvent.delivered_at.is_(None))
+                .order_by(OutboxEvent.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            rows = result.all()
+            if not rows:
+                return 0
+
+            try:
+                await self.publisher.publish_batch(
+                    [deserialize_event(row.event_type, row.payload) for row in rows]
+                )
+            except Exception as exc:
+                for row in rows:
+                    row.attempts += 1
+                    row.last_error = repr(exc)
+                await db.commit()
+                raise
+
+            now = datetime.now(timezone.utc)
+            for row in rows:
+                row.attempts += 1
+                row.delivered_at = now
+                row.last_error = None
+            await db.commit()
+            return len(rows)
+
+    async def purge_delivered(self) -> None:
+        async with self.session_factory() as db:
+            await db.execute(
+                delete(OutboxEvent).where(
+                    OutboxEvent.delivered_at < datetime.now(timezone.utc) - self.retention
+                )
+            )
+            await db.commit()
+
+    async def run(self) -> None:
+        failures = 0
+        next_purge = 0.0
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wakeup.clear()
+            try:
+                delivered = await self.drain_once()
+                failures = 0
+            except Exception:
+                logger.exception("Failed to relay outbox events")
+                failures += 1
+                await asyncio.sleep(min(self.poll_interval * 2**failures, 60))
+                continue
+            if delivered == self.batch_size:
+                continue
+
+            if loop.time() >= next_purge:
+                try:
+                    await self.purge_delivered()
+                except Exception:
+                    logger.exception("Failed to purge delivered outbox events")
+                next_purge = loop.time() + 3600
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+_relay: OutboxRelay | None = None
+
+
+def get_outbox_relay() -> OutboxRelay:
+    global _relay
+    if _relay is None:
+        from app.events import get_push_publisher
+
+        _relay = OutboxRelay(get_push_publisher())
+    return _relay
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_relay(session: Session) -> None:
+    # Only wakes a relay running in this process; a separate worker polls
+    if session.info.pop(_STAGED_KEY, False) and _relay is not None:
+        _relay.notify()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_staged(session: Session) -> None:
+    session.info.pop(_STAGED_KEY, None)
+
+
+async def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    relay = get_outbox_relay()
+    try:
+        await relay.run()
+    finally:
+        await relay.publisher.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -23,3 +23,7 @@ def unauthorized(detail: str = "Not authenticated") -> HTTPException:
 
 def conflict(detail: str = "Conflict") -> HTTPException:
     return HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
+
+
+def service_unavailable(detail: str = "Service unavailable") -> HTTPException:
+    return HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail)
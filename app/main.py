@@ -1,95 +1,85 @@
 import asyncio
 import logging
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
 
-from fastapi import FastAPI
-from sqlalchemy import select
-
-from app.database import async_session_factory
-from app.models.auction import Auction, AuctionStatus
-from app.models.bid import Bid
-from app.events import get_event_publisher
-from app.routers import auth, auctions, items
+from fastapi import FastAPI, Response
+
+from app import metrics
+from app.config import settings
+from app.database import (
+    get_replica_set,
+    pool_stats,
+    prefill_pool,
+    shutdown_replica_set,
+)
+from app.events import get_buffered_publisher, get_event_hub, shutdown_event_publisher
+from app.events.outbox import get_outbox_relay
+from app.routers import auth, auctions, export, items
+from app.services.auth import user_cache
+from app.services.bid_engine import shutdown_bid_engine
+from app.services.lifecycle import get_scheduler
+from app.services.password import get_password_hasher, shutdown_password_hasher
 
 logger = logging.getLogger(__name__)
 
 
-async def auction_lifecycle_loop():
-    while True:
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.DB_POOL_PREFILL:
         try:
-            await process_auction_transitions()
+            await prefill_pool()
         except Exception:
-            logger.exception("Error in auction lifecycle loop")
-        await asyncio.sleep(30)
-
-
-async def process_auction_transitions():
-    async with async_session_factory() as db:
-        now = datetime.now(timezone.utc)
-        publisher = get_event_publisher()
-
-        # Activate pending auctions whose start_time has passed
-        result = await db.execute(
-            select(Auction)
-            .where(
-                Auction.status == AuctionStatus.PENDING,
-                Auction.start_time <= now,
-            )
-            .with_for_update(skip_locked=True)
-        )
-        for auction in result.scalars().all():
-            auction.status = AuctionStatus.ACTIVE
-
-        # Resolve active auctions whose end_time has passed
-        result = await db.execute(
-            select(Auction)
-            .where(
-                Auction.status == AuctionStatus.ACTIVE,
-                Auction.end_time <= now,
-            )
-            .with_for_update(skip_locked=True)
-        )
-        for auction in result.scalars().all():
-            bid_result = await db.execute(
-                select(Bid)
-                .where(Bid.auction_id == auction.id)
-                .order_by(Bid.amount.desc())
-                .limit(1)
-            )
-            winning_bid = bid_result.scalar_one_or_none()
-            auction.status = AuctionStatus.ENDED
-            if winning_bid:
-                auction.winner_id = winning_bid.bidder_id
-                auction.current_highest_bid = winning_bid.amount
+            logger.warning("Could not prefill the database pool", exc_info=True)
+    tasks = [asyncio.create_task(get_scheduler().run())]
+    if get_replica_set().engines:
+        tasks.append(asyncio.create_task(get_replica_set().run()))
+    if settings.EVENT_OUTBOX_ENABLED and settings.EVENT_OUTBOX_RELAY_IN_PROCESS:
+        tasks.append(asyncio.create_task(get_outbox_relay().run()))
+    yield
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    await shutdown_bid_engine()
+    await shutdown_event_publisher()
+    shutdown_password_hasher()
+    await shutdown_replica_set()
 
-            await db.commit()
 
-            await publisher.publish_auction_ended(
-                auction_id=auction.id,
-                winner_id=auction.winner_id,
-                final_price=auction.current_highest_bid,
-            )
+app = FastAPI(title="Second-Hand Clothes Auction API", lifespan=lifespan)
 
-        await db.commit()
+app.add_middleware(metrics.MetricsMiddleware)
 
+if settings.METRICS_ENABLED:
+    metrics.EVENT_BUFFER_QUEUE_DEPTH.callback = lambda: (
+        buffered.queue_depth if (buffered := get_buffered_publisher()) else None
+    )
+    metrics.EVENT_BUFFER_DROPPED.callback = lambda: (
+        buffered.dropped if (buffered := get_buffered_publisher()) else None
+    )
+    metrics.EVENT_STREAM_SUBSCRIBERS.callback = lambda: get_event_hub().subscriber_count()
+    metrics.USER_CACHE_HITS.callback = lambda: user_cache.hits
+    metrics.USER_CACHE_MISSES.callback = lambda: user_cache.misses
+    metrics.USER_CACHE_SIZE.callback = lambda: len(user_cache)
+    metrics.PASSWORD_HASH_PENDING.callback = lambda: get_password_hasher().pending
+    metrics.PASSWORD_HASH_REJECTED.callback = lambda: get_password_hasher().rejected
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    task = asyncio.create_task(auction_lifecycle_loop())
-    yield
-    task.cancel()
-    try:
-        await task
-    except asyncio.CancelledError:
-        pass
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics_endpoint():
+        return Response(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
 
+    @app.get("/internal/db-pool", include_in_schema=False)
+    async def db_pool():
+        return pool_stats()
 
-app = FastAPI(title="Second-Hand Clothes Auction API", lifespan=lifespan)
 
 app.include_router(auth.router)
 app.include_router(items.router)
 app.include_router(auctions.router)
+app.include_router(export.router)
 
 
 @app.get("/health")
@@ -0,0 +1,373 @@
+import logging
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Everything here is updated from the event loop thread, so plain ints and
+# floats are enough: no locks on the hot path.
+
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+COUNT_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric:
+    type = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        registry: "Registry | None" = None,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = labels
+        (REGISTRY if registry is None else registry).register(self)
+
+    def samples(self) -> list[str]:
+        raise NotImplementedError
+
+    def render(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+            *self.samples(),
+        ]
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1, labels: tuple = ()) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels: tuple = ()) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self) -> list[str]:
+        return [
+            f"{self.name}{_labels(self.label_names, labels)} {value}"
+            for labels, value in self._values.items()
+        ]
+
+
+class Gauge(Metric):
+    """A value read when metrics are collected, e.g. a queue depth."""
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], float | None] | None = None,
+        registry: "Registry | None" = None,
+    ):
+        super().__init__(name, documentation, registry=registry)
+        self.callback = callback
+
+    def samples(self) -> list[str]:
+        value = self.callback() if self.callback is not None else None
+        return [] if value is None else [f"{self.name} {value}"]
+
+
+class CallbackCounter(Gauge):
+    """A counter maintained elsewhere and read when metrics are collected."""
+
+    type = "counter"
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        registry: "Registry | None" = None,
+    ):
+        super().__init__(name, documentation, labels, registry)
+        self.buckets = buckets
+        # labels -> [per-bucket counts (last one is +Inf), sum]
+        self._series: dict[tuple, list] = {}
+
+    def observe(self, value: float, labels: tuple = ()) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def count(self, labels: tuple = ()) -> int:
+        series = self._series.get(labels)
+        return sum(series[0]) if series else 0
+
+    def sum(self, labels: tuple = ()) -> float:
+        series = self._series.get(labels)
+        return series[1] if series else 0.0
+
+    def samples(self) -> list[str]:
+        lines = []
+        for labels, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                le = _labels(self.label_names, labels, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            suffix = _labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{suffix} {total}")
+            lines.append(f"{self.name}_count{suffix} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests handled", ("method", "route", "status")
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("method", "route")
+)
+HTTP_REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "SQL statements executed per HTTP request",
+    ("route",),
+    buckets=COUNT_BUCKETS,
+)
+HTTP_REQUEST_DB_DURATION = Histogram(
+    "http_request_db_seconds", "Time spent in SQL per HTTP request", ("route",)
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds", "SQL statement execution time", ("statement",)
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds", "Time waiting for a pooled connection"
+)
+BID_LOCK_WAIT = Histogram(
+    "bid_lock_wait_seconds", "Time to lock the auction row when placing a bid"
+)
+LIFECYCLE_RUN_DURATION = Histogram(
+    "lifecycle_run_duration_seconds",
+    "Duration of auction lifecycle passes",
+    ("kind",),
+)
+LIFECYCLE_LAG = Histogram(
+    "lifecycle_lag_seconds", "Delay between an auction deadline and its transition"
+)
+EVENT_BUFFER_QUEUE_DEPTH = Gauge(
+    "event_buffer_queue_depth", "Events waiting in the push publisher buffer"
+)
+EVENT_BUFFER_DROPPED = CallbackCounter(
+    "event_buffer_dropped_total", "Events dropped because the push buffer was full"
+)
+EVENT_STREAM_SUBSCRIBERS = Gauge(
+    "event_stream_subscribers", "Open live auction streams"
+)
+USER_CACHE_HITS = CallbackCounter(
+    "user_cache_hits_total", "Authenticated requests served from the user cache"
+)
+USER_CACHE_MISSES = CallbackCounter(
+    "user_cache_misses_total", "Authenticated requests that loaded the user"
+)
+USER_CACHE_SIZE = Gauge("user_cache_size", "Users held in the user cache")
+PASSWORD_HASH_QUEUE_WAIT = Histogram(
+    "password_hash_queue_wait_seconds", "Time a password hash waits for a worker"
+)
+PASSWORD_HASH_PENDING = Gauge(
+    "password_hash_pending", "Password hashes queued or running"
+)
+PASSWORD_HASH_REJECTED = CallbackCounter(
+    "password_hash_rejected_total", "Password hashes rejected because the pool was full"
+)
+
+
+@dataclass
+class QueryStats:
+    """SQL statements executed within a request or a ``track_queries`` block.
+
+    Statements are counted by their SQL text, so the same query issued with
+    different parameters (the N+1 pattern) shows up as a repeat.
+    """
+
+    queries: int = 0
+    duration: float = 0.0
+    statements: dict[str, int] = field(default_factory=dict)
+    parent: "QueryStats | None" = None
+
+    def record(self, statement: str, elapsed: float, bulk: bool = False) -> None:
+        self.queries += 1
+        self.duration += elapsed
+        # Batches of one bulk write (executemany, insertmanyvalues) repeat by
+        # design, so they are not counted as repeats
+        if not bulk:
+            self.statements[statement] = self.statements.get(statement, 0) + 1
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        return {
+            statement: count
+            for statement, count in self.statements.items()
+            if count >= threshold
+        }
+
+    def assert_max_queries(self, expected: int) -> None:
+        if self.queries > expected:
+            raise AssertionError(
+                f"Expected at most {expected} queries, got {self.queries}:\n"
+                + self._describe(self.statements)
+            )
+
+    def assert_no_repeats(self, threshold: int = 2) -> None:
+        repeated = self.repeated(threshold)
+        if repeated:
+            raise AssertionError(
+                "Statements repeated (possible N+1):\n" + self._describe(repeated)
+            )
+
+    @staticmethod
+    def _describe(statements: dict[str, int]) -> str:
+        return "\n".join(
+            f"  {count} x {' '.join(statement.split())}"
+            for statement, count in statements.items()
+        )
+
+
+# Statements executed on behalf of the current request
+query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    # For tests: also sees the queries of requests made inside the block
+    stats = QueryStats(parent=query_stats.get())
+    token = query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        query_stats.reset(token)
+
+
+_STATEMENT_KINDS = {"SELECT", "INSERT", "UPDATE", "DELETE"}
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._metrics_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._metrics_started
+    kind = statement.lstrip()[:6].upper()
+    DB_QUERY_DURATION.observe(elapsed, (kind if kind in _STATEMENT_KINDS else "OTHER",))
+    stats = query_stats.get()
+    while stats is not None:
+        stats.record(statement, elapsed, bulk=executemany)
+        stats = stats.parent
+
+
+class MetricsMiddleware:
+    """Records latency and SQL usage of every HTTP request, per route template.
+
+    Requests issuing the same statement ``QUERY_REPEAT_THRESHOLD`` times or
+    more are logged as possible N+1 queries. With ``DEBUG`` on, responses
+    carry the request's SQL statement count and time as headers.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        stats = QueryStats(parent=query_stats.get())
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if settings.DEBUG:
+                    message = {
+                        **message,
+                        "headers": [
+                            *message.get("headers", []),
+                            (b"x-db-query-count", str(stats.queries).encode()),
+                            (b"x-db-query-ms", f"{stats.duration * 1000:.2f}".encode()),
+                        ],
+                    }
+            await send(message)
+
+        token = query_stats.set(stats)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            query_stats.reset(token)
+            # Path templates keep the label set bounded
+            route = getattr(scope.get("route"), "path", "unmatched")
+            method = scope["method"]
+            if settings.METRICS_ENABLED:
+                HTTP_REQUESTS.inc(labels=(method, route, status))
+                HTTP_REQUEST_DURATION.observe(elapsed, (method, route))
+                HTTP_REQUEST_DB_QUERIES.observe(stats.queries, (route,))
+                HTTP_REQUEST_DB_DURATION.observe(stats.duration, (route,))
+            threshold = settings.QUERY_REPEAT_THRESHOLD
+            if threshold:
+                for statement, count in stats.repeated(threshold).items():
+                    logger.warning(
+                        "Possible N+1 in %s %s: statement ran %d times: %s",
+                        method,
+                        route,
+                        count,
+                        " ".join(statement.split())[:200],
+                    )
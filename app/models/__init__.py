@@ -1,7 +1,8 @@
 from app.models.user import User
 from app.models.item import ClothingSize, ItemCategory, ItemCondition, Item
 from app.models.auction import AuctionStatus, Auction
-from app.models.bid import Bid
+from app.models.bid import ArchivedBid, Bid
+from app.models.outbox import OutboxEvent
 
 __all__ = [
     "User",
@@ -12,4 +13,6 @@ __all__ = [
     "AuctionStatus",
     "Auction",
     "Bid",
+    "ArchivedBid",
+    "OutboxEvent",
 ]
@@ -2,10 +2,10 @@ import enum
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Numeric, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Numeric, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, utcnow
 
 
 class AuctionStatus(str, enum.Enum):
@@ -15,11 +15,35 @@ class AuctionStatus(str, enum.Enum):
     CANCELLED = "cancelled"
 
 
+# Statuses are persisted by enum name
+OPEN_STATUSES_SQL = "status IN ('PENDING', 'ACTIVE')"
+
+
 class Auction(Base):
     __tablename__ = "auctions"
+    __table_args__ = (
+        # One open (pending/active) auction per item; ended or cancelled
+        # auctions don't block re-listing
+        Index(
+            "uq_auctions_item_id_open",
+            "item_id",
+            unique=True,
+            postgresql_where=text(OPEN_STATUSES_SQL),
+            sqlite_where=text(OPEN_STATUSES_SQL),
+        ),
+        Index("ix_auctions_status_start_time", "status", "start_time"),
+        Index("ix_auctions_status_end_time", "status", "end_time"),
+        Index(
+            "ix_auctions_status_created_at",
+            "status",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index("ix_auctions_created_at", text("created_at DESC"), text("id DESC")),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    item_id: Mapped[int] = mapped_column(ForeignKey("items.id"), unique=True)
+    item_id: Mapped[int] = mapped_column(ForeignKey("items.id"), index=True)
     seller_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
     start_price: Mapped[Decimal] = mapped_column(Numeric(10, 2))
     current_highest_bid: Mapped[Decimal | None] = mapped_column(
@@ -29,11 +53,19 @@ class Auction(Base):
     end_time: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     original_end_time: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     status: Mapped[AuctionStatus] = mapped_column(
-        Enum(AuctionStatus, native_enum=False), index=True, default=AuctionStatus.PENDING
+        Enum(AuctionStatus, native_enum=False), default=AuctionStatus.PENDING
     )
     winner_id: Mapped[int | None] = mapped_column(
         ForeignKey("users.id"), nullable=True
     )
+    # Kept up to date by every bid write path, so readers never count bids
+    bid_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    last_bid_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    leading_bidder_id: Mapped[int | None] = mapped_column(
+        ForeignKey("users.id"), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), default=utcnow, server_default=func.now()
     )
@@ -1,19 +1,51 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import DateTime, ForeignKey, Numeric, func
+from sqlalchemy import DateTime, ForeignKey, Index, Numeric, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, utcnow
 
 
+# On PostgreSQL the bids table is range-partitioned by created_at month (see
+# the bid_partitions migration), with primary key (id, created_at).
 class Bid(Base):
     __tablename__ = "bids"
+    __table_args__ = (
+        # Top bid per auction and bid history keyset pagination
+        Index(
+            "ix_bids_auction_id_amount",
+            "auction_id",
+            text("amount DESC"),
+            text("id DESC"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    auction_id: Mapped[int] = mapped_column(ForeignKey("auctions.id"), index=True)
+    auction_id: Mapped[int] = mapped_column(ForeignKey("auctions.id"))
     bidder_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
     amount: Mapped[Decimal] = mapped_column(Numeric(10, 2))
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), default=utcnow, server_default=func.now()
+    )
+
+
+# Bids of auctions that closed long ago, moved out of the hot bids table by
+# ``python -m app.services.archive``. Same columns, so the two tables can be
+# read back together with UNION ALL.
+class ArchivedBid(Base):
+    __tablename__ = "bids_archive"
+    __table_args__ = (
+        Index(
+            "ix_bids_archive_auction_id_amount",
+            "auction_id",
+            text("amount DESC"),
+            text("id DESC"),
+        ),
     )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    auction_id: Mapped[int] = mapped_column(ForeignKey("auctions.id"))
+    bidder_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
+    amount: Mapped[Decimal] = mapped_column(Numeric(10, 2))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
@@ -1,10 +1,22 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, Enum, ForeignKey, String, Text, func
+from sqlalchemy import (
+    DDL,
+    JSON,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    event,
+    func,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, utcnow
 
 
 class ClothingSize(str, enum.Enum):
@@ -36,6 +48,17 @@ class ItemCategory(str, enum.Enum):
 
 class Item(Base):
     __tablename__ = "items"
+    __table_args__ = (
+        Index(
+            "ix_items_category_size_condition_created_at",
+            "category",
+            "size",
+            "condition",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index("ix_items_created_at", text("created_at DESC"), text("id DESC")),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     seller_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
@@ -52,8 +75,56 @@ class Item(Base):
         JSON, default=list
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), default=utcnow, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+
+
+# Full-text search. On Postgres items carry a weighted tsvector in a stored
+# generated column with a GIN index; on SQLite they are mirrored into an FTS5
+# table kept in sync by triggers. Both are created outside the mapped columns
+# and queried by app.services.item.search_items.
+ITEM_SEARCH_CONFIG = "english"
+ITEM_SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{ITEM_SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{ITEM_SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+)
+
+POSTGRES_SEARCH_DDL = [
+    "ALTER TABLE items ADD COLUMN search_vector tsvector "
+    f"GENERATED ALWAYS AS ({ITEM_SEARCH_VECTOR_SQL}) STORED",
+    "CREATE INDEX ix_items_search_vector ON items USING gin (search_vector)",
+]
+
+SQLITE_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE items_fts USING fts5("
+    "title, description, content='items', content_rowid='id', "
+    "tokenize='porter unicode61')",
+    "CREATE TRIGGER items_fts_ai AFTER INSERT ON items BEGIN "
+    "INSERT INTO items_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER items_fts_ad AFTER DELETE ON items BEGIN "
+    "INSERT INTO items_fts(items_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER items_fts_au AFTER UPDATE OF title, description ON items BEGIN "
+    "INSERT INTO items_fts(items_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO items_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+]
+
+for statement in POSTGRES_SEARCH_DDL:
+    event.listen(
+        Item.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql")
+    )
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(
+        Item.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite")
+    )
+event.listen(
+    Item.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS items_fts").execute_if(dialect="sqlite"),
+)
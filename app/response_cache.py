@@ -0,0 +1,151 @@
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from fastapi import Request, Response
+
+from app.cache import TTLCache
+from app.config import settings
+
+# Number of version counters tags are hashed onto. Collisions only make the
+# cache skip a store it could have kept.
+TAG_VERSION_SLOTS = 4096
+
+
+def auction_tag(auction_id: int) -> str:
+    return f"auction:{auction_id}"
+
+
+def item_tag(item_id: int) -> str:
+    return f"item:{item_id}"
+
+
+AUCTIONS_TAG = "auctions"
+ITEMS_TAG = "items"
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses the weak comparison
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return any(tag in ("*", etag) for tag in candidates)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+    headers: dict[str, str]
+    tags: tuple[str, ...]
+
+
+class ResponseCache:
+    """In-memory cache of rendered JSON responses for public GET endpoints.
+
+    Entries are keyed by path and query string and tagged with the rows they
+    were built from; writers call ``invalidate`` with those tags once their
+    transaction has committed. A read snapshots its tags' versions before
+    querying and its response is only stored if none of them changed since,
+    so a read racing a write never caches the pre-write state. Responses read
+    from a lagging replica expire after ``request.state.max_staleness``
+    seconds, and ``request.state.skip_response_cache`` sends readers who just
+    wrote past the cache. Every
+    response carries a strong ETag and honours ``If-None-Match``.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = settings.RESPONSE_CACHE_MAX_SIZE,
+        ttl: float = settings.RESPONSE_CACHE_TTL_SECONDS,
+        enabled: bool = settings.RESPONSE_CACHE_ENABLED,
+    ):
+        self.enabled = enabled
+        self._entries: TTLCache[str, CachedResponse] = TTLCache(maxsize, ttl)
+        self._keys_by_tag: dict[str, set[str]] = {}
+        self._versions = [0] * TAG_VERSION_SLOTS
+
+    @property
+    def hits(self) -> int:
+        return self._entries.hits
+
+    @property
+    def misses(self) -> int:
+        return self._entries.misses
+
+    @staticmethod
+    def _key(request: Request) -> str:
+        query = sorted(request.query_params.multi_items())
+        return f"{request.url.path}?{query}"
+
+    def _slot(self, tag: str) -> int:
+        return hash(tag) % TAG_VERSION_SLOTS
+
+    def version(self, tags: Iterable[str]) -> tuple[int, ...]:
+        return tuple(self._versions[self._slot(tag)] for tag in tags)
+
+    def lookup(self, request: Request) -> Response | None:
+        if not self.enabled or getattr(request.state, "skip_response_cache", False):
+            return None
+        entry = self._entries.get(self._key(request))
+        if entry is None:
+            return None
+        return self._respond(request, entry)
+
+    def store(
+        self,
+        request: Request,
+        body: bytes,
+        tags: Iterable[str],
+        version: tuple[int, ...],
+        headers: dict[str, str] | None = None,
+        ttl: float | None = None,
+    ) -> Response:
+        tags = tuple(tags)
+        # Replica rows can predate the version snapshot
+        max_staleness = getattr(request.state, "max_staleness", None)
+        if max_staleness is not None:
+            ttl = max_staleness if ttl is None else min(ttl, max_staleness)
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        entry = CachedResponse(body, etag, headers or {}, tags)
+        if self.enabled and self.version(tags) == version and (ttl is None or ttl > 0):
+            key = self._key(request)
+            self._entries.set(key, entry, ttl)
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+            if len(self._keys_by_tag) > 2 * self._entries.maxsize:
+                self._prune()
+        return self._respond(request, entry)
+
+    def invalidate(self, *tags: str) -> None:
+        for tag in tags:
+            self._versions[self._slot(tag)] += 1
+            for key in self._keys_by_tag.pop(tag, ()):
+                self._entries.invalidate(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_tag.clear()
+
+    def _prune(self) -> None:
+        # Drop index entries left behind by evicted or expired responses
+        self._keys_by_tag = {}
+        for key, entry in self._entries.items():
+            for tag in entry.tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+
+    @staticmethod
+    def _respond(request: Request, entry: CachedResponse) -> Response:
+        headers = {"ETag": entry.etag, "Cache-Control": "no-cache", **entry.headers}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None and _etag_matches(if_none_match, entry.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(entry.body, media_type="application/json", headers=headers)
+
+
+_response_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
@@ -1,16 +1,34 @@
-from fastapi import APIRouter, Depends, Query
+import asyncio
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies import get_current_user, get_db
-from app.events import get_event_publisher
+from app.config import settings
+from app.database import ReplicaSet, get_replica_set
+from app.dependencies import get_current_user, get_db, get_read_db
+from app.events import get_event_hub, get_event_publisher
+from app.events.hub import EventHub
 from app.events.interface import EventPublisher
 from app.exceptions import bad_request, forbidden, not_found
 from app.models.auction import AuctionStatus
+from app.models.item import ItemCategory
 from app.models.user import User
-from app.schemas.auction import AuctionCreate, AuctionResponse
+from app.pagination import NEXT_CURSOR_HEADER
+from app.response_cache import (
+    AUCTIONS_TAG,
+    ITEMS_TAG,
+    ResponseCache,
+    auction_tag,
+    get_response_cache,
+)
+from app.schemas.auction import AuctionCreate, AuctionFeedEntry, AuctionResponse
 from app.schemas.bid import BidCreate, BidPlacedResponse, BidResponse
+from app.serialization import render_json
 from app.services import auction as auction_service
 from app.services import bid as bid_service
+from app.services.bid_engine import BidEngine, get_bid_engine
 from app.services.item import get_item
 
 router = APIRouter(prefix="/api/v1/auctions", tags=["auctions"])
@@ -45,23 +63,86 @@ async def create_auction(
 
 @router.get("/", response_model=list[AuctionResponse])
 async def list_auctions(
+    request: Request,
     status: AuctionStatus | None = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(None),
+    db: AsyncSession = Depends(get_read_db),
+    cache: ResponseCache = Depends(get_response_cache),
 ):
+    if cached := cache.lookup(request):
+        return cached
+    # Bids don't invalidate lists, so their prices may lag by the list TTL
+    tags = [AUCTIONS_TAG]
+    version = cache.version(tags)
     auctions = await auction_service.list_auctions(
-        db, status=status, skip=skip, limit=limit
+        db, status=status, skip=skip, limit=limit, cursor=cursor
+    )
+    headers = {}
+    if len(auctions) == limit:
+        headers[NEXT_CURSOR_HEADER] = auction_service.auction_cursor(auctions[-1])
+    body = render_json(list[AuctionResponse], auctions)
+    return cache.store(
+        request, body, tags, version, headers=headers,
+        ttl=settings.RESPONSE_CACHE_LIST_TTL_SECONDS,
+    )
+
+
+@router.get("/feed", response_model=list[AuctionFeedEntry])
+async def auction_feed(
+    request: Request,
+    status: AuctionStatus | None = Query(None),
+    category: ItemCategory | None = Query(None),
+    sort: auction_service.FeedSort = Query("newest"),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: str | None = Query(None),
+    db: AsyncSession = Depends(get_read_db),
+    cache: ResponseCache = Depends(get_response_cache),
+):
+    if cached := cache.lookup(request):
+        return cached
+    # Item edits change the embedded summaries; bids only expire with the list TTL
+    tags = [AUCTIONS_TAG, ITEMS_TAG]
+    version = cache.version(tags)
+    entries = await auction_service.list_feed(
+        db, status=status, category=category, sort=sort, limit=limit, cursor=cursor
+    )
+    headers = {}
+    if len(entries) == limit:
+        headers[NEXT_CURSOR_HEADER] = auction_service.feed_cursor(entries[-1], sort)
+    body = render_json(list[AuctionFeedEntry], entries)
+    return cache.store(
+        request, body, tags, version, headers=headers,
+        ttl=settings.RESPONSE_CACHE_LIST_TTL_SECONDS,
     )
-    return auctions
 
 
 @router.get("/{auction_id}", response_model=AuctionResponse)
-async def get_auction(auction_id: int, db: AsyncSession = Depends(get_db)):
-    auction = await auction_service.get_auction(db, auction_id)
+async def get_auction(
+    auction_id: int,
+    request: Request,
+    read_db: AsyncSession = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
+    cache: ResponseCache = Depends(get_response_cache),
+):
+    if cached := cache.lookup(request):
+        return cached
+    tags = [auction_tag(auction_id)]
+    version = cache.version(tags)
+    auction = await auction_service.read_auction(read_db, db, auction_id)
     if auction is None:
         raise not_found("Auction not found")
-    return auction
+    # Never serve an open auction past its next transition
+    ttl = None
+    deadline = auction_service.next_deadline(auction)
+    if deadline is not None:
+        ttl = min(
+            (deadline - datetime.now(timezone.utc)).total_seconds(),
+            settings.RESPONSE_CACHE_TTL_SECONDS,
+        )
+    body = render_json(AuctionResponse, auction)
+    return cache.store(request, body, tags, version, ttl=ttl)
 
 
 @router.post("/{auction_id}/cancel", response_model=AuctionResponse)
@@ -77,7 +158,7 @@ async def cancel_auction(
         raise forbidden("Not your auction")
     if auction.status not in (AuctionStatus.PENDING, AuctionStatus.ACTIVE):
         raise bad_request("Auction cannot be cancelled")
-    if await auction_service.has_bids(db, auction.id):
+    if auction_service.has_bids(auction):
         raise bad_request("Cannot cancel auction with bids")
     auction = await auction_service.cancel_auction(db, auction)
     return auction
@@ -90,23 +171,96 @@ async def place_bid(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     publisher: EventPublisher = Depends(get_event_publisher),
+    engine: BidEngine | None = Depends(get_bid_engine),
+    replicas: ReplicaSet = Depends(get_replica_set),
 ):
-    result = await bid_service.place_bid(
-        db,
-        auction_id=auction_id,
-        bidder_id=current_user.id,
-        amount=data.amount,
-        publisher=publisher,
-    )
+    if engine is not None:
+        result = await engine.place_bid(
+            auction_id=auction_id,
+            bidder_id=current_user.id,
+            amount=data.amount,
+            publisher=publisher,
+        )
+    elif settings.BID_MODE == "optimistic":
+        result = await bid_service.place_bid_optimistic(
+            db,
+            auction_id=auction_id,
+            bidder_id=current_user.id,
+            amount=data.amount,
+            publisher=publisher,
+        )
+    else:
+        result = await bid_service.place_bid(
+            db,
+            auction_id=auction_id,
+            bidder_id=current_user.id,
+            amount=data.amount,
+            publisher=publisher,
+        )
+    # The bidder's next reads must see their bid, whatever the replica lag
+    replicas.mark_write(current_user.id)
     return result
 
 
 @router.get("/{auction_id}/bids", response_model=list[BidResponse])
 async def list_bids(
     auction_id: int,
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    cursor: str | None = Query(None),
+    db: AsyncSession = Depends(get_read_db),
+    cache: ResponseCache = Depends(get_response_cache),
+):
+    if cached := cache.lookup(request):
+        return cached
+    tags = [auction_tag(auction_id)]
+    version = cache.version(tags)
+    bids = await bid_service.list_bids(
+        db, auction_id=auction_id, skip=skip, limit=limit, cursor=cursor
+    )
+    headers = {}
+    if len(bids) == limit:
+        headers[NEXT_CURSOR_HEADER] = bid_service.bid_cursor(bids[-1])
+    body = render_json(list[BidResponse], bids)
+    return cache.store(request, body, tags, version, headers=headers)
+
+
+async def _event_stream(hub: EventHub, auction_id: int):
+    subscription = hub.subscribe(auction_id)
+    try:
+        while True:
+            try:
+                frame = await asyncio.wait_for(
+                    subscription.get(), timeout=settings.EVENT_STREAM_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+            if frame is None:
+                return
+            yield frame
+    finally:
+        hub.unsubscribe(subscription)
+
+
+@router.get("/{auction_id}/stream")
+async def stream_auction_events(
+    auction_id: int,
+    read_db: AsyncSession = Depends(get_read_db),
     db: AsyncSession = Depends(get_db),
+    hub: EventHub = Depends(get_event_hub),
 ):
-    bids = await bid_service.list_bids(db, auction_id=auction_id, skip=skip, limit=limit)
-    return bids
+    auction = await auction_service.read_auction(read_db, db, auction_id)
+    if auction is None:
+        raise not_found("Auction not found")
+    if auction.status in (AuctionStatus.ENDED, AuctionStatus.CANCELLED):
+        raise bad_request("Auction is closed")
+    # Don't hold pooled connections for the lifetime of the stream
+    await read_db.close()
+    await db.close()
+    return StreamingResponse(
+        _event_stream(hub, auction_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,53 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.dependencies import get_current_user, get_read_session_factory
+from app.models.auction import AuctionStatus
+from app.models.user import User
+from app.services import export as export_service
+
+router = APIRouter(prefix="/api/v1/export", tags=["export"])
+
+FORMAT_PATTERN = f"^({export_service.NDJSON}|{export_service.CSV})$"
+
+
+def _stream(session_factory, stmt, fmt: str, cursor: int | None) -> StreamingResponse:
+    return StreamingResponse(
+        export_service.export_rows(session_factory, stmt, fmt, header=cursor is None),
+        media_type=export_service.MEDIA_TYPES[fmt],
+    )
+
+
+@router.get("/bids")
+async def export_bids(
+    since: datetime | None = Query(None),
+    until: datetime | None = Query(None),
+    cursor: int | None = Query(None, ge=0),
+    auction_id: int | None = Query(None),
+    format: str = Query(export_service.NDJSON, pattern=FORMAT_PATTERN),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_read_session_factory),
+    current_user: User = Depends(get_current_user),
+):
+    stmt = export_service.bids_query(
+        since=since, until=until, cursor=cursor, auction_id=auction_id
+    )
+    return _stream(session_factory, stmt, format, cursor)
+
+
+@router.get("/auctions")
+async def export_auctions(
+    since: datetime | None = Query(None),
+    until: datetime | None = Query(None),
+    cursor: int | None = Query(None, ge=0),
+    status: AuctionStatus | None = Query(None),
+    format: str = Query(export_service.NDJSON, pattern=FORMAT_PATTERN),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_read_session_factory),
+    current_user: User = Depends(get_current_user),
+):
+    stmt = export_service.auctions_query(
+        since=since, until=until, cursor=cursor, status=status
+    )
+    return _stream(session_factory, stmt, format, cursor)
@@ -1,13 +1,27 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies import get_current_user, get_db
+from app.dependencies import get_current_user, get_db, get_read_db
 from app.exceptions import bad_request, forbidden, not_found
 from app.models.auction import AuctionStatus
 from app.models.item import ClothingSize, ItemCategory, ItemCondition
 from app.models.user import User
-from app.schemas.item import ItemCreate, ItemResponse, ItemUpdate
+from app.pagination import NEXT_CURSOR_HEADER
+from app.response_cache import (
+    ITEMS_TAG,
+    ResponseCache,
+    get_response_cache,
+    item_tag,
+)
+from app.schemas.item import (
+    ItemCreate,
+    ItemImportResponse,
+    ItemResponse,
+    ItemUpdate,
+)
+from app.serialization import render_json
 from app.services import item as item_service
+from app.services import item_import
 from app.services.auction import get_active_auction_for_item
 
 router = APIRouter(prefix="/api/v1/items", tags=["items"])
@@ -32,27 +46,96 @@ async def create_item(
     return item
 
 
+@router.post("/import", response_model=ItemImportResponse)
+async def import_items(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type == "text/csv":
+        fmt = item_import.CSV
+    elif content_type in ("application/x-ndjson", "application/jsonl", ""):
+        fmt = item_import.NDJSON
+    else:
+        raise bad_request("Content-Type must be application/x-ndjson or text/csv")
+    return await item_import.import_items(
+        db, current_user.id, request.stream(), fmt=fmt
+    )
+
+
 @router.get("/", response_model=list[ItemResponse])
 async def list_items(
+    request: Request,
     category: ItemCategory | None = Query(None),
     size: ClothingSize | None = Query(None),
     condition: ItemCondition | None = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(None),
+    db: AsyncSession = Depends(get_read_db),
+    cache: ResponseCache = Depends(get_response_cache),
 ):
+    if cached := cache.lookup(request):
+        return cached
+    tags = [ITEMS_TAG]
+    version = cache.version(tags)
     items = await item_service.list_items(
-        db, category=category, size=size, condition=condition, skip=skip, limit=limit
+        db,
+        category=category,
+        size=size,
+        condition=condition,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+    )
+    headers = {}
+    if len(items) == limit:
+        headers[NEXT_CURSOR_HEADER] = item_service.item_cursor(items[-1])
+    body = render_json(list[ItemResponse], items)
+    return cache.store(request, body, tags, version, headers=headers)
+
+
+@router.get("/search", response_model=list[ItemResponse])
+async def search_items(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    category: ItemCategory | None = Query(None),
+    size: ClothingSize | None = Query(None),
+    condition: ItemCondition | None = Query(None),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: str | None = Query(None),
+    db: AsyncSession = Depends(get_read_db),
+):
+    results = await item_service.search_items(
+        db,
+        q,
+        category=category,
+        size=size,
+        condition=condition,
+        limit=limit,
+        cursor=cursor,
     )
-    return items
+    if len(results) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = item_service.search_cursor(*results[-1])
+    return [item for item, _ in results]
 
 
 @router.get("/{item_id}", response_model=ItemResponse)
-async def get_item(item_id: int, db: AsyncSession = Depends(get_db)):
+async def get_item(
+    item_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+    cache: ResponseCache = Depends(get_response_cache),
+):
+    if cached := cache.lookup(request):
+        return cached
+    tags = [item_tag(item_id)]
+    version = cache.version(tags)
     item = await item_service.get_item(db, item_id)
     if item is None:
         raise not_found("Item not found")
-    return item
+    return cache.store(request, render_json(ItemResponse, item), tags, version)
 
 
 @router.put("/{item_id}", response_model=ItemResponse)
@@ -4,6 +4,7 @@ from decimal import Decimal
 from pydantic import BaseModel
 
 from app.models.auction import AuctionStatus
+from app.schemas.item import ItemSummary
 
 
 class AuctionCreate(BaseModel):
@@ -24,6 +25,22 @@ class AuctionResponse(BaseModel):
     original_end_time: datetime
     status: AuctionStatus
     winner_id: int | None
+    bid_count: int
+    last_bid_at: datetime | None
+    leading_bidder_id: int | None
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class AuctionFeedEntry(BaseModel):
+    id: int
+    seller_id: int
+    status: AuctionStatus
+    start_price: Decimal
+    current_highest_bid: Decimal | None
+    bid_count: int
+    start_time: datetime
+    end_time: datetime
+    created_at: datetime
+    item: ItemSummary
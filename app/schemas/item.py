@@ -1,6 +1,7 @@
-from datetime import datetime
+from datetime import datetime, timezone
+from decimal import Decimal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator, model_validator
 
 from app.models.item import ClothingSize, ItemCategory, ItemCondition
 
@@ -36,3 +37,58 @@ class ItemResponse(BaseModel):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class ItemSummary(BaseModel):
+    id: int
+    title: str
+    size: ClothingSize
+    condition: ItemCondition
+    category: ItemCategory
+    image_url: str | None
+
+
+class ItemImportRow(ItemCreate):
+    start_price: Decimal | None = None
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+
+    @field_validator("start_time", "end_time")
+    @classmethod
+    def assume_utc(cls, value: datetime | None) -> datetime | None:
+        # Rows may mix naive and aware timestamps; naive ones are UTC
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
+
+    @model_validator(mode="after")
+    def check_auction(self) -> "ItemImportRow":
+        auction_fields = (self.start_price, self.start_time, self.end_time)
+        if any(value is not None for value in auction_fields):
+            if any(value is None for value in auction_fields):
+                raise ValueError(
+                    "start_price, start_time and end_time must be given together"
+                )
+            if self.end_time <= self.start_time:
+                raise ValueError("end_time must be after start_time")
+        return self
+
+    @property
+    def has_auction(self) -> bool:
+        return self.start_price is not None
+
+
+class ImportedItem(BaseModel):
+    line: int
+    item_id: int
+    auction_id: int | None = None
+
+
+class ImportRowError(BaseModel):
+    line: int
+    detail: str
+
+
+class ItemImportResponse(BaseModel):
+    created: list[ImportedItem]
+    errors: list[ImportRowError]
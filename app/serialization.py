@@ -0,0 +1,87 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Select, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def json_default(value: Any) -> Any:
+    # Pydantic's JSON mode: Decimals as strings, UTC datetimes with "Z"
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime):
+        text = value.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    # Nested schemas, e.g. the item summary of a feed entry
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(value: Any) -> bytes:
+    return json.dumps(
+        value, default=json_default, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+if orjson is not None:
+
+    def dumps(value: Any) -> bytes:
+        return orjson.dumps(value, default=json_default, option=orjson.OPT_UTC_Z)
+
+else:
+    dumps = _stdlib_dumps
+
+
+@lru_cache
+def _adapter(schema: Any) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+@lru_cache
+def _fields(schema: type[BaseModel]) -> tuple[str, ...]:
+    return tuple(schema.model_fields)
+
+
+def _fast_render(schema: Any, value: Any) -> bytes:
+    if get_origin(schema) is list:
+        fields = _fields(get_args(schema)[0])
+        return dumps([{name: getattr(obj, name) for name in fields} for obj in value])
+    return dumps({name: getattr(value, name) for name in _fields(schema)})
+
+
+def render_json(schema: Any, value: Any) -> bytes:
+    # Same bytes FastAPI would produce for a route with response_model=schema.
+    # The fast path reads the schema's fields straight off ORM objects or Core
+    # rows; it only suits schemas whose values are already of the declared
+    # types (nested schemas must be model instances).
+    if settings.FAST_SERIALIZATION:
+        return _fast_render(schema, value)
+    adapter = _adapter(schema)
+    return adapter.dump_json(adapter.validate_python(value))
+
+
+async def fetch_for_response(
+    db: AsyncSession, stmt: Select, schema: type[BaseModel]
+) -> list:
+    # On the fast path an ORM entity query is run as a Core query over the
+    # schema's columns only, skipping identity map and instance construction;
+    # the rows expose the same attributes as the ORM objects.
+    if not settings.FAST_SERIALIZATION:
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+    columns = inspect(stmt.column_descriptions[0]["expr"]).selectable.c
+    stmt = stmt.with_only_columns(*(columns[name] for name in _fields(schema)))
+    result = await db.execute(stmt)
+    return list(result.all())
@@ -0,0 +1,147 @@
+import argparse
+import asyncio
+import re
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import delete, exists, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.database import async_session_factory
+from app.models.auction import Auction, AuctionStatus
+from app.models.bid import ArchivedBid, Bid
+
+PARTITION_NAME = re.compile(r"^bids_(\d{4})_(\d{2})$")
+
+
+def _month(day: date, offset: int = 0) -> date:
+    index = day.year * 12 + day.month - 1 + offset
+    return date(index // 12, index % 12 + 1, 1)
+
+
+async def archive_bids(
+    session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+    older_than_days: int = settings.BID_ARCHIVE_AFTER_DAYS,
+    batch_size: int = settings.BID_ARCHIVE_BATCH_SIZE,
+) -> int:
+    """Move the bids of auctions closed ``older_than_days`` ago to bids_archive.
+
+    Auctions are handled ``batch_size`` at a time, each batch in its own
+    transaction, so an interrupted run can simply be restarted. Returns the
+    number of bids moved.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+    bids = Bid.__table__
+    moved = 0
+    while True:
+        async with session_factory() as db:
+            result = await db.scalars(
+                select(Auction.id)
+                .where(
+                    Auction.status.in_([AuctionStatus.ENDED, AuctionStatus.CANCELLED]),
+                    Auction.end_time < cutoff,
+                    exists().where(bids.c.auction_id == Auction.id),
+                )
+                .order_by(Auction.id)
+                .limit(batch_size)
+            )
+            auction_ids = result.all()
+            if not auction_ids:
+                return moved
+            await db.execute(
+                insert(ArchivedBid.__table__).from_select(
+                    [column.name for column in bids.c],
+                    select(*bids.c).where(bids.c.auction_id.in_(auction_ids)),
+                )
+            )
+            result = await db.execute(
+                delete(bids).where(bids.c.auction_id.in_(auction_ids))
+            )
+            await db.commit()
+        moved += result.rowcount
+
+
+async def maintain_bid_partitions(
+    session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+    months_ahead: int = settings.BID_PARTITION_MONTHS_AHEAD,
+    older_than_days: int = settings.BID_ARCHIVE_AFTER_DAYS,
+) -> tuple[int, list[str]]:
+    """Create upcoming monthly bid partitions and drop emptied old ones.
+
+    Only PostgreSQL partitions bids; elsewhere this does nothing. Returns the
+    number of partitions created and the names of those dropped.
+    """
+    async with session_factory() as db:
+        if db.get_bind().dialect.name != "postgresql":
+            return 0, []
+
+        today = datetime.now(timezone.utc).date()
+        created = await db.scalar(
+            text("SELECT create_bid_partitions(:first_month, :last_month)"),
+            {"first_month": _month(today), "last_month": _month(today, months_ahead)},
+        )
+
+        # Archiving empties the partitions of old months; dropping them keeps
+        # the bids indexes down to recent months.
+        cutoff = _month(today - timedelta(days=older_than_days))
+        result = await db.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'bids'::regclass"
+            )
+        )
+        dropped = []
+        for name in sorted(result.scalars().all()):
+            match = PARTITION_NAME.match(name)
+            if match is None:
+                continue
+            month = date(int(match[1]), int(match[2]), 1)
+            if _month(month, 1) > cutoff:
+                continue
+            # The name is validated by PARTITION_NAME, so it is safe to quote
+            if await db.scalar(text(f'SELECT EXISTS (SELECT 1 FROM "{name}")')):
+                continue
+            await db.execute(text(f'DROP TABLE "{name}"'))
+            dropped.append(name)
+        await db.commit()
+    return created, dropped
+
+
+async def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Archive bids of closed auctions and maintain bid partitions."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    archive = commands.add_parser(
+        "bids", help="move bids of long-closed auctions to bids_archive"
+    )
+    archive.add_argument(
+        "--older-than-days", type=int, default=settings.BID_ARCHIVE_AFTER_DAYS
+    )
+    archive.add_argument("--batch-size", type=int, default=settings.BID_ARCHIVE_BATCH_SIZE)
+    partitions = commands.add_parser(
+        "partitions", help="create upcoming bid partitions, drop emptied ones (PostgreSQL)"
+    )
+    partitions.add_argument(
+        "--months-ahead", type=int, default=settings.BID_PARTITION_MONTHS_AHEAD
+    )
+    partitions.add_argument(
+        "--older-than-days", type=int, default=settings.BID_ARCHIVE_AFTER_DAYS
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "bids":
+        moved = await archive_bids(
+            older_than_days=args.older_than_days, batch_size=args.batch_size
+        )
+        print(f"Archived {moved} bids")
+    else:
+        created, dropped = await maintain_bid_partitions(
+            months_ahead=args.months_ahead, older_than_days=args.older_than_days
+        )
+        print(f"Created {created} partitions, dropped {len(dropped)}: {' '.join(dropped)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
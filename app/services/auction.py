@@ -1,10 +1,22 @@
 from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Literal
 
-from sqlalchemy import select
+from sqlalchemy import Row, func, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.events import get_event_publisher
+from app.events.interface import AuctionEndedEvent
+from app.events.outbox import stage_events
 from app.models.auction import Auction, AuctionStatus
-from app.models.bid import Bid
+from app.models.item import Item, ItemCategory
+from app.pagination import decode_cursor, encode_cursor
+from app.response_cache import AUCTIONS_TAG, auction_tag, get_response_cache
+from app.schemas.auction import AuctionFeedEntry, AuctionResponse
+from app.schemas.item import ItemSummary
+from app.serialization import fetch_for_response
+from app.services.lifecycle import get_scheduler, verify_resolution
 
 
 def _ensure_utc(dt: datetime) -> datetime:
@@ -26,6 +38,8 @@ async def create_auction(db: AsyncSession, seller_id: int, **kwargs) -> Auction:
     db.add(auction)
     await db.commit()
     await db.refresh(auction)
+    get_scheduler().schedule_auction(auction)
+    get_response_cache().invalidate(AUCTIONS_TAG)
     return auction
 
 
@@ -37,18 +51,143 @@ async def get_auction(db: AsyncSession, auction_id: int) -> Auction | None:
     return auction
 
 
+async def read_auction(
+    read_db: AsyncSession, db: AsyncSession, auction_id: int
+) -> Auction | None:
+    # Reads may come from a replica, which must never be written to: an
+    # auction past its next transition is reloaded and resolved on the primary.
+    result = await read_db.execute(select(Auction).where(Auction.id == auction_id))
+    auction = result.scalar_one_or_none()
+    if auction is not None and is_due(auction):
+        return await get_auction(db, auction_id)
+    return auction
+
+
 async def list_auctions(
     db: AsyncSession,
     status: AuctionStatus | None = None,
     skip: int = 0,
     limit: int = 50,
-) -> list[Auction]:
+    cursor: str | None = None,
+) -> list[Auction | Row]:
     stmt = select(Auction)
     if status:
         stmt = stmt.where(Auction.status == status)
-    stmt = stmt.order_by(Auction.created_at.desc()).offset(skip).limit(limit)
-    result = await db.execute(stmt)
-    return list(result.scalars().all())
+    if cursor:
+        created_at, auction_id = decode_cursor(cursor, datetime.fromisoformat)
+        stmt = stmt.where(
+            tuple_(Auction.created_at, Auction.id) < tuple_(created_at, auction_id)
+        )
+    else:
+        stmt = stmt.offset(skip)
+    stmt = stmt.order_by(Auction.created_at.desc(), Auction.id.desc()).limit(limit)
+    return await fetch_for_response(db, stmt, AuctionResponse)
+
+
+def auction_cursor(auction: Auction | Row) -> str:
+    return encode_cursor(auction.created_at, auction.id)
+
+
+FeedSort = Literal["newest", "ending_soon", "price_asc", "price_desc"]
+
+_price = func.coalesce(Auction.current_highest_bid, Auction.start_price)
+
+# Sort key, whether it ascends, and how to parse it back from a cursor
+_FEED_SORTS = {
+    "newest": (Auction.created_at, False, datetime.fromisoformat),
+    "ending_soon": (Auction.end_time, True, datetime.fromisoformat),
+    "price_asc": (_price, True, Decimal),
+    "price_desc": (_price, False, Decimal),
+}
+
+
+async def list_feed(
+    db: AsyncSession,
+    status: AuctionStatus | None = None,
+    category: ItemCategory | None = None,
+    sort: FeedSort = "newest",
+    limit: int = 50,
+    cursor: str | None = None,
+) -> list[AuctionFeedEntry]:
+    # One query for the page: auctions joined with just the item columns a
+    # listing card needs, the first image extracted in SQL.
+    key, ascending, parse = _FEED_SORTS[sort]
+    stmt = select(
+        Auction.id,
+        Auction.seller_id,
+        Auction.status,
+        Auction.start_price,
+        Auction.current_highest_bid,
+        Auction.bid_count,
+        Auction.start_time,
+        Auction.end_time,
+        Auction.created_at,
+        Item.id.label("item_id"),
+        Item.title,
+        Item.size,
+        Item.condition,
+        Item.category,
+        Item.image_urls[0].as_string().label("image_url"),
+    ).join(Item, Item.id == Auction.item_id)
+    if status:
+        stmt = stmt.where(Auction.status == status)
+    if category:
+        stmt = stmt.where(Item.category == category)
+    if cursor:
+        value, auction_id = decode_cursor(cursor, parse)
+        position = tuple_(key, Auction.id)
+        after = tuple_(value, auction_id)
+        stmt = stmt.where(position > after if ascending else position < after)
+    if ascending:
+        stmt = stmt.order_by(key.asc(), Auction.id.asc())
+    else:
+        stmt = stmt.order_by(key.desc(), Auction.id.desc())
+    result = await db.execute(stmt.limit(limit))
+    return [
+        AuctionFeedEntry(
+            id=row.id,
+            seller_id=row.seller_id,
+            status=row.status,
+            start_price=row.start_price,
+            current_highest_bid=row.current_highest_bid,
+            bid_count=row.bid_count,
+            start_time=row.start_time,
+            end_time=row.end_time,
+            created_at=row.created_at,
+            item=ItemSummary(
+                id=row.item_id,
+                title=row.title,
+                size=row.size,
+                condition=row.condition,
+                category=row.category,
+                image_url=row.image_url,
+            ),
+        )
+        for row in result.all()
+    ]
+
+
+def feed_cursor(entry: AuctionFeedEntry, sort: FeedSort) -> str:
+    if sort == "newest":
+        value = entry.created_at
+    elif sort == "ending_soon":
+        value = entry.end_time
+    else:
+        value = entry.current_highest_bid or entry.start_price
+    return encode_cursor(value, entry.id)
+
+
+def next_deadline(auction: Auction) -> datetime | None:
+    if auction.status == AuctionStatus.PENDING:
+        return _ensure_utc(auction.start_time)
+    if auction.status == AuctionStatus.ACTIVE:
+        return _ensure_utc(auction.end_time)
+    return None
+
+
+def is_due(auction: Auction) -> bool:
+    deadline = next_deadline(auction)
+    return deadline is not None and deadline <= datetime.now(timezone.utc)
 
 
 async def get_active_auction_for_item(
@@ -67,14 +206,13 @@ async def cancel_auction(db: AsyncSession, auction: Auction) -> Auction:
     auction.status = AuctionStatus.CANCELLED
     await db.commit()
     await db.refresh(auction)
+    get_scheduler().unschedule(auction.id)
+    get_response_cache().invalidate(auction_tag(auction.id), AUCTIONS_TAG)
     return auction
 
 
-async def has_bids(db: AsyncSession, auction_id: int) -> bool:
-    result = await db.execute(
-        select(Bid.id).where(Bid.auction_id == auction_id).limit(1)
-    )
-    return result.scalar_one_or_none() is not None
+def has_bids(auction: Auction) -> bool:
+    return auction.bid_count > 0
 
 
 async def maybe_resolve_auction(db: AsyncSession, auction: Auction) -> None:
@@ -83,21 +221,33 @@ async def maybe_resolve_auction(db: AsyncSession, auction: Auction) -> None:
         auction.status = AuctionStatus.ACTIVE
         await db.commit()
         await db.refresh(auction)
+        get_response_cache().invalidate(auction_tag(auction.id), AUCTIONS_TAG)
     if auction.status == AuctionStatus.ACTIVE and _ensure_utc(auction.end_time) <= now:
         await resolve_auction(db, auction)
 
 
 async def resolve_auction(db: AsyncSession, auction: Auction) -> None:
+    # Single-row update from the leader tracked at bid time; the guards skip
+    # auctions resolved or extended since they were loaded.
     result = await db.execute(
-        select(Bid)
-        .where(Bid.auction_id == auction.id)
-        .order_by(Bid.amount.desc())
-        .limit(1)
+        update(Auction)
+        .where(
+            Auction.id == auction.id,
+            Auction.status == AuctionStatus.ACTIVE,
+            Auction.end_time <= datetime.now(timezone.utc),
+        )
+        .values(status=AuctionStatus.ENDED, winner_id=Auction.leading_bidder_id)
+        .returning(Auction.id, Auction.winner_id, Auction.current_highest_bid)
+        .execution_options(synchronize_session=False)
     )
-    winning_bid = result.scalar_one_or_none()
-    auction.status = AuctionStatus.ENDED
-    if winning_bid:
-        auction.winner_id = winning_bid.bidder_id
-        auction.current_highest_bid = winning_bid.amount
+    resolved = result.all()
+    if settings.AUCTION_RESOLUTION_VERIFY:
+        resolved = await verify_resolution(db, resolved)
+    ended = [AuctionEndedEvent(*row) for row in resolved]
+    stage_events(db, ended)
     await db.commit()
     await db.refresh(auction)
+    get_response_cache().invalidate(auction_tag(auction.id), AUCTIONS_TAG)
+    if ended:
+        get_scheduler().unschedule(auction.id)
+        await get_event_publisher().publish_batch(ended)
@@ -1,20 +1,33 @@
 from datetime import datetime, timedelta, timezone
 
-import bcrypt
 from jose import JWTError, jwt
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.cache import TTLCache
 from app.config import settings
 from app.models.user import User
+from app.services.password import get_password_hasher
 
+# Columns authentication needs; credentials never go in the cache
+CACHED_USER_COLUMNS = ("id", "email", "username", "created_at")
 
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+# Session.info key of the users changed by the pending transaction
+_CHANGED_USERS_KEY = "changed_user_ids"
 
+# Column values of recently authenticated users, keyed by id
+user_cache: TTLCache[int, dict] = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
 
-def verify_password(plain: str, hashed: str) -> bool:
-    return bcrypt.checkpw(plain.encode(), hashed.encode())
+
+async def hash_password(password: str) -> str:
+    return await get_password_hasher().hash(password)
+
+
+async def verify_password(plain: str, hashed: str) -> bool:
+    return await get_password_hasher().verify(plain, hashed)
 
 
 def create_access_token(user_id: int) -> str:
@@ -53,13 +66,50 @@ async def get_user_by_id(db: AsyncSession, user_id: int) -> User | None:
     return result.scalar_one_or_none()
 
 
+async def get_cached_user(db: AsyncSession, user_id: int) -> User | None:
+    values = user_cache.get(user_id)
+    if values is not None:
+        # A fresh transient instance per request, never shared between sessions
+        return User(**values)
+    user = await get_user_by_id(db, user_id)
+    if user is not None:
+        user_cache.set(
+            user_id, {column: getattr(user, column) for column in CACHED_USER_COLUMNS}
+        )
+    return user
+
+
+def invalidate_user(user_id: int) -> None:
+    user_cache.invalidate(user_id)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _stage_user_invalidation(mapper, connection, user: User) -> None:
+    session = Session.object_session(user)
+    if session is not None:
+        session.info.setdefault(_CHANGED_USERS_KEY, set()).add(user.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session: Session) -> None:
+    # After commit, so a concurrent miss can't cache the old row again
+    for user_id in session.info.pop(_CHANGED_USERS_KEY, ()):
+        invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session: Session) -> None:
+    session.info.pop(_CHANGED_USERS_KEY, None)
+
+
 async def register_user(
     db: AsyncSession, email: str, username: str, password: str
 ) -> User:
     user = User(
         email=email,
         username=username,
-        hashed_password=hash_password(password),
+        hashed_password=await hash_password(password),
     )
     db.add(user)
     await db.commit()
@@ -71,6 +121,10 @@ async def authenticate_user(
     db: AsyncSession, email: str, password: str
 ) -> User | None:
     user = await get_user_by_email(db, email)
-    if user is None or not verify_password(password, user.hashed_password):
+    if user is None or not await verify_password(password, user.hashed_password):
         return None
+    # Upgrade hashes made with an outdated cost factor while we have the password
+    if get_password_hasher().needs_rehash(user.hashed_password):
+        user.hashed_password = await hash_password(password)
+        await db.commit()
     return user
@@ -1,15 +1,35 @@
+import time
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
-from sqlalchemy import select
+from fastapi import HTTPException
+from sqlalchemy import (
+    Row,
+    case,
+    func,
+    insert,
+    literal,
+    select,
+    true,
+    tuple_,
+    union_all,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.config import settings
-from app.events.interface import EventPublisher
-from app.exceptions import bad_request, forbidden, not_found
+from app.events.interface import BidPlacedEvent, EventPublisher
+from app.events.outbox import stage_events
+from app.exceptions import bad_request, forbidden, not_found, service_unavailable
+from app.metrics import BID_LOCK_WAIT
 from app.models.auction import Auction, AuctionStatus
-from app.models.bid import Bid
+from app.models.bid import ArchivedBid, Bid
+from app.pagination import decode_cursor, encode_cursor
+from app.response_cache import auction_tag, get_response_cache
 from app.schemas.bid import BidPlacedResponse, BidResponse
+from app.serialization import fetch_for_response
+from app.services.lifecycle import END, get_scheduler
 
 
 def _ensure_utc(dt: datetime) -> datetime:
@@ -18,6 +38,30 @@ def _ensure_utc(dt: datetime) -> datetime:
     return dt
 
 
+# Works on anything exposing the Auction bid fields, so the bid engine can
+# validate against its in-memory state with the same rules.
+def validate_bid(auction, bidder_id: int, amount: Decimal, now: datetime) -> None:
+    if auction.status != AuctionStatus.ACTIVE:
+        raise bad_request("Auction is not active")
+    if now >= _ensure_utc(auction.end_time):
+        raise bad_request("Auction has ended")
+    if auction.seller_id == bidder_id:
+        raise forbidden("Seller cannot bid on own auction")
+
+    min_bid = auction.current_highest_bid or auction.start_price
+    if amount <= min_bid:
+        raise bad_request(f"Bid must be greater than {min_bid}")
+
+
+def apply_soft_close(end_time: datetime, now: datetime) -> tuple[datetime, bool]:
+    end_time = _ensure_utc(end_time)
+    window = timedelta(minutes=settings.SOFT_CLOSE_WINDOW_MINUTES)
+    if now >= end_time - window:
+        extension = timedelta(minutes=settings.SOFT_CLOSE_EXTENSION_MINUTES)
+        return end_time + extension, True
+    return end_time, False
+
+
 async def place_bid(
     db: AsyncSession,
     auction_id: int,
@@ -26,45 +70,51 @@ async def place_bid(
     publisher: EventPublisher,
 ) -> BidPlacedResponse:
     # Lock the auction row
+    started = time.perf_counter()
     result = await db.execute(
         select(Auction)
         .where(Auction.id == auction_id)
         .with_for_update()
     )
+    BID_LOCK_WAIT.observe(time.perf_counter() - started)
     auction = result.scalar_one_or_none()
     if auction is None:
         raise not_found("Auction not found")
 
     now = datetime.now(timezone.utc)
+    validate_bid(auction, bidder_id, amount, now)
 
-    if auction.status != AuctionStatus.ACTIVE:
-        raise bad_request("Auction is not active")
-    end_time = _ensure_utc(auction.end_time)
-    if now >= end_time:
-        raise bad_request("Auction has ended")
-    if auction.seller_id == bidder_id:
-        raise forbidden("Seller cannot bid on own auction")
-
-    min_bid = auction.current_highest_bid or auction.start_price
-    if amount <= min_bid:
-        raise bad_request(f"Bid must be greater than {min_bid}")
-
-    bid = Bid(auction_id=auction_id, bidder_id=bidder_id, amount=amount)
+    bid = Bid(
+        auction_id=auction_id, bidder_id=bidder_id, amount=amount, created_at=now
+    )
     db.add(bid)
 
     auction.current_highest_bid = amount
+    auction.bid_count += 1
+    auction.last_bid_at = now
+    auction.leading_bidder_id = bidder_id
+    auction.end_time, was_extended = apply_soft_close(auction.end_time, now)
 
-    # Soft-close check
-    was_extended = False
-    window = timedelta(minutes=settings.SOFT_CLOSE_WINDOW_MINUTES)
-    if now >= end_time - window:
-        extension = timedelta(minutes=settings.SOFT_CLOSE_EXTENSION_MINUTES)
-        auction.end_time = end_time + extension
-        was_extended = True
-
+    await db.flush()
+    stage_events(
+        db,
+        [
+            BidPlacedEvent(
+                auction_id=auction.id,
+                bid_id=bid.id,
+                bidder_id=bidder_id,
+                amount=amount,
+                new_end_time=auction.end_time,
+                was_extended=was_extended,
+            )
+        ],
+    )
     await db.commit()
+    get_response_cache().invalidate(auction_tag(auction_id))
     await db.refresh(bid)
     await db.refresh(auction)
+    if was_extended:
+        get_scheduler().schedule(auction.id, END, auction.end_time)
 
     await publisher.publish_bid_placed(
         auction_id=auction.id,
@@ -82,15 +132,215 @@ async def place_bid(
     )
 
 
+def _accept_bid(auction_id: int, bidder_id: int, amount: Decimal, now: datetime):
+    # Conditional update carrying every rule of validate_bid: it matches no
+    # row when the bid must be rejected.
+    return (
+        update(Auction)
+        .where(
+            Auction.id == auction_id,
+            Auction.status == AuctionStatus.ACTIVE,
+            Auction.end_time > now,
+            Auction.seller_id != bidder_id,
+            func.coalesce(Auction.current_highest_bid, Auction.start_price) < amount,
+        )
+        .values(
+            current_highest_bid=amount,
+            bid_count=Auction.bid_count + 1,
+            last_bid_at=now,
+            leading_bidder_id=bidder_id,
+        )
+    )
+
+
+async def _accept_postgres(
+    db: AsyncSession, auction_id: int, bidder_id: int, amount: Decimal, now: datetime
+) -> tuple[int, datetime, datetime] | None:
+    # One statement: lock and read the auction, update it if the bid is
+    # acceptable, and insert the bid from the updated row.
+    extend_before = now + timedelta(minutes=settings.SOFT_CLOSE_WINDOW_MINUTES)
+    extension = timedelta(minutes=settings.SOFT_CLOSE_EXTENSION_MINUTES)
+    before = (
+        select(Auction.id, Auction.end_time)
+        .where(Auction.id == auction_id)
+        .with_for_update()
+        .cte("before")
+    )
+    accepted = (
+        _accept_bid(auction_id, bidder_id, amount, now)
+        .where(Auction.id == before.c.id)
+        .values(
+            end_time=case(
+                (Auction.end_time <= extend_before, Auction.end_time + extension),
+                else_=Auction.end_time,
+            )
+        )
+        .returning(Auction.id, Auction.end_time, before.c.end_time.label("previous"))
+        .cte("accepted")
+    )
+    bid = (
+        insert(Bid)
+        .from_select(
+            ["auction_id", "bidder_id", "amount", "created_at"],
+            select(
+                accepted.c.id,
+                literal(bidder_id, Bid.bidder_id.type),
+                literal(amount, Bid.amount.type),
+                literal(now, Bid.created_at.type),
+            ),
+        )
+        .returning(Bid.id)
+        .cte("bid")
+    )
+    result = await db.execute(
+        select(bid.c.id, accepted.c.end_time, accepted.c.previous).select_from(
+            bid.join(accepted, true())
+        )
+    )
+    return result.one_or_none()
+
+
+async def _accept_sqlite(
+    db: AsyncSession, auction_id: int, bidder_id: int, amount: Decimal, now: datetime
+) -> tuple[int, datetime, datetime] | None:
+    # SQLite has neither data-modifying CTEs nor date arithmetic on stored
+    # datetimes. Its first write locks the whole database, so the same steps
+    # as separate statements in one transaction are just as atomic.
+    result = await db.execute(
+        _accept_bid(auction_id, bidder_id, amount, now).returning(Auction.end_time)
+    )
+    end_time = result.scalar_one_or_none()
+    if end_time is None:
+        return None
+    new_end_time, was_extended = apply_soft_close(end_time, now)
+    if was_extended:
+        await db.execute(
+            update(Auction)
+            .where(Auction.id == auction_id)
+            .values(end_time=new_end_time)
+        )
+    bid_id = await db.scalar(
+        insert(Bid)
+        .values(
+            auction_id=auction_id, bidder_id=bidder_id, amount=amount, created_at=now
+        )
+        .returning(Bid.id)
+    )
+    return bid_id, new_end_time, end_time
+
+
+async def _rejection(
+    db: AsyncSession, auction_id: int, bidder_id: int, amount: Decimal, now: datetime
+) -> HTTPException:
+    # Only failed bids pay for reading the auction back to explain why
+    result = await db.execute(
+        select(
+            Auction.status,
+            Auction.end_time,
+            Auction.seller_id,
+            Auction.current_highest_bid,
+            Auction.start_price,
+        ).where(Auction.id == auction_id)
+    )
+    auction = result.one_or_none()
+    if auction is None:
+        return not_found("Auction not found")
+    try:
+        validate_bid(auction, bidder_id, amount, now)
+    except HTTPException as exc:
+        return exc
+    # The auction changed between the two statements
+    return service_unavailable("Auction is busy, please retry")
+
+
+async def place_bid_optimistic(
+    db: AsyncSession,
+    auction_id: int,
+    bidder_id: int,
+    amount: Decimal,
+    publisher: EventPublisher,
+) -> BidPlacedResponse:
+    now = datetime.now(timezone.utc)
+    if db.get_bind().dialect.name == "postgresql":
+        accepted = await _accept_postgres(db, auction_id, bidder_id, amount, now)
+    else:
+        accepted = await _accept_sqlite(db, auction_id, bidder_id, amount, now)
+    if accepted is None:
+        await db.rollback()
+        raise await _rejection(db, auction_id, bidder_id, amount, now)
+
+    bid_id, end_time, previous_end_time = accepted
+    end_time = _ensure_utc(end_time)
+    was_extended = end_time != _ensure_utc(previous_end_time)
+    stage_events(
+        db,
+        [
+            BidPlacedEvent(
+                auction_id=auction_id,
+                bid_id=bid_id,
+                bidder_id=bidder_id,
+                amount=amount,
+                new_end_time=end_time,
+                was_extended=was_extended,
+            )
+        ],
+    )
+    await db.commit()
+    get_response_cache().invalidate(auction_tag(auction_id))
+    if was_extended:
+        get_scheduler().schedule(auction_id, END, end_time)
+
+    await publisher.publish_bid_placed(
+        auction_id=auction_id,
+        bid_id=bid_id,
+        bidder_id=bidder_id,
+        amount=amount,
+        new_end_time=end_time,
+        was_extended=was_extended,
+    )
+
+    return BidPlacedResponse(
+        bid=BidResponse(
+            id=bid_id,
+            auction_id=auction_id,
+            bidder_id=bidder_id,
+            amount=amount,
+            created_at=now,
+        ),
+        was_extended=was_extended,
+        auction_end_time=end_time,
+    )
+
+
+def bid_history(auction_id: int | None = None) -> type[Bid]:
+    # Live and archived bids as one Bid-mapped selectable. The auction filter
+    # goes into both branches so each is served by its own index.
+    branches = []
+    for table in (Bid.__table__, ArchivedBid.__table__):
+        branch = select(*table.c)
+        if auction_id is not None:
+            branch = branch.where(table.c.auction_id == auction_id)
+        branches.append(branch)
+    return aliased(Bid, union_all(*branches).subquery("bid_history"))
+
+
 async def list_bids(
-    db: AsyncSession, auction_id: int, skip: int = 0, limit: int = 50
-) -> list[Bid]:
-    stmt = (
-        select(Bid)
-        .where(Bid.auction_id == auction_id)
-        .order_by(Bid.amount.desc())
-        .offset(skip)
-        .limit(limit)
-    )
-    result = await db.execute(stmt)
-    return list(result.scalars().all())
+    db: AsyncSession,
+    auction_id: int,
+    skip: int = 0,
+    limit: int = 50,
+    cursor: str | None = None,
+) -> list[Bid | Row]:
+    history = bid_history(auction_id)
+    stmt = select(history)
+    if cursor:
+        amount, bid_id = decode_cursor(cursor, Decimal)
+        stmt = stmt.where(tuple_(history.amount, history.id) < tuple_(amount, bid_id))
+    else:
+        stmt = stmt.offset(skip)
+    stmt = stmt.order_by(history.amount.desc(), history.id.desc()).limit(limit)
+    return await fetch_for_response(db, stmt, BidResponse)
+
+
+def bid_cursor(bid: Bid | Row) -> str:
+    return encode_cursor(bid.amount, bid.id)
@@ -0,0 +1,337 @@
+import asyncio
+import logging
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from fastapi import HTTPException
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.database import async_session_factory
+from app.events.interface import BidPlacedEvent, EventPublisher
+from app.events.outbox import stage_events
+from app.exceptions import bad_request, not_found, service_unavailable
+from app.models.auction import Auction, AuctionStatus
+from app.models.bid import Bid
+from app.response_cache import auction_tag, get_response_cache
+from app.schemas.bid import BidPlacedResponse, BidResponse
+from app.services.bid import apply_soft_close, validate_bid
+from app.services.lifecycle import END, get_scheduler
+
+logger = logging.getLogger(__name__)
+
+# How many times a batch is re-validated when the auction row changed under us
+# (e.g. another worker process accepted a bid or the auction was cancelled).
+MAX_PERSIST_ATTEMPTS = 3
+
+
+@dataclass
+class _AuctionState:
+    seller_id: int
+    status: AuctionStatus
+    start_price: Decimal
+    current_highest_bid: Decimal | None
+    end_time: datetime
+
+    @property
+    def min_bid(self) -> Decimal:
+        return self.current_highest_bid or self.start_price
+
+
+@dataclass
+class _BidRequest:
+    bidder_id: int
+    amount: Decimal
+    publisher: EventPublisher
+    future: asyncio.Future
+
+
+@dataclass
+class _AcceptedBid:
+    request: _BidRequest
+    created_at: datetime
+    end_time: datetime
+    was_extended: bool
+
+
+class AuctionActor:
+    """Single writer for one auction.
+
+    Bids are queued and handled strictly in order: each drained batch is
+    validated against the cached auction state and persisted in a single
+    transaction, so the auction row is never locked while callers wait.
+    """
+
+    def __init__(self, engine: "BidEngine", auction_id: int):
+        self.engine = engine
+        self.auction_id = auction_id
+        self.queue: asyncio.Queue[_BidRequest] = asyncio.Queue(
+            maxsize=engine.queue_size
+        )
+        self.state: _AuctionState | None = None
+        self.task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                first = await asyncio.wait_for(
+                    self.queue.get(), timeout=self.engine.idle_seconds
+                )
+            except asyncio.TimeoutError:
+                if self.queue.empty():
+                    self.engine._retire(self)
+                    return
+                continue
+
+            batch = [first]
+            while len(batch) < self.engine.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            batch = [request for request in batch if not request.future.done()]
+            if not batch:
+                continue
+
+            try:
+                await self._process(batch)
+            except Exception as exc:
+                logger.exception("Bid engine failed for auction %s", self.auction_id)
+                self.state = None
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(exc)
+
+    async def _process(self, batch: list[_BidRequest]) -> None:
+        async with self.engine.session_factory() as db:
+            for _ in range(MAX_PERSIST_ATTEMPTS):
+                if self.state is None:
+                    self.state = await self._load(db)
+                if self.state is None:
+                    self._reject_all(batch, not_found("Auction not found"))
+                    return
+                if self.state.status != AuctionStatus.ACTIVE:
+                    # Never cache inactive auctions: a pending one becomes
+                    # active outside of the engine.
+                    self.state = None
+                    self._reject_all(batch, bad_request("Auction is not active"))
+                    return
+
+                new_state, accepted, rejected = self._validate(batch)
+                if not accepted:
+                    self._settle(accepted, rejected, {})
+                    return
+
+                bids = await self._persist(db, new_state, accepted)
+                if bids is not None:
+                    if any(bid.was_extended for bid in accepted):
+                        get_scheduler().schedule(self.auction_id, END, new_state.end_time)
+                    self.state = new_state
+                    self._settle(accepted, rejected, bids)
+                    await self._publish(accepted, bids)
+                    return
+
+                await db.rollback()
+                self.state = None
+
+        self._reject_all(batch, service_unavailable("Auction is busy, please retry"))
+
+    async def _load(self, db: AsyncSession) -> _AuctionState | None:
+        result = await db.execute(
+            select(
+                Auction.seller_id,
+                Auction.status,
+                Auction.start_price,
+                Auction.current_highest_bid,
+                Auction.end_time,
+            ).where(Auction.id == self.auction_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return _AuctionState(*row)
+
+    def _validate(
+        self, batch: list[_BidRequest]
+    ) -> tuple[_AuctionState, list[_AcceptedBid], list[tuple[_BidRequest, HTTPException]]]:
+        state = replace(self.state)
+        accepted = []
+        rejected = []
+        for request in batch:
+            now = datetime.now(timezone.utc)
+            try:
+                validate_bid(state, request.bidder_id, request.amount, now)
+            except HTTPException as exc:
+                rejected.append((request, exc))
+                continue
+            state.current_highest_bid = request.amount
+            state.end_time, was_extended = apply_soft_close(state.end_time, now)
+            accepted.append(_AcceptedBid(request, now, state.end_time, was_extended))
+        return state, accepted, rejected
+
+    async def _persist(
+        self,
+        db: AsyncSession,
+        new_state: _AuctionState,
+        accepted: list[_AcceptedBid],
+    ) -> dict[int, Bid] | None:
+        # Optimistic guard: the row must still match the state the batch was
+        # validated against, otherwise reload and validate again.
+        result = await db.execute(
+            update(Auction)
+            .where(
+                Auction.id == self.auction_id,
+                Auction.status == AuctionStatus.ACTIVE,
+                func.coalesce(Auction.current_highest_bid, Auction.start_price)
+                == self.state.min_bid,
+            )
+            .values(
+                current_highest_bid=new_state.current_highest_bid,
+                end_time=new_state.end_time,
+                bid_count=Auction.bid_count + len(accepted),
+                last_bid_at=accepted[-1].created_at,
+                leading_bidder_id=accepted[-1].request.bidder_id,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            return None
+
+        inserted = await db.scalars(
+            insert(Bid).returning(Bid, sort_by_parameter_order=True),
+            [
+                {
+                    "auction_id": self.auction_id,
+                    "bidder_id": bid.request.bidder_id,
+                    "amount": bid.request.amount,
+                    "created_at": bid.created_at,
+                }
+                for bid in accepted
+            ],
+        )
+        bids = {id(bid.request): row for bid, row in zip(accepted, inserted.all())}
+        stage_events(
+            db,
+            [
+                BidPlacedEvent(
+                    auction_id=self.auction_id,
+                    bid_id=bids[id(bid.request)].id,
+                    bidder_id=bid.request.bidder_id,
+                    amount=bid.request.amount,
+                    new_end_time=bid.end_time,
+                    was_extended=bid.was_extended,
+                )
+                for bid in accepted
+            ],
+        )
+        await db.commit()
+        get_response_cache().invalidate(auction_tag(self.auction_id))
+        return bids
+
+    def _settle(
+        self,
+        accepted: list[_AcceptedBid],
+        rejected: list[tuple[_BidRequest, HTTPException]],
+        bids: dict[int, Bid],
+    ) -> None:
+        for request, exc in rejected:
+            if not request.future.done():
+                request.future.set_exception(exc)
+        for bid in accepted:
+            if not bid.request.future.done():
+                bid.request.future.set_result(
+                    BidPlacedResponse(
+                        bid=BidResponse.model_validate(bids[id(bid.request)]),
+                        was_extended=bid.was_extended,
+                        auction_end_time=bid.end_time,
+                    )
+                )
+
+    async def _publish(self, accepted: list[_AcceptedBid], bids: dict[int, Bid]) -> None:
+        for bid in accepted:
+            try:
+                await bid.request.publisher.publish_bid_placed(
+                    auction_id=self.auction_id,
+                    bid_id=bids[id(bid.request)].id,
+                    bidder_id=bid.request.bidder_id,
+                    amount=bid.request.amount,
+                    new_end_time=bid.end_time,
+                    was_extended=bid.was_extended,
+                )
+            except Exception:
+                logger.exception("Failed to publish bid for auction %s", self.auction_id)
+
+    @staticmethod
+    def _reject_all(batch: list[_BidRequest], exc: HTTPException) -> None:
+        for request in batch:
+            if not request.future.done():
+                request.future.set_exception(exc)
+
+
+class BidEngine:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch_size: int = settings.BID_ENGINE_BATCH_SIZE,
+        queue_size: int = settings.BID_ENGINE_QUEUE_SIZE,
+        idle_seconds: float = settings.BID_ENGINE_IDLE_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.idle_seconds = idle_seconds
+        self._actors: dict[int, AuctionActor] = {}
+
+    async def place_bid(
+        self,
+        auction_id: int,
+        bidder_id: int,
+        amount: Decimal,
+        publisher: EventPublisher,
+    ) -> BidPlacedResponse:
+        actor = self._actors.get(auction_id)
+        if actor is None:
+            actor = self._actors[auction_id] = AuctionActor(self, auction_id)
+
+        future = asyncio.get_running_loop().create_future()
+        try:
+            actor.queue.put_nowait(_BidRequest(bidder_id, amount, publisher, future))
+        except asyncio.QueueFull:
+            raise service_unavailable("Auction is busy, please retry")
+        return await future
+
+    def _retire(self, actor: AuctionActor) -> None:
+        if self._actors.get(actor.auction_id) is actor:
+            del self._actors[actor.auction_id]
+
+    async def close(self) -> None:
+        actors = list(self._actors.values())
+        self._actors.clear()
+        for actor in actors:
+            actor.task.cancel()
+        await asyncio.gather(*(actor.task for actor in actors), return_exceptions=True)
+        for actor in actors:
+            while not actor.queue.empty():
+                request = actor.queue.get_nowait()
+                if not request.future.done():
+                    request.future.set_exception(
+                        service_unavailable("Bid engine is shutting down")
+                    )
+
+
+_engine: BidEngine | None = None
+
+
+def get_bid_engine() -> BidEngine | None:
+    global _engine
+    if settings.BID_MODE != "engine":
+        return None
+    if _engine is None:
+        _engine = BidEngine(async_session_factory)
+    return _engine
+
+
+async def shutdown_bid_engine() -> None:
+    global _engine
+    if _engine is not None:
+        await _engine.close()
+        _engine = None
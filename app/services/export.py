@@ -0,0 +1,142 @@
+import argparse
+import asyncio
+import csv
+import io
+import sys
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from pydantic import BaseModel
+from sqlalchemy import Select, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.database import async_session_factory
+from app.models.auction import Auction, AuctionStatus
+from app.schemas.auction import AuctionResponse
+from app.schemas.bid import BidResponse
+from app.serialization import json_default, dumps
+from app.services.bid import bid_history
+
+NDJSON = "ndjson"
+CSV = "csv"
+MEDIA_TYPES = {NDJSON: "application/x-ndjson", CSV: "text/csv"}
+
+
+def _range_query(
+    model,
+    schema: type[BaseModel],
+    since: datetime | None,
+    until: datetime | None,
+    cursor: int | None,
+) -> Select:
+    # Rows are exported in id order so a client can resume after the last id
+    # it received; since/until bound created_at.
+    table = inspect(model).selectable
+    stmt = select(*(table.c[name] for name in schema.model_fields))
+    if since is not None:
+        stmt = stmt.where(table.c.created_at >= since)
+    if until is not None:
+        stmt = stmt.where(table.c.created_at < until)
+    if cursor is not None:
+        stmt = stmt.where(table.c.id > cursor)
+    return stmt.order_by(table.c.id)
+
+
+def bids_query(
+    since: datetime | None = None,
+    until: datetime | None = None,
+    cursor: int | None = None,
+    auction_id: int | None = None,
+) -> Select:
+    # Archived bids are included
+    return _range_query(bid_history(auction_id), BidResponse, since, until, cursor)
+
+
+def auctions_query(
+    since: datetime | None = None,
+    until: datetime | None = None,
+    cursor: int | None = None,
+    status: AuctionStatus | None = None,
+) -> Select:
+    stmt = _range_query(Auction, AuctionResponse, since, until, cursor)
+    if status is not None:
+        stmt = stmt.where(Auction.status == status)
+    return stmt
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, AuctionStatus):
+        return value.value
+    try:
+        return json_default(value)
+    except TypeError:
+        return value
+
+
+async def export_rows(
+    session_factory: async_sessionmaker[AsyncSession],
+    stmt: Select,
+    fmt: str = NDJSON,
+    header: bool = True,
+    batch_size: int = settings.EXPORT_BATCH_SIZE,
+) -> AsyncIterator[bytes]:
+    # Streams rows through a server-side cursor and yields one encoded chunk
+    # per fetched batch, so memory stays bounded whatever the range. Resumed
+    # CSV exports pass header=False so they can be appended to the first part.
+    # Plain str keys: orjson rejects the str subclasses SQLAlchemy names use
+    columns = [str(column.name) for column in stmt.selected_columns]
+    async with session_factory() as db:
+        result = await db.stream(stmt.execution_options(yield_per=batch_size))
+        if fmt == CSV:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator="\n")
+            if header:
+                writer.writerow(columns)
+            async for rows in result.partitions():
+                writer.writerows([_csv_value(value) for value in row] for row in rows)
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+            if buffer.tell():
+                yield buffer.getvalue().encode()
+        else:
+            async for rows in result.partitions():
+                yield b"".join(
+                    dumps(dict(zip(columns, row))) + b"\n" for row in rows
+                )
+
+
+async def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Export bids or auctions as NDJSON or CSV."
+    )
+    parser.add_argument("kind", choices=["bids", "auctions"])
+    parser.add_argument("--format", choices=[NDJSON, CSV], default=NDJSON)
+    parser.add_argument("--since", type=datetime.fromisoformat)
+    parser.add_argument("--until", type=datetime.fromisoformat)
+    parser.add_argument(
+        "--cursor", type=int, help="resume after this id (last id of a previous run)"
+    )
+    parser.add_argument("--output", help="file to write to (default: stdout)")
+    args = parser.parse_args(argv)
+
+    query = bids_query if args.kind == "bids" else auctions_query
+    stmt = query(since=args.since, until=args.until, cursor=args.cursor)
+    # Append when resuming so an interrupted file is completed in place
+    mode = "ab" if args.cursor is not None else "wb"
+    output = open(args.output, mode) if args.output else sys.stdout.buffer
+    try:
+        async for chunk in export_rows(
+            async_session_factory, stmt, args.format, header=args.cursor is None
+        ):
+            output.write(chunk)
+    finally:
+        if args.output:
+            output.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
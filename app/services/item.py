@@ -1,7 +1,20 @@
-from sqlalchemy import select
+import re
+from datetime import datetime
+
+from sqlalchemy import Row, column, func, literal_column, select, table, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.item import ClothingSize, Item, ItemCategory, ItemCondition
+from app.models.item import (
+    ITEM_SEARCH_CONFIG,
+    ClothingSize,
+    Item,
+    ItemCategory,
+    ItemCondition,
+)
+from app.pagination import decode_cursor, encode_cursor
+from app.response_cache import ITEMS_TAG, get_response_cache, item_tag
+from app.schemas.item import ItemResponse
+from app.serialization import fetch_for_response
 
 
 async def create_item(db: AsyncSession, seller_id: int, **kwargs) -> Item:
@@ -9,6 +22,7 @@ async def create_item(db: AsyncSession, seller_id: int, **kwargs) -> Item:
     db.add(item)
     await db.commit()
     await db.refresh(item)
+    get_response_cache().invalidate(ITEMS_TAG)
     return item
 
 
@@ -24,7 +38,8 @@ async def list_items(
     condition: ItemCondition | None = None,
     skip: int = 0,
     limit: int = 50,
-) -> list[Item]:
+    cursor: str | None = None,
+) -> list[Item | Row]:
     stmt = select(Item)
     if category:
         stmt = stmt.where(Item.category == category)
@@ -32,9 +47,70 @@ async def list_items(
         stmt = stmt.where(Item.size == size)
     if condition:
         stmt = stmt.where(Item.condition == condition)
-    stmt = stmt.order_by(Item.created_at.desc()).offset(skip).limit(limit)
+    if cursor:
+        created_at, item_id = decode_cursor(cursor, datetime.fromisoformat)
+        stmt = stmt.where(tuple_(Item.created_at, Item.id) < tuple_(created_at, item_id))
+    else:
+        stmt = stmt.offset(skip)
+    stmt = stmt.order_by(Item.created_at.desc(), Item.id.desc()).limit(limit)
+    return await fetch_for_response(db, stmt, ItemResponse)
+
+
+def item_cursor(item: Item | Row) -> str:
+    return encode_cursor(item.created_at, item.id)
+
+
+# SQLite mirror of items, see app.models.item
+items_fts = table("items_fts", column("rowid"), column("items_fts"))
+
+
+async def search_items(
+    db: AsyncSession,
+    q: str,
+    category: ItemCategory | None = None,
+    size: ClothingSize | None = None,
+    condition: ItemCondition | None = None,
+    limit: int = 50,
+    cursor: str | None = None,
+) -> list[tuple[Item, float]]:
+    if db.get_bind().dialect.name == "postgresql":
+        query = func.websearch_to_tsquery(ITEM_SEARCH_CONFIG, q)
+        vector = literal_column("items.search_vector")
+        rank = func.ts_rank_cd(vector, query)
+        stmt = select(Item, rank).where(vector.op("@@")(query))
+    else:
+        # FTS5 query syntax is not meant for end users: keep the words and
+        # quote them, which ANDs them like websearch_to_tsquery does.
+        terms = re.findall(r"\w+", q)
+        if not terms:
+            return []
+        # bm25 is lower-is-better; titles weigh twice as much as descriptions
+        rank = -func.bm25(items_fts.c.items_fts, 2.0, 1.0)
+        stmt = (
+            select(Item, rank)
+            .join(items_fts, items_fts.c.rowid == Item.id)
+            .where(
+                items_fts.c.items_fts.op("MATCH")(
+                    " ".join(f'"{term}"' for term in terms)
+                )
+            )
+        )
+    if category:
+        stmt = stmt.where(Item.category == category)
+    if size:
+        stmt = stmt.where(Item.size == size)
+    if condition:
+        stmt = stmt.where(Item.condition == condition)
+    if cursor:
+        cursor_rank, item_id = decode_cursor(cursor, float)
+        stmt = stmt.where(tuple_(rank, Item.id) < tuple_(cursor_rank, item_id))
+    stmt = stmt.order_by(rank.desc(), Item.id.desc()).limit(limit)
     result = await db.execute(stmt)
-    return list(result.scalars().all())
+    return [(item, item_rank) for item, item_rank in result.all()]
+
+
+def search_cursor(item: Item, rank: float) -> str:
+    return encode_cursor(rank, item.id)
 
 
 async def update_item(db: AsyncSession, item: Item, **kwargs) -> Item:
@@ -43,9 +119,11 @@ async def update_item(db: AsyncSession, item: Item, **kwargs) -> Item:
             setattr(item, key, value)
     await db.commit()
     await db.refresh(item)
+    get_response_cache().invalidate(item_tag(item.id), ITEMS_TAG)
     return item
 
 
 async def delete_item(db: AsyncSession, item: Item) -> None:
     await db.delete(item)
     await db.commit()
+    get_response_cache().invalidate(item_tag(item.id), ITEMS_TAG)
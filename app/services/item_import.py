@@ -0,0 +1,250 @@
+import csv
+import json
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.auction import Auction, AuctionStatus
+from app.models.item import Item
+from app.response_cache import AUCTIONS_TAG, ITEMS_TAG, get_response_cache
+from app.schemas.item import (
+    ImportedItem,
+    ImportRowError,
+    ItemImportResponse,
+    ItemImportRow,
+)
+from app.services.lifecycle import get_scheduler
+
+NDJSON = "ndjson"
+CSV = "csv"
+
+# CSV cells holding several image URLs separate them with this character
+CSV_LIST_SEPARATOR = "|"
+
+
+@dataclass
+class _Record:
+    line: int
+    data: dict[str, Any] | None = None
+    error: str | None = None
+
+
+def _ensure_utc(dt: datetime) -> datetime:
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, str | None]]:
+    # Splits on raw newlines, which never occur inside multi-byte UTF-8
+    # sequences, so a bad line can be reported without losing the rest.
+    buffer = b""
+    line = 0
+
+    def decode(raw: bytes) -> str | None:
+        try:
+            return raw.decode("utf-8").rstrip("\r")
+        except UnicodeDecodeError:
+            return None
+
+    async for chunk in chunks:
+        buffer += chunk
+        *complete, buffer = buffer.split(b"\n")
+        for raw in complete:
+            line += 1
+            yield line, decode(raw)
+    if buffer:
+        yield line + 1, decode(buffer)
+
+
+async def _ndjson_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[_Record]:
+    async for line, text in _lines(chunks):
+        if text is None:
+            yield _Record(line, error="Invalid UTF-8")
+            continue
+        if not text.strip():
+            continue
+        try:
+            data = json.loads(text)
+        except ValueError:
+            yield _Record(line, error="Invalid JSON")
+            continue
+        if not isinstance(data, dict):
+            yield _Record(line, error="Expected a JSON object")
+            continue
+        yield _Record(line, data)
+
+
+async def _csv_records(
+    chunks: AsyncIterator[bytes],
+    max_record_chars: int = settings.IMPORT_MAX_RECORD_CHARS,
+) -> AsyncIterator[_Record]:
+    header = None
+    pending: list[str] = []
+    size = 0
+    quoted = False
+    start = 0
+    async for line, text in _lines(chunks):
+        if text is None:
+            pending, size, quoted = [], 0, False
+            yield _Record(line, error="Invalid UTF-8")
+            continue
+        if not pending:
+            start = line
+        pending.append(text)
+        size += len(text) + 1
+        # Quoted cells may span lines: the record is complete once its quotes
+        # are balanced ("" escapes come in pairs).
+        if text.count('"') % 2:
+            quoted = not quoted
+        if quoted:
+            if size > max_record_chars:
+                pending, size, quoted = [], 0, False
+                yield _Record(start, error="Invalid CSV: unterminated quoted field")
+            continue
+        record = "\n".join(pending)
+        pending, size = [], 0
+        if not record.strip():
+            continue
+        try:
+            values = next(csv.reader([record], strict=True))
+        except csv.Error as exc:
+            yield _Record(start, error=f"Invalid CSV: {exc}")
+            continue
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield _Record(
+                start, error=f"Expected {len(header)} columns, got {len(values)}"
+            )
+            continue
+        data = {name: value for name, value in zip(header, values) if value != ""}
+        if "image_urls" in data:
+            data["image_urls"] = [
+                url.strip()
+                for url in data["image_urls"].split(CSV_LIST_SEPARATOR)
+                if url.strip()
+            ]
+        yield _Record(start, data)
+    if pending:
+        yield _Record(start, error="Invalid CSV: unterminated quoted field")
+
+
+def _format_errors(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        if error["loc"]
+        else error["msg"]
+        for error in exc.errors()
+    )
+
+
+class _ImportBatch:
+    def __init__(self, db: AsyncSession, seller_id: int):
+        self.db = db
+        self.seller_id = seller_id
+        self.pending: list[tuple[int, ItemImportRow]] = []
+        self.created: list[ImportedItem] = []
+
+    async def flush(self) -> None:
+        if not self.pending:
+            return
+        rows, self.pending = self.pending, []
+        item_ids = await self.db.scalars(
+            insert(Item).returning(Item.id, sort_by_parameter_order=True),
+            [
+                {
+                    "seller_id": self.seller_id,
+                    "title": row.title,
+                    "description": row.description,
+                    "size": row.size,
+                    "condition": row.condition,
+                    "category": row.category,
+                    "image_urls": row.image_urls,
+                }
+                for _, row in rows
+            ],
+        )
+        imported = [
+            ImportedItem(line=line, item_id=item_id)
+            for (line, _), item_id in zip(rows, item_ids.all())
+        ]
+
+        now = datetime.now(timezone.utc)
+        with_auction = [
+            (result, row)
+            for result, (_, row) in zip(imported, rows)
+            if row.has_auction
+        ]
+        auctions = []
+        if with_auction:
+            result = await self.db.scalars(
+                insert(Auction).returning(Auction, sort_by_parameter_order=True),
+                [
+                    {
+                        "item_id": imported_item.item_id,
+                        "seller_id": self.seller_id,
+                        "start_price": row.start_price,
+                        "start_time": row.start_time,
+                        "end_time": row.end_time,
+                        "original_end_time": row.end_time,
+                        "status": AuctionStatus.ACTIVE
+                        if _ensure_utc(row.start_time) <= now
+                        else AuctionStatus.PENDING,
+                    }
+                    for imported_item, row in with_auction
+                ],
+            )
+            auctions = result.all()
+            for (imported_item, _), auction in zip(with_auction, auctions):
+                imported_item.auction_id = auction.id
+
+        await self.db.commit()
+        scheduler = get_scheduler()
+        for auction in auctions:
+            scheduler.schedule_auction(auction)
+        get_response_cache().invalidate(ITEMS_TAG, AUCTIONS_TAG)
+        self.created.extend(imported)
+
+
+async def import_items(
+    db: AsyncSession,
+    seller_id: int,
+    chunks: AsyncIterator[bytes],
+    fmt: str = NDJSON,
+    chunk_size: int = settings.IMPORT_CHUNK_SIZE,
+    max_rows: int = settings.IMPORT_MAX_ROWS,
+) -> ItemImportResponse:
+    records = _csv_records(chunks) if fmt == CSV else _ndjson_records(chunks)
+    batch = _ImportBatch(db, seller_id)
+    errors: list[ImportRowError] = []
+    count = 0
+    async for record in records:
+        count += 1
+        if count > max_rows:
+            errors.append(
+                ImportRowError(
+                    line=record.line, detail=f"Import is limited to {max_rows} rows"
+                )
+            )
+            break
+        if record.error is not None:
+            errors.append(ImportRowError(line=record.line, detail=record.error))
+            continue
+        try:
+            row = ItemImportRow.model_validate(record.data)
+        except ValidationError as exc:
+            errors.append(ImportRowError(line=record.line, detail=_format_errors(exc)))
+            continue
+        batch.pending.append((record.line, row))
+        if len(batch.pending) >= chunk_size:
+            await batch.flush()
+    await batch.flush()
+    return ItemImportResponse(created=batch.created, errors=errors)
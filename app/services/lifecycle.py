@@ -0,0 +1,310 @@
+import asyncio
+import heapq
+import logging
+import time
+from collections.abc import Awaitable, Callable, Collection, Sequence
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import aliased
+
+from app.config import settings
+from app.database import async_session_factory
+from app.events import get_event_publisher
+from app.events.interface import AuctionEndedEvent
+from app.events.outbox import stage_events
+from app.metrics import LIFECYCLE_LAG, LIFECYCLE_RUN_DURATION
+from app.models.auction import Auction, AuctionStatus
+from app.models.bid import Bid
+from app.response_cache import AUCTIONS_TAG, auction_tag, get_response_cache
+
+logger = logging.getLogger(__name__)
+
+START = "start"
+END = "end"
+
+# Deadlines whose transition skipped or failed are retried this many times,
+# with exponential backoff, before being left to reconciliation
+MAX_TRANSITION_RETRIES = 5
+
+
+def _ensure_utc(dt: datetime) -> datetime:
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+async def verify_resolution(
+    db: AsyncSession, resolved: Sequence[tuple[int, int | None, Decimal | None]]
+) -> list[tuple[int, int | None, Decimal | None]]:
+    """Check winners and prices taken from the tracked leader against bids.
+
+    Only runs with ``AUCTION_RESOLUTION_VERIFY``; it scans each auction's top
+    bid, which is exactly what resolution otherwise avoids. Mismatching
+    auctions are logged and put back to active in the same transaction; the
+    rest are returned.
+    """
+    if not resolved:
+        return []
+    top_bid = (
+        select(Bid)
+        .where(Bid.auction_id == Auction.id)
+        .order_by(Bid.amount.desc(), Bid.id.desc())
+        .limit(1)
+    )
+    result = await db.execute(
+        select(
+            Auction.id,
+            top_bid.with_only_columns(Bid.bidder_id).scalar_subquery(),
+            top_bid.with_only_columns(Bid.amount).scalar_subquery(),
+        ).where(Auction.id.in_([auction_id for auction_id, _, _ in resolved]))
+    )
+    expected = {auction_id: (bidder_id, amount) for auction_id, bidder_id, amount in result}
+    verified = []
+    mismatched = []
+    for auction_id, winner_id, amount in resolved:
+        bidder_id, top_amount = expected[auction_id]
+        if winner_id != bidder_id or (bidder_id is not None and amount != top_amount):
+            logger.error(
+                "Auction %s resolved to bidder %s at %s, but its top bid is "
+                "bidder %s at %s; leaving it open",
+                auction_id,
+                winner_id,
+                amount,
+                bidder_id,
+                top_amount,
+            )
+            mismatched.append(auction_id)
+        else:
+            verified.append((auction_id, winner_id, amount))
+    if mismatched:
+        await db.execute(
+            update(Auction)
+            .where(Auction.id.in_(mismatched))
+            .values(status=AuctionStatus.ACTIVE, winner_id=None)
+            .execution_options(synchronize_session=False)
+        )
+    return verified
+
+
+def _due_auctions(
+    status: AuctionStatus,
+    deadline_column: str,
+    now: datetime,
+    auction_ids: Collection[int] | None,
+):
+    due = aliased(Auction)
+    stmt = select(due.id).where(
+        due.status == status,
+        getattr(due, deadline_column) <= now,
+    )
+    if auction_ids is not None:
+        stmt = stmt.where(due.id.in_(auction_ids))
+    return stmt.with_for_update(skip_locked=True)
+
+
+async def process_auction_transitions(
+    auction_ids: Collection[int] | None = None,
+    session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+) -> set[int]:
+    """Start and end the due auctions, among ``auction_ids`` if given.
+
+    Rows locked by another transaction are skipped, not waited for. Returns
+    the ids of the auctions that were started or ended.
+    """
+    async with session_factory() as db:
+        now = datetime.now(timezone.utc)
+        publisher = get_event_publisher()
+
+        # Activate pending auctions whose start_time has passed
+        result = await db.execute(
+            update(Auction)
+            .where(
+                Auction.id.in_(
+                    _due_auctions(AuctionStatus.PENDING, "start_time", now, auction_ids)
+                )
+            )
+            .values(status=AuctionStatus.ACTIVE)
+            .returning(Auction.id)
+            .execution_options(synchronize_session=False)
+        )
+        changed = list(result.scalars().all())
+
+        # Resolve active auctions whose end_time has passed. Bids keep the
+        # leader and price up to date, so no bids are read.
+        result = await db.execute(
+            update(Auction)
+            .where(
+                Auction.id.in_(
+                    _due_auctions(AuctionStatus.ACTIVE, "end_time", now, auction_ids)
+                )
+            )
+            .values(status=AuctionStatus.ENDED, winner_id=Auction.leading_bidder_id)
+            .returning(Auction.id, Auction.winner_id, Auction.current_highest_bid)
+            .execution_options(synchronize_session=False)
+        )
+        resolved = result.all()
+        transitioned = {*changed, *(auction_id for auction_id, _, _ in resolved)}
+        if settings.AUCTION_RESOLUTION_VERIFY:
+            resolved = await verify_resolution(db, resolved)
+        ended = [AuctionEndedEvent(*row) for row in resolved]
+        stage_events(db, ended)
+        await db.commit()
+
+    changed.extend(event.auction_id for event in ended)
+    if changed:
+        get_response_cache().invalidate(
+            AUCTIONS_TAG, *(auction_tag(auction_id) for auction_id in changed)
+        )
+
+    if ended:
+        await publisher.publish_batch(ended)
+    return transitioned
+
+
+class AuctionScheduler:
+    """Fires auction start/end transitions as their deadlines pass.
+
+    Deadlines live in a min-heap; superseded entries (soft-close extensions,
+    cancellations) are skipped lazily when popped. Only deadlines within
+    ``horizon`` seconds are kept in memory; a low-frequency reconciliation
+    pass scans the database, resolves anything missed and loads the next
+    horizon of deadlines. Due auctions the transition skipped (their row was
+    locked) or failed on are pushed back with a short backoff.
+    """
+
+    def __init__(
+        self,
+        transition: Callable[..., Awaitable[set[int]]] = process_auction_transitions,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+        reconcile_interval: float = settings.LIFECYCLE_RECONCILE_INTERVAL_SECONDS,
+        retry_delay: float = settings.LIFECYCLE_RETRY_DELAY_SECONDS,
+    ):
+        self._transition = transition
+        self._session_factory = session_factory
+        self.reconcile_interval = reconcile_interval
+        self.retry_delay = retry_delay
+        self.horizon = 2 * reconcile_interval
+        self._heap: list[tuple[float, int, str]] = []
+        self._deadlines: dict[str, dict[int, float]] = {START: {}, END: {}}
+        # Attempts so far of the deadlines being retried, by (auction id, kind)
+        self._retries: dict[tuple[int, str], int] = {}
+        self._wakeup = asyncio.Event()
+
+    def schedule(self, auction_id: int, kind: str, when: datetime) -> None:
+        deadline = _ensure_utc(when).timestamp()
+        self._retries.pop((auction_id, kind), None)
+        if self._deadlines[kind].get(auction_id) == deadline:
+            return
+        self._deadlines[kind].pop(auction_id, None)
+        if deadline > time.time() + self.horizon:
+            return
+        self._deadlines[kind][auction_id] = deadline
+        heapq.heappush(self._heap, (deadline, auction_id, kind))
+        if self._heap[0][0] == deadline:
+            self._wakeup.set()
+
+    def schedule_auction(self, auction: Auction) -> None:
+        if auction.status == AuctionStatus.PENDING:
+            self.schedule(auction.id, START, auction.start_time)
+        if auction.status in (AuctionStatus.PENDING, AuctionStatus.ACTIVE):
+            self.schedule(auction.id, END, auction.end_time)
+
+    def unschedule(self, auction_id: int) -> None:
+        for kind in (START, END):
+            self._deadlines[kind].pop(auction_id, None)
+            self._retries.pop((auction_id, kind), None)
+
+    def _pop_due(self, now: float) -> list[tuple[int, str]]:
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            deadline, auction_id, kind = heapq.heappop(self._heap)
+            if self._deadlines[kind].get(auction_id) != deadline:
+                continue
+            del self._deadlines[kind][auction_id]
+            due.append((auction_id, kind))
+            if (auction_id, kind) not in self._retries:
+                LIFECYCLE_LAG.observe(now - deadline)
+        return due
+
+    def _retry(self, due: list[tuple[int, str]], transitioned: set[int]) -> None:
+        for auction_id, kind in due:
+            attempt = self._retries.pop((auction_id, kind), 0)
+            if auction_id in transitioned or attempt >= MAX_TRANSITION_RETRIES:
+                continue
+            delay = self.retry_delay * 2**attempt
+            self.schedule(
+                auction_id, kind, datetime.fromtimestamp(time.time() + delay, timezone.utc)
+            )
+            self._retries[(auction_id, kind)] = attempt + 1
+
+    async def reconcile(self) -> None:
+        await self._transition()
+        until = datetime.fromtimestamp(time.time() + self.horizon, timezone.utc)
+        async with self._session_factory() as db:
+            result = await db.execute(
+                select(Auction.id, Auction.start_time).where(
+                    Auction.status == AuctionStatus.PENDING,
+                    Auction.start_time <= until,
+                )
+            )
+            for auction_id, start_time in result.all():
+                self.schedule(auction_id, START, start_time)
+            result = await db.execute(
+                select(Auction.id, Auction.end_time).where(
+                    Auction.status.in_([AuctionStatus.PENDING, AuctionStatus.ACTIVE]),
+                    Auction.end_time <= until,
+                )
+            )
+            for auction_id, end_time in result.all():
+                self.schedule(auction_id, END, end_time)
+
+    async def run(self) -> None:
+        next_reconcile = 0.0
+        while True:
+            self._wakeup.clear()
+            if time.monotonic() >= next_reconcile:
+                started = time.perf_counter()
+                try:
+                    await self.reconcile()
+                except Exception:
+                    logger.exception("Error reconciling auction lifecycle")
+                LIFECYCLE_RUN_DURATION.observe(
+                    time.perf_counter() - started, ("reconcile",)
+                )
+                next_reconcile = time.monotonic() + self.reconcile_interval
+
+            due = self._pop_due(time.time())
+            if due:
+                started = time.perf_counter()
+                transitioned = set()
+                try:
+                    transitioned = await self._transition(
+                        auction_ids={auction_id for auction_id, _ in due}
+                    )
+                except Exception:
+                    logger.exception("Error in auction lifecycle transition")
+                LIFECYCLE_RUN_DURATION.observe(
+                    time.perf_counter() - started, ("transition",)
+                )
+                self._retry(due, transitioned)
+
+            timeout = next_reconcile - time.monotonic()
+            if self._heap:
+                timeout = min(timeout, self._heap[0][0] - time.time())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(timeout, 0))
+            except asyncio.TimeoutError:
+                pass
+
+
+_scheduler: AuctionScheduler | None = None
+
+
+def get_scheduler() -> AuctionScheduler:
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = AuctionScheduler()
+    return _scheduler
@@ -0,0 +1,95 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+import bcrypt
+
+from app.config import settings
+from app.exceptions import service_unavailable
+from app.metrics import PASSWORD_HASH_QUEUE_WAIT
+
+T = TypeVar("T")
+
+
+def bcrypt_rounds(hashed: str) -> int | None:
+    # "$2b$12$<salt+hash>"
+    try:
+        return int(hashed.split("$")[2])
+    except (IndexError, ValueError):
+        return None
+
+
+class PasswordHasher:
+    """Runs bcrypt on a dedicated thread pool.
+
+    bcrypt releases the GIL while hashing, so threads hash in parallel
+    without blocking the event loop. At most ``max_pending`` operations may
+    be queued or running; beyond that callers get a 503 instead of piling
+    up behind the pool. Queue waits are observed in
+    ``password_hash_queue_wait_seconds``.
+    """
+
+    def __init__(
+        self,
+        workers: int = settings.PASSWORD_HASH_WORKERS,
+        max_pending: int = settings.PASSWORD_HASH_MAX_PENDING,
+    ):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.rejected = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="bcrypt"
+        )
+
+    async def _run(self, fn: Callable[..., T], *args) -> T:
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise service_unavailable("Server is busy, please retry")
+        submitted = time.perf_counter()
+
+        def timed() -> tuple[float, T]:
+            return time.perf_counter() - submitted, fn(*args)
+
+        self.pending += 1
+        try:
+            wait, result = await asyncio.get_running_loop().run_in_executor(
+                self._executor, timed
+            )
+        finally:
+            self.pending -= 1
+        PASSWORD_HASH_QUEUE_WAIT.observe(wait)
+        return result
+
+    async def hash(self, password: str) -> str:
+        salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+        hashed = await self._run(bcrypt.hashpw, password.encode(), salt)
+        return hashed.decode()
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._run(bcrypt.checkpw, password.encode(), hashed.encode())
+
+    def needs_rehash(self, hashed: str) -> bool:
+        return bcrypt_rounds(hashed) != settings.BCRYPT_ROUNDS
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+_hasher: PasswordHasher | None = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    global _hasher
+    if _hasher is None:
+        _hasher = PasswordHasher()
+    return _hasher
+
+
+def shutdown_password_hasher() -> None:
+    global _hasher
+    if _hasher is not None:
+        _hasher.close()
+        _hasher = None
@@ -0,0 +1,132 @@
+"""Compare list-page serialization paths.
+
+Seeds an in-memory SQLite database with auctions and times fetching and
+encoding one page of ``GET /api/v1/auctions/``:
+
+- ``fastapi``: ORM objects through ``response_model`` validation,
+  ``jsonable_encoder`` and ``json.dumps`` (what FastAPI does for a route
+  that returns ORM objects).
+- ``pydantic``: ORM objects validated and dumped by a cached TypeAdapter.
+- ``fast``: Core rows encoded directly (``FAST_SERIALIZATION=true``).
+
+Usage: python -m benchmarks.serialization [--rows 100] [--iterations 500]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app import serialization
+from app.config import settings
+from app.database import Base
+from app.models.auction import Auction, AuctionStatus
+from app.models.item import Item
+from app.models.user import User
+from app.schemas.auction import AuctionResponse
+from app.services.auction import list_auctions
+
+
+async def seed(session_factory: async_sessionmaker[AsyncSession], rows: int) -> None:
+    now = datetime.now(timezone.utc)
+    async with session_factory() as db:
+        await db.execute(
+            insert(User),
+            [{"email": "seller@bench", "username": "seller", "hashed_password": "x"}],
+        )
+        await db.execute(
+            insert(Item),
+            [
+                {
+                    "seller_id": 1,
+                    "title": f"Item {i}",
+                    "description": "Benchmark item",
+                    "size": "M",
+                    "condition": "good",
+                    "category": "tops",
+                    "image_urls": [],
+                }
+                for i in range(rows)
+            ],
+        )
+        await db.execute(
+            insert(Auction),
+            [
+                {
+                    "item_id": i + 1,
+                    "seller_id": 1,
+                    "start_price": Decimal("10.00"),
+                    "current_highest_bid": Decimal("12.50") if i % 2 else None,
+                    "start_time": now - timedelta(hours=1),
+                    "end_time": now + timedelta(hours=1, microseconds=i),
+                    "original_end_time": now + timedelta(hours=1),
+                    "status": AuctionStatus.ACTIVE,
+                    "created_at": now - timedelta(microseconds=i),
+                }
+                for i in range(rows)
+            ],
+        )
+        await db.commit()
+
+
+def fastapi_render(auctions) -> bytes:
+    adapter = TypeAdapter(list[AuctionResponse])
+    value = adapter.validate_python(auctions, from_attributes=True)
+    return json.dumps(
+        jsonable_encoder(value), ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+async def run_path(session_factory, path: str, rows: int, iterations: int) -> list[float]:
+    settings.FAST_SERIALIZATION = path == "fast"
+    timings = []
+    for _ in range(iterations):
+        async with session_factory() as db:
+            started = time.perf_counter()
+            auctions = await list_auctions(db, limit=rows)
+            if path == "fastapi":
+                body = fastapi_render(auctions)
+            else:
+                body = serialization.render_json(list[AuctionResponse], auctions)
+            timings.append(time.perf_counter() - started)
+    assert len(json.loads(body)) == rows
+    return timings
+
+
+async def main(rows: int, iterations: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    await seed(session_factory, rows)
+
+    encoder = "orjson" if serialization.orjson is not None else "json"
+    print(f"{rows} rows per page, {iterations} iterations, fast encoder: {encoder}")
+    baseline = None
+    for path in ("fastapi", "pydantic", "fast"):
+        await run_path(session_factory, path, rows, iterations // 10 or 1)
+        timings = await run_path(session_factory, path, rows, iterations)
+        median = statistics.median(timings) * 1000
+        p95 = statistics.quantiles(timings, n=20)[-1] * 1000
+        baseline = baseline or median
+        print(
+            f"{path:>8}: median {median:7.3f} ms  p95 {p95:7.3f} ms  "
+            f"{baseline / median:5.2f}x"
+        )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.iterations))
@@ -1,14 +1,25 @@
 import asyncio
-from datetime import datetime, timezone
+import os
+from collections.abc import Sequence
+
+# Cheap hashes keep the suite fast; must be set before app settings load
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+# Cross-check every auction resolution against the bids table
+os.environ.setdefault("AUCTION_RESOLUTION_VERIFY", "1")
 
 import pytest
 import pytest_asyncio
+from helpers import future, past
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from app.config import settings
 from app.database import Base
-from app.dependencies import get_db
+from app.dependencies import get_db, get_read_session_factory
 from app.main import app
+from app.response_cache import get_response_cache
+from app.services.auth import user_cache
+from app.services.bid_engine import BidEngine, get_bid_engine
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
@@ -27,6 +38,9 @@ def event_loop():
 async def setup_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    # Ids are reused across tests
+    user_cache.clear()
+    get_response_cache().clear()
     yield
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
@@ -38,6 +52,11 @@ async def db_session():
         yield session
 
 
+@pytest.fixture
+def session_factory():
+    return TestSessionLocal
+
+
 @pytest_asyncio.fixture
 async def client():
     async def override_get_db():
@@ -45,12 +64,26 @@ async def client():
             yield session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_session_factory] = lambda: TestSessionLocal
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
     app.dependency_overrides.clear()
 
 
+@pytest_asyncio.fixture
+async def bid_engine(client: AsyncClient):
+    engine = BidEngine(TestSessionLocal)
+    app.dependency_overrides[get_bid_engine] = lambda: engine
+    yield engine
+    await engine.close()
+
+
+@pytest.fixture
+def optimistic_bids(monkeypatch):
+    monkeypatch.setattr(settings, "BID_MODE", "optimistic")
+
+
 @pytest_asyncio.fixture
 async def auth_headers(client: AsyncClient):
     await client.post(
@@ -77,3 +110,50 @@ async def second_auth_headers(client: AsyncClient):
     )
     token = resp.json()["access_token"]
     return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def active_auction(client: AsyncClient, auth_headers: dict):
+    """Creates an item and its auction, running by default, and places bids."""
+
+    async def create(
+        seller: dict | None = None,
+        start: str | None = None,
+        end: str | None = None,
+        bidder: dict | None = None,
+        amounts: Sequence[str] = (),
+        **item_fields,
+    ) -> int:
+        seller = seller or auth_headers
+        item = await client.post(
+            "/api/v1/items/",
+            json={
+                "title": "Auction Item",
+                "description": "For auction",
+                "size": "M",
+                "condition": "good",
+                "category": "tops",
+                **item_fields,
+            },
+            headers=seller,
+        )
+        auction = await client.post(
+            "/api/v1/auctions/",
+            json={
+                "item_id": item.json()["id"],
+                "start_price": "10.00",
+                "start_time": start or past(),
+                "end_time": end or future(),
+            },
+            headers=seller,
+        )
+        auction_id = auction.json()["id"]
+        for amount in amounts:
+            await client.post(
+                f"/api/v1/auctions/{auction_id}/bids",
+                json={"amount": amount},
+                headers=bidder,
+            )
+        return auction_id
+
+    return create
@@ -0,0 +1,17 @@
+from datetime import datetime, timedelta, timezone
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def future(minutes: int = 60) -> str:
+    return (datetime.now(timezone.utc) + timedelta(minutes=minutes)).isoformat()
+
+
+def past(minutes: int = 60) -> str:
+    return (datetime.now(timezone.utc) - timedelta(minutes=minutes)).isoformat()
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select, update
+
+from app.config import settings
+from app.models import ArchivedBid, Auction, AuctionStatus, Bid
+from app.services import archive as archive_service
+from app.services import export as export_service
+
+
+async def close_long_ago(db_session, auction_id: int) -> None:
+    await db_session.execute(
+        update(Auction)
+        .where(Auction.id == auction_id)
+        .values(
+            status=AuctionStatus.ENDED,
+            end_time=datetime.now(timezone.utc) - timedelta(days=100),
+        )
+    )
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fast", [False, True])
+async def test_archived_bids_still_listed(
+    client: AsyncClient,
+    db_session,
+    session_factory,
+    second_auth_headers: dict,
+    active_auction,
+    monkeypatch,
+    fast: bool,
+):
+    monkeypatch.setattr(settings, "FAST_SERIALIZATION", fast)
+    old = await active_auction(
+        bidder=second_auth_headers, amounts=["11.00", "12.00", "13.00"]
+    )
+    await close_long_ago(db_session, old)
+    await active_auction(bidder=second_auth_headers, amounts=["20.00"])
+    before = (await client.get(f"/api/v1/auctions/{old}/bids")).json()
+
+    assert await archive_service.archive_bids(session_factory, older_than_days=90) == 3
+    assert await archive_service.archive_bids(session_factory, older_than_days=90) == 0
+    assert await db_session.scalar(select(func.count()).select_from(Bid)) == 1
+    assert await db_session.scalar(select(func.count()).select_from(ArchivedBid)) == 3
+
+    # Page through the archived bids with a cursor
+    first = await client.get(f"/api/v1/auctions/{old}/bids", params={"limit": 2})
+    second = await client.get(
+        f"/api/v1/auctions/{old}/bids",
+        params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]},
+    )
+    assert first.json() + second.json() == before
+    assert [bid["amount"] for bid in before] == ["13.00", "12.00", "11.00"]
+
+
+@pytest.mark.asyncio
+async def test_recent_auctions_are_not_archived(
+    db_session,
+    session_factory,
+    second_auth_headers: dict,
+    active_auction,
+):
+    auction_id = await active_auction(bidder=second_auth_headers, amounts=["11.00"])
+    await close_long_ago(db_session, auction_id)
+    assert await archive_service.archive_bids(session_factory, older_than_days=365) == 0
+
+
+@pytest.mark.asyncio
+async def test_export_includes_archived_bids(
+    db_session,
+    session_factory,
+    second_auth_headers: dict,
+    active_auction,
+):
+    auction_id = await active_auction(
+        bidder=second_auth_headers, amounts=["11.00", "12.00"]
+    )
+    await close_long_ago(db_session, auction_id)
+    await archive_service.archive_bids(session_factory, older_than_days=90)
+
+    chunks = [
+        chunk
+        async for chunk in export_service.export_rows(
+            session_factory, export_service.bids_query(auction_id=auction_id)
+        )
+    ]
+    assert len(b"".join(chunks).splitlines()) == 2
+
+
+@pytest.mark.asyncio
+async def test_partition_maintenance_is_postgres_only(session_factory):
+    assert await archive_service.maintain_bid_partitions(session_factory) == (0, [])
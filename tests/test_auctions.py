@@ -1,15 +1,8 @@
-from datetime import datetime, timedelta, timezone
-
 import pytest
+from helpers import future, past
 from httpx import AsyncClient
 
-
-def future(minutes: int = 60) -> str:
-    return (datetime.now(timezone.utc) + timedelta(minutes=minutes)).isoformat()
-
-
-def past(minutes: int = 60) -> str:
-    return (datetime.now(timezone.utc) - timedelta(minutes=minutes)).isoformat()
+from app import metrics
 
 
 async def create_test_item(client: AsyncClient, headers: dict) -> int:
@@ -144,3 +137,136 @@ async def test_duplicate_auction_for_item(client: AsyncClient, auth_headers: dic
         headers=auth_headers,
     )
     assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_relist_item_after_cancel(client: AsyncClient, auth_headers: dict):
+    item_id = await create_test_item(client, auth_headers)
+    payload = {
+        "item_id": item_id,
+        "start_price": "10.00",
+        "start_time": past(5),
+        "end_time": future(60),
+    }
+    first = await client.post("/api/v1/auctions/", json=payload, headers=auth_headers)
+    await client.post(f"/api/v1/auctions/{first.json()['id']}/cancel", headers=auth_headers)
+
+    resp = await client.post("/api/v1/auctions/", json=payload, headers=auth_headers)
+    assert resp.status_code == 201
+    assert resp.json()["id"] != first.json()["id"]
+
+
+async def create_feed_auction(
+    client: AsyncClient,
+    headers: dict,
+    title: str,
+    category: str,
+    start_price: str,
+    ends_in: int,
+    image_urls: list[str] = [],
+) -> int:
+    item = await client.post(
+        "/api/v1/items/",
+        json={
+            "title": title,
+            "description": "For the feed",
+            "size": "S",
+            "condition": "like_new",
+            "category": category,
+            "image_urls": image_urls,
+        },
+        headers=headers,
+    )
+    resp = await client.post(
+        "/api/v1/auctions/",
+        json={
+            "item_id": item.json()["id"],
+            "start_price": start_price,
+            "start_time": past(5),
+            "end_time": future(ends_in),
+        },
+        headers=headers,
+    )
+    return resp.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_feed_embeds_item_summary(
+    client: AsyncClient, auth_headers: dict, second_auth_headers: dict
+):
+    auction_id = await create_feed_auction(
+        client,
+        auth_headers,
+        "Denim jacket",
+        "outerwear",
+        "10.00",
+        60,
+        image_urls=["https://img/1.jpg", "https://img/2.jpg"],
+    )
+    await create_feed_auction(client, auth_headers, "Plain tee", "tops", "5.00", 30)
+    await client.post(
+        f"/api/v1/auctions/{auction_id}/bids",
+        json={"amount": "12.00"},
+        headers=second_auth_headers,
+    )
+
+    with metrics.track_queries() as stats:
+        resp = await client.get(
+            "/api/v1/auctions/feed", params={"category": "outerwear"}
+        )
+    assert resp.status_code == 200
+    stats.assert_max_queries(1)
+
+    [entry] = resp.json()
+    assert entry["id"] == auction_id
+    assert entry["current_highest_bid"] == "12.00"
+    assert entry["bid_count"] == 1
+    assert entry["item"] == {
+        "id": entry["item"]["id"],
+        "title": "Denim jacket",
+        "size": "S",
+        "condition": "like_new",
+        "category": "outerwear",
+        "image_url": "https://img/1.jpg",
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "sort, expected",
+    [
+        ("ending_soon", ["b", "c", "a", "d"]),
+        ("price_asc", ["c", "a", "d", "b"]),
+        ("price_desc", ["b", "d", "a", "c"]),
+        ("newest", ["d", "c", "b", "a"]),
+    ],
+)
+async def test_feed_sorting_and_pagination(
+    client: AsyncClient, auth_headers: dict, sort: str, expected: list[str]
+):
+    for title, price, ends_in in (
+        ("a", "10.00", 90),
+        ("b", "40.00", 30),
+        ("c", "5.00", 60),
+        ("d", "20.00", 120),
+    ):
+        await create_feed_auction(client, auth_headers, title, "tops", price, ends_in)
+
+    titles = []
+    cursor = None
+    while True:
+        params = {"sort": sort, "limit": 3, "status": "active"}
+        if cursor:
+            params["cursor"] = cursor
+        resp = await client.get("/api/v1/auctions/feed", params=params)
+        titles += [entry["item"]["title"] for entry in resp.json()]
+        cursor = resp.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    assert titles == expected
+
+
+@pytest.mark.asyncio
+async def test_feed_rejects_unknown_sort(client: AsyncClient):
+    resp = await client.get("/api/v1/auctions/feed", params={"sort": "popular"})
+    assert resp.status_code == 422
@@ -1,5 +1,15 @@
+import asyncio
+
 import pytest
+from fastapi import HTTPException
 from httpx import AsyncClient
+from sqlalchemy import select
+
+from app import metrics
+from app.config import settings
+from app.models.user import User
+from app.services.auth import invalidate_user, user_cache
+from app.services.password import PasswordHasher, bcrypt_rounds
 
 
 @pytest.mark.asyncio
@@ -66,3 +76,80 @@ async def test_me(client: AsyncClient, auth_headers: dict):
 async def test_me_unauthenticated(client: AsyncClient):
     resp = await client.get("/api/v1/auth/me")
     assert resp.status_code == 403 or resp.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_current_user_is_cached(client: AsyncClient, auth_headers: dict):
+    user_cache.clear()
+    hits, misses = user_cache.hits, user_cache.misses
+
+    first = await client.get("/api/v1/auth/me", headers=auth_headers)
+    second = await client.get("/api/v1/auth/me", headers=auth_headers)
+
+    assert first.json() == second.json()
+    assert user_cache.misses == misses + 1
+    assert user_cache.hits == hits + 1
+
+    invalidate_user(first.json()["id"])
+    await client.get("/api/v1/auth/me", headers=auth_headers)
+    assert user_cache.misses == misses + 2
+
+
+@pytest.mark.asyncio
+async def test_user_cache_drops_credentials_and_follows_updates(
+    client: AsyncClient, auth_headers: dict, db_session
+):
+    user_cache.clear()
+    me = (await client.get("/api/v1/auth/me", headers=auth_headers)).json()
+    assert "hashed_password" not in user_cache.get(me["id"])
+
+    user = await db_session.get(User, me["id"])
+    user.username = "renamed"
+    await db_session.commit()
+
+    assert user_cache.get(me["id"]) is None
+    resp = await client.get("/api/v1/auth/me", headers=auth_headers)
+    assert resp.json()["username"] == "renamed"
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_outdated_cost(
+    client: AsyncClient, db_session, monkeypatch
+):
+    await client.post(
+        "/api/v1/auth/register",
+        json={"email": "cost@test.com", "username": "costuser", "password": "pass123"},
+    )
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", settings.BCRYPT_ROUNDS + 1)
+
+    resp = await client.post(
+        "/api/v1/auth/login", json={"email": "cost@test.com", "password": "pass123"}
+    )
+    assert resp.status_code == 200
+
+    user = await db_session.scalar(select(User).where(User.email == "cost@test.com"))
+    await db_session.refresh(user)
+    assert bcrypt_rounds(user.hashed_password) == settings.BCRYPT_ROUNDS
+
+    resp = await client.post(
+        "/api/v1/auth/login", json={"email": "cost@test.com", "password": "pass123"}
+    )
+    assert resp.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_rejects_when_saturated():
+    hasher = PasswordHasher(workers=1, max_pending=1)
+    try:
+        first = asyncio.create_task(hasher.hash("pass123"))
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException) as exc:
+            await hasher.hash("pass123")
+        assert exc.value.status_code == 503
+        waits = metrics.PASSWORD_HASH_QUEUE_WAIT.count()
+        assert await hasher.verify("pass123", await first)
+        assert metrics.PASSWORD_HASH_QUEUE_WAIT.count() == waits + 2
+        assert hasher.rejected == 1
+        assert hasher.pending == 0
+    finally:
+        hasher.close()
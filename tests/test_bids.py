@@ -1,15 +1,12 @@
-from datetime import datetime, timedelta, timezone
+import asyncio
+from decimal import Decimal
 
 import pytest
+from fastapi import HTTPException
+from helpers import future, past
 from httpx import AsyncClient
 
-
-def future(minutes: int = 60) -> str:
-    return (datetime.now(timezone.utc) + timedelta(minutes=minutes)).isoformat()
-
-
-def past(minutes: int = 60) -> str:
-    return (datetime.now(timezone.utc) - timedelta(minutes=minutes)).isoformat()
+from app.events.noop import NoOpEventPublisher
 
 
 async def setup_auction(
@@ -132,3 +129,223 @@ async def test_cancel_auction_with_bids_fails(
         f"/api/v1/auctions/{auction_id}/cancel", headers=auth_headers
     )
     assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_engine_place_bid(
+    client: AsyncClient, auth_headers: dict, second_auth_headers: dict, bid_engine
+):
+    auction_id = await setup_auction(client, auth_headers)
+    resp = await client.post(
+        f"/api/v1/auctions/{auction_id}/bids",
+        json={"amount": "15.00"},
+        headers=second_auth_headers,
+    )
+    assert resp.status_code == 201
+    data = resp.json()
+    assert data["bid"]["amount"] == "15.00"
+    assert data["was_extended"] is False
+
+    resp = await client.post(
+        f"/api/v1/auctions/{auction_id}/bids",
+        json={"amount": "12.00"},
+        headers=second_auth_headers,
+    )
+    assert resp.status_code == 400
+
+    resp = await client.post(
+        f"/api/v1/auctions/{auction_id}/bids",
+        json={"amount": "20.00"},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 403
+
+    resp = await client.get(f"/api/v1/auctions/{auction_id}")
+    assert resp.json()["current_highest_bid"] == "15.00"
+
+
+@pytest.mark.asyncio
+async def test_engine_soft_close_extension(
+    client: AsyncClient, auth_headers: dict, second_auth_headers: dict, bid_engine
+):
+    auction_id = await setup_auction(client, auth_headers, end_minutes_ahead=3)
+    resp = await client.post(
+        f"/api/v1/auctions/{auction_id}/bids",
+        json={"amount": "15.00"},
+        headers=second_auth_headers,
+    )
+    assert resp.status_code == 201
+    assert resp.json()["was_extended"] is True
+
+    resp = await client.get(f"/api/v1/auctions/{auction_id}")
+    assert resp.json()["end_time"] != resp.json()["original_end_time"]
+
+
+@pytest.mark.asyncio
+async def test_engine_concurrent_bids_are_sequenced(
+    client: AsyncClient, auth_headers: dict, second_auth_headers: dict, bid_engine
+):
+    auction_id = await setup_auction(client, auth_headers)
+    me = await client.get("/api/v1/auth/me", headers=second_auth_headers)
+    bidder_id = me.json()["id"]
+    publisher = NoOpEventPublisher()
+
+    amounts = [Decimal(a) for a in ("11.00", "13.00", "12.00", "15.00", "14.00")]
+    results = await asyncio.gather(
+        *(
+            bid_engine.place_bid(auction_id, bidder_id, amount, publisher)
+            for amount in amounts
+        ),
+        return_exceptions=True,
+    )
+    accepted = [r.bid.amount for r in results if not isinstance(r, Exception)]
+    assert accepted == [Decimal("11.00"), Decimal("13.00"), Decimal("15.00")]
+    assert all(
+        isinstance(r, HTTPException) and r.status_code == 400
+        for r in results
+        if isinstance(r, Exception)
+    )
+
+    resp = await client.get(f"/api/v1/auctions/{auction_id}/bids")
+    assert [b["amount"] for b in resp.json()] == ["15.00", "13.00", "11.00"]
+
+
+async def check_bid_counters(
+    client: AsyncClient, auth_headers: dict, second_auth_headers: dict
+) -> None:
+    auction_id = await setup_auction(client, auth_headers)
+    resp = await client.get(f"/api/v1/auctions/{auction_id}")
+    assert resp.json()["bid_count"] == 0
+    assert resp.json()["last_bid_at"] is None
+    assert resp.json()["leading_bidder_id"] is None
+
+    me = await client.get("/api/v1/auth/me", headers=second_auth_headers)
+    for amount in ("11.00", "10.50", "12.00"):
+        await client.post(
+            f"/api/v1/auctions/{auction_id}/bids",
+            json={"amount": amount},
+            headers=second_auth_headers,
+        )
+    bids = await client.get(f"/api/v1/auctions/{auction_id}/bids")
+
+    resp = await client.get("/api/v1/auctions/")
+    auction = next(a for a in resp.json() if a["id"] == auction_id)
+    assert auction["bid_count"] == 2
+    assert auction["leading_bidder_id"] == me.json()["id"]
+    assert auction["last_bid_at"] == bids.json()[0]["created_at"]
+
+
+@pytest.mark.asyncio
+async def test_bid_counters(
+    client: AsyncClient, auth_headers: dict, second_auth_headers: dict
+):
+    await check_bid_counters(client, auth_headers, second_auth_headers)
+
+
+@pytest.mark.asyncio
+async def test_engine_bid_counters(
+    client: AsyncClient, auth_headers: dict, second_auth_headers: dict, bid_engine
+):
+    await check_bid_counters(client, auth_headers, second_auth_headers)
+
+
+@pytest.mark.asyncio
+async def test_optimistic_bid_counters(
+    client: AsyncClient, auth_headers: dict, second_auth_headers: dict, optimistic_bids
+):
+    await check_bid_counters(client, auth_headers, second_auth_headers)
+
+
+@pytest.mark.asyncio
+async def test_optimistic_place_bid(
+    client: AsyncClient, auth_headers: dict, second_auth_headers: dict, optimistic_bids
+):
+    auction_id = await setup_auction(client, auth_headers)
+    resp = await client.post(
+        f"/api/v1/auctions/{auction_id}/bids",
+        json={"amount": "15.00"},
+        headers=second_auth_headers,
+    )
+    assert resp.status_code == 201
+    data = resp.json()
+    assert data["bid"]["amount"] == "15.00"
+    assert data["bid"]["auction_id"] == auction_id
+    assert data["was_extended"] is False
+
+    resp = await client.post(
+        f"/api/v1/auctions/{auction_id}/bids",
+        json={"amount": "15.00"},
+        headers=second_auth_headers,
+    )
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Bid must be greater than 15.00"
+
+    resp = await client.post(
+        f"/api/v1/auctions/{auction_id}/bids",
+        json={"amount": "20.00"},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 403
+
+    resp = await client.post(
+        "/api/v1/auctions/99999/bids",
+        json={"amount": "20.00"},
+        headers=second_auth_headers,
+    )
+    assert resp.status_code == 404
+
+    resp = await client.get(f"/api/v1/auctions/{auction_id}/bids")
+    assert [b["amount"] for b in resp.json()] == ["15.00"]
+
+
+@pytest.mark.asyncio
+async def test_optimistic_bid_on_pending_auction(
+    client: AsyncClient, auth_headers: dict, second_auth_headers: dict, optimistic_bids
+):
+    auction_id = await setup_auction(client, auth_headers, start_minutes_ago=-30)
+    resp = await client.post(
+        f"/api/v1/auctions/{auction_id}/bids",
+        json={"amount": "15.00"},
+        headers=second_auth_headers,
+    )
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Auction is not active"
+
+
+@pytest.mark.asyncio
+async def test_optimistic_soft_close_extension(
+    client: AsyncClient, auth_headers: dict, second_auth_headers: dict, optimistic_bids
+):
+    auction_id = await setup_auction(client, auth_headers, end_minutes_ahead=3)
+    resp = await client.post(
+        f"/api/v1/auctions/{auction_id}/bids",
+        json={"amount": "15.00"},
+        headers=second_auth_headers,
+    )
+    assert resp.status_code == 201
+    assert resp.json()["was_extended"] is True
+
+    resp = await client.get(f"/api/v1/auctions/{auction_id}")
+    assert resp.json()["end_time"] != resp.json()["original_end_time"]
+
+
+@pytest.mark.asyncio
+async def test_bid_history_cursor_pagination(
+    client: AsyncClient, auth_headers: dict, second_auth_headers: dict
+):
+    auction_id = await setup_auction(client, auth_headers)
+    for amount in ("11.00", "12.00", "13.00"):
+        await client.post(
+            f"/api/v1/auctions/{auction_id}/bids",
+            json={"amount": amount},
+            headers=second_auth_headers,
+        )
+
+    first = await client.get(f"/api/v1/auctions/{auction_id}/bids", params={"limit": 2})
+    assert [b["amount"] for b in first.json()] == ["13.00", "12.00"]
+    second = await client.get(
+        f"/api/v1/auctions/{auction_id}/bids",
+        params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]},
+    )
+    assert [b["amount"] for b in second.json()] == ["11.00"]
+    assert "X-Next-Cursor" not in second.headers
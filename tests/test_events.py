@@ -0,0 +1,210 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+
+from app.events import get_event_hub
+from app.events.buffered import BufferedEventPublisher
+from app.events.hub import EventHub
+from app.events.interface import AuctionEndedEvent, BidPlacedEvent
+from app.events.noop import NoOpEventPublisher
+from app.main import app
+
+
+def bid_event(auction_id: int = 1, bid_id: int = 1) -> BidPlacedEvent:
+    return BidPlacedEvent(
+        auction_id=auction_id,
+        bid_id=bid_id,
+        bidder_id=2,
+        amount=Decimal("15.00"),
+        new_end_time=datetime(2030, 1, 1, tzinfo=timezone.utc),
+        was_extended=False,
+    )
+
+
+class RecordingPublisher(NoOpEventPublisher):
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.batches = []
+
+    async def publish_batch(self, events):
+        await asyncio.sleep(self.delay)
+        self.batches.append(list(events))
+
+
+@pytest.mark.asyncio
+async def test_hub_fans_out_one_frame_per_event():
+    hub = EventHub(queue_size=10)
+    first = hub.subscribe(1)
+    second = hub.subscribe(1)
+    other = hub.subscribe(2)
+
+    hub.broadcast(bid_event(auction_id=1))
+
+    frame = await first.get()
+    assert await second.get() is frame
+    assert frame.startswith(b"event: bid_placed\ndata: ")
+    data = json.loads(frame.split(b"data: ", 1)[1])
+    assert data["auction_id"] == 1
+    assert data["amount"] == "15.00"
+    assert other._queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_hub_drops_slow_consumer():
+    hub = EventHub(queue_size=2)
+    slow = hub.subscribe(1)
+    fast = hub.subscribe(1)
+
+    for bid_id in range(3):
+        hub.broadcast(bid_event(bid_id=bid_id))
+        await fast.get()
+
+    assert hub.subscriber_count(1) == 1
+    assert await slow.get() is None
+
+
+@pytest.mark.asyncio
+async def test_hub_ends_streams_when_auction_ends():
+    hub = EventHub(queue_size=10)
+    subscription = hub.subscribe(1)
+
+    hub.broadcast(AuctionEndedEvent(auction_id=1, winner_id=2, final_price=Decimal("20.00")))
+
+    assert (await subscription.get()).startswith(b"event: auction_ended")
+    assert await subscription.get() is None
+    assert hub.subscriber_count(1) == 0
+
+
+@pytest.mark.asyncio
+async def test_place_bid_feeds_hub(
+    client: AsyncClient, second_auth_headers: dict, active_auction
+):
+    auction_id = await active_auction()
+    hub = get_event_hub()
+    subscription = hub.subscribe(auction_id)
+    try:
+        await client.post(
+            f"/api/v1/auctions/{auction_id}/bids",
+            json={"amount": "15.00"},
+            headers=second_auth_headers,
+        )
+        frame = await asyncio.wait_for(subscription.get(), timeout=1)
+    finally:
+        hub.unsubscribe(subscription)
+    assert json.loads(frame.split(b"data: ", 1)[1])["amount"] == "15.00"
+
+
+@pytest.mark.asyncio
+async def test_stream_unknown_auction(client: AsyncClient):
+    resp = await client.get("/api/v1/auctions/999/stream")
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_bids_until_disconnect(
+    client: AsyncClient, second_auth_headers: dict, active_auction
+):
+    # httpx's ASGI transport buffers whole responses, so drive the app directly
+    auction_id = await active_auction()
+    hub = get_event_hub()
+    path = f"/api/v1/auctions/{auction_id}/stream"
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"test")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("test", 80),
+    }
+    messages: asyncio.Queue[dict] = asyncio.Queue()
+    disconnected = asyncio.Event()
+
+    async def receive():
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    stream = asyncio.create_task(app(scope, receive, messages.put))
+    try:
+        start = await asyncio.wait_for(messages.get(), timeout=1)
+        assert start["status"] == 200
+        assert (b"content-type", b"text/event-stream; charset=utf-8") in start["headers"]
+        assert hub.subscriber_count(auction_id) == 1
+
+        await client.post(
+            f"/api/v1/auctions/{auction_id}/bids",
+            json={"amount": "15.00"},
+            headers=second_auth_headers,
+        )
+        frame = (await asyncio.wait_for(messages.get(), timeout=1))["body"]
+        assert frame.startswith(b"event: bid_placed\ndata: ")
+        assert json.loads(frame.split(b"data: ", 1)[1])["amount"] == "15.00"
+
+        disconnected.set()
+        await asyncio.wait_for(stream, timeout=1)
+    finally:
+        stream.cancel()
+    assert hub.subscriber_count(auction_id) == 0
+
+
+@pytest.mark.asyncio
+async def test_buffered_publisher_batches_events():
+    inner = RecordingPublisher()
+    publisher = BufferedEventPublisher(inner, batch_size=3, linger_ms=20)
+
+    for bid_id in range(5):
+        await publisher.publish_batch([bid_event(bid_id=bid_id)])
+    await publisher.publish_auction_ended(1, winner_id=2, final_price=Decimal("20.00"))
+    await publisher.close()
+
+    assert [len(batch) for batch in inner.batches] == [3, 3]
+    assert [e.type for e in inner.batches[-1]] == ["bid_placed", "bid_placed", "auction_ended"]
+
+
+@pytest.mark.asyncio
+async def test_buffered_publisher_returns_before_delivery():
+    inner = RecordingPublisher(delay=0.2)
+    publisher = BufferedEventPublisher(inner, linger_ms=0)
+
+    await asyncio.wait_for(publisher.publish_batch([bid_event()]), timeout=0.05)
+    assert inner.batches == []
+    await publisher.flush()
+    assert len(inner.batches) == 1
+    await publisher.close()
+
+
+@pytest.mark.asyncio
+async def test_buffered_publisher_drops_on_overflow():
+    inner = RecordingPublisher(delay=0.1)
+    publisher = BufferedEventPublisher(inner, batch_size=1, linger_ms=0, max_queue=2)
+
+    for bid_id in range(5):
+        await publisher.publish_batch([bid_event(bid_id=bid_id)])
+    await publisher.close()
+
+    assert publisher.dropped == 3
+    assert sum(len(batch) for batch in inner.batches) == 2
+
+
+@pytest.mark.asyncio
+async def test_buffered_publisher_blocks_on_overflow():
+    inner = RecordingPublisher(delay=0.01)
+    publisher = BufferedEventPublisher(
+        inner, batch_size=1, linger_ms=0, max_queue=1, overflow="block"
+    )
+
+    for bid_id in range(5):
+        await publisher.publish_batch([bid_event(bid_id=bid_id)])
+    await publisher.close()
+
+    assert publisher.dropped == 0
+    assert [batch[0].bid_id for batch in inner.batches] == list(range(5))
@@ -0,0 +1,105 @@
+import csv
+import io
+import json
+
+import pytest
+from helpers import past
+from httpx import AsyncClient
+
+from app.schemas.auction import AuctionResponse
+from app.services import export as export_service
+
+
+@pytest.mark.asyncio
+async def test_export_bids_ndjson_and_resume(
+    client: AsyncClient,
+    auth_headers: dict,
+    second_auth_headers: dict,
+    active_auction,
+):
+    auction_id = await active_auction(
+        bidder=second_auth_headers, amounts=["11.00", "12.00", "13.50"]
+    )
+
+    resp = await client.get("/api/v1/export/bids", headers=auth_headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert [row["amount"] for row in rows] == ["11.00", "12.00", "13.50"]
+    assert rows[0]["auction_id"] == auction_id
+    history = await client.get(f"/api/v1/auctions/{auction_id}/bids")
+    assert sorted(rows, key=lambda row: row["id"], reverse=True) == history.json()
+
+    resp = await client.get(
+        "/api/v1/export/bids", params={"cursor": rows[0]["id"]}, headers=auth_headers
+    )
+    assert [json.loads(line) for line in resp.text.splitlines()] == rows[1:]
+
+
+@pytest.mark.asyncio
+async def test_export_auctions_csv_time_range(
+    client: AsyncClient,
+    auth_headers: dict,
+    second_auth_headers: dict,
+    active_auction,
+):
+    await active_auction(bidder=second_auth_headers, amounts=["15.00"])
+
+    resp = await client.get(
+        "/api/v1/export/auctions",
+        params={"format": "csv", "since": past()},
+        headers=auth_headers,
+    )
+    assert resp.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert len(rows) == 1
+    assert rows[0]["current_highest_bid"] == "15.00"
+    assert rows[0]["status"] == "active"
+    assert rows[0]["winner_id"] == ""
+
+    resp = await client.get(
+        "/api/v1/export/auctions",
+        params={"format": "csv", "until": past()},
+        headers=auth_headers,
+    )
+    assert resp.text.splitlines() == [",".join(AuctionResponse.model_fields)]
+
+
+@pytest.mark.asyncio
+async def test_export_requires_auth(client: AsyncClient):
+    resp = await client.get("/api/v1/export/bids")
+    assert resp.status_code in (401, 403)
+
+
+@pytest.mark.asyncio
+async def test_export_cli_resumes_csv(
+    client: AsyncClient,
+    auth_headers: dict,
+    second_auth_headers: dict,
+    active_auction,
+    session_factory,
+    monkeypatch,
+    tmp_path,
+):
+    await active_auction(bidder=second_auth_headers, amounts=["11.00", "12.00"])
+    monkeypatch.setattr(export_service, "async_session_factory", session_factory)
+    output = tmp_path / "bids.csv"
+
+    await export_service.main(["bids", "--format", "csv", "--output", str(output)])
+    first = list(csv.DictReader(output.open()))
+    assert len(first) == 2
+
+    await active_auction(bidder=second_auth_headers, amounts=["20.00"])
+    await export_service.main(
+        [
+            "bids",
+            "--format",
+            "csv",
+            "--output",
+            str(output),
+            "--cursor",
+            first[-1]["id"],
+        ]
+    )
+    rows = list(csv.DictReader(output.open()))
+    assert [row["amount"] for row in rows] == ["11.00", "12.00", "20.00"]
@@ -0,0 +1,127 @@
+import random
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import text
+
+from app.models import (
+    Auction,
+    AuctionStatus,
+    Bid,
+    ClothingSize,
+    Item,
+    ItemCategory,
+    ItemCondition,
+    User,
+)
+
+
+async def seed(db) -> None:
+    rng = random.Random(0)
+    now = datetime.now(timezone.utc)
+    users = [
+        User(email=f"user{i}@test.com", username=f"user{i}", hashed_password="x")
+        for i in range(20)
+    ]
+    db.add_all(users)
+    await db.flush()
+
+    items = [
+        Item(
+            seller_id=rng.choice(users).id,
+            title=f"Item {i}",
+            description="Seeded",
+            size=rng.choice(list(ClothingSize)),
+            condition=rng.choice(list(ItemCondition)),
+            category=rng.choice(list(ItemCategory)),
+            image_urls=[],
+        )
+        for i in range(500)
+    ]
+    db.add_all(items)
+    await db.flush()
+
+    auctions = []
+    for item in items:
+        start = now + timedelta(minutes=rng.randint(-600, 600))
+        end = start + timedelta(minutes=rng.randint(30, 600))
+        auctions.append(
+            Auction(
+                item_id=item.id,
+                seller_id=item.seller_id,
+                start_price=Decimal("10.00"),
+                start_time=start,
+                end_time=end,
+                original_end_time=end,
+                status=rng.choice(list(AuctionStatus)),
+            )
+        )
+    db.add_all(auctions)
+    await db.flush()
+
+    db.add_all(
+        Bid(
+            auction_id=rng.choice(auctions).id,
+            bidder_id=rng.choice(users).id,
+            amount=Decimal(rng.randint(1100, 50000)) / 100,
+        )
+        for _ in range(3000)
+    )
+    await db.commit()
+    await db.execute(text("ANALYZE"))
+
+
+async def query_plan(db, sql: str) -> str:
+    result = await db.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+    return "\n".join(row[-1] for row in result.all())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "sql, index",
+    [
+        (
+            "SELECT * FROM bids WHERE auction_id = 42 ORDER BY amount DESC LIMIT 1",
+            "ix_bids_auction_id_amount",
+        ),
+        (
+            "SELECT * FROM bids WHERE auction_id = 42 ORDER BY amount DESC, id DESC LIMIT 50",
+            "ix_bids_auction_id_amount",
+        ),
+        (
+            "SELECT * FROM bids_archive WHERE auction_id = 42 "
+            "ORDER BY amount DESC, id DESC LIMIT 50",
+            "ix_bids_archive_auction_id_amount",
+        ),
+        (
+            "SELECT id FROM auctions WHERE status = 'ACTIVE' "
+            "AND end_time <= '2026-01-01 00:00:00.000000'",
+            "ix_auctions_status_end_time",
+        ),
+        (
+            "SELECT id FROM auctions WHERE status = 'PENDING' "
+            "AND start_time <= '2026-01-01 00:00:00.000000'",
+            "ix_auctions_status_start_time",
+        ),
+        (
+            "SELECT * FROM auctions WHERE status = 'ACTIVE' "
+            "ORDER BY created_at DESC, id DESC LIMIT 50",
+            "ix_auctions_status_created_at",
+        ),
+        (
+            "SELECT * FROM items WHERE category = 'TOPS' AND size = 'M' "
+            "AND condition = 'GOOD' ORDER BY created_at DESC, id DESC LIMIT 50",
+            "ix_items_category_size_condition_created_at",
+        ),
+        (
+            "SELECT * FROM items ORDER BY created_at DESC, id DESC LIMIT 50",
+            "ix_items_created_at",
+        ),
+    ],
+)
+async def test_hot_queries_use_composite_indexes(db_session, sql: str, index: str):
+    await seed(db_session)
+    plan = await query_plan(db_session, sql)
+    assert index in plan
+    assert "USE TEMP B-TREE" not in plan
@@ -0,0 +1,173 @@
+import json
+
+import pytest
+from helpers import future, past
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from app.models.auction import Auction
+from app.models.item import Item
+from app.services.item_import import NDJSON, _csv_records, import_items
+
+
+def item_row(title: str, **fields) -> dict:
+    return {
+        "title": title,
+        "description": "Imported",
+        "size": "M",
+        "condition": "good",
+        "category": "tops",
+        **fields,
+    }
+
+
+async def chunked(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+@pytest.mark.asyncio
+async def test_import_ndjson(client: AsyncClient, auth_headers: dict):
+    lines = [
+        json.dumps(item_row("Plain shirt")),
+        json.dumps(item_row("Bad size", size="XXXL")),
+        "{not json",
+        "",
+        json.dumps(
+            item_row(
+                "Auctioned coat",
+                start_price="20.00",
+                start_time=past(),
+                end_time=future(),
+            )
+        ),
+        json.dumps(item_row("Half auction", start_price="20.00")),
+    ]
+    resp = await client.post(
+        "/api/v1/items/import",
+        content="\n".join(lines),
+        headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+
+    assert [row["line"] for row in data["created"]] == [1, 5]
+    assert data["created"][0]["auction_id"] is None
+    assert [error["line"] for error in data["errors"]] == [2, 3, 6]
+    assert data["errors"][0]["detail"].startswith("size:")
+    assert data["errors"][1]["detail"] == "Invalid JSON"
+    assert "must be given together" in data["errors"][2]["detail"]
+
+    auction_id = data["created"][1]["auction_id"]
+    auction = await client.get(f"/api/v1/auctions/{auction_id}")
+    assert auction.json()["status"] == "active"
+    assert auction.json()["item_id"] == data["created"][1]["item_id"]
+
+    items = await client.get("/api/v1/items/")
+    assert {item["title"] for item in items.json()} == {"Plain shirt", "Auctioned coat"}
+
+
+@pytest.mark.asyncio
+async def test_import_csv(client: AsyncClient, auth_headers: dict):
+    body = (
+        "title,description,size,condition,category,image_urls,start_price,start_time,end_time\n"
+        'Denim jacket,"Light wash,\nsize M",M,good,outerwear,https://a/1.jpg|https://a/2.jpg,,,\n'
+        "Short row,M,good\n"
+        f"Wool scarf,Warm,M,like_new,accessories,,5.00,{future()},{future(120)}\n"
+    )
+    resp = await client.post(
+        "/api/v1/items/import",
+        content=body,
+        headers={**auth_headers, "Content-Type": "text/csv"},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [row["line"] for row in data["created"]] == [2, 5]
+    assert data["errors"] == [{"line": 4, "detail": "Expected 9 columns, got 3"}]
+
+    item = await client.get(f"/api/v1/items/{data['created'][0]['item_id']}")
+    assert item.json()["description"] == "Light wash,\nsize M"
+    assert item.json()["image_urls"] == ["https://a/1.jpg", "https://a/2.jpg"]
+    auction = await client.get(f"/api/v1/auctions/{data['created'][1]['auction_id']}")
+    assert auction.json()["status"] == "pending"
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_unknown_content_type(
+    client: AsyncClient, auth_headers: dict
+):
+    resp = await client.post(
+        "/api/v1/items/import",
+        content="<items/>",
+        headers={**auth_headers, "Content-Type": "application/xml"},
+    )
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_import_in_chunks(client: AsyncClient, auth_headers: dict, db_session):
+    me = await client.get("/api/v1/auth/me", headers=auth_headers)
+    body = "\n".join(json.dumps(item_row(f"Item {i}")) for i in range(7)).encode()
+    body += b"\n\xff\xfe\n"
+
+    result = await import_items(
+        db_session, me.json()["id"], chunked(body, 13), fmt=NDJSON, chunk_size=3
+    )
+
+    assert [row.line for row in result.created] == list(range(1, 8))
+    assert [(error.line, error.detail) for error in result.errors] == [
+        (8, "Invalid UTF-8")
+    ]
+    assert await db_session.scalar(select(func.count(Item.id))) == 7
+    assert await db_session.scalar(select(func.count(Auction.id))) == 0
+
+
+@pytest.mark.asyncio
+async def test_import_mixed_naive_and_aware_times(client: AsyncClient, auth_headers: dict):
+    lines = [
+        json.dumps(
+            item_row(
+                "Naive start",
+                start_price="5.00",
+                start_time="2099-01-01T10:00:00",
+                end_time="2099-01-01T12:00:00Z",
+            )
+        ),
+        json.dumps(
+            item_row(
+                "Ends first",
+                start_price="5.00",
+                start_time="2099-01-01T12:00:00",
+                end_time="2099-01-01T10:00:00Z",
+            )
+        ),
+    ]
+    resp = await client.post(
+        "/api/v1/items/import",
+        content="\n".join(lines),
+        headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [row["line"] for row in data["created"]] == [1]
+    assert [error["line"] for error in data["errors"]] == [2]
+    assert "end_time must be after start_time" in data["errors"][0]["detail"]
+
+
+@pytest.mark.asyncio
+async def test_csv_unterminated_quote_is_bounded():
+    body = (
+        "title,description,size,condition,category\n"
+        'Broken,"never closed,M,good,tops\n'
+        + "filler line\n" * 5
+        + "Plain tee,Cotton,M,good,tops\n"
+    ).encode()
+
+    records = [record async for record in _csv_records(chunked(body, 7), 40)]
+
+    assert (records[0].line, records[0].error) == (
+        2,
+        "Invalid CSV: unterminated quoted field",
+    )
+    assert records[-1].line == 8
+    assert records[-1].data["title"] == "Plain tee"
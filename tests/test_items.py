@@ -144,3 +144,123 @@ async def test_delete_item(client: AsyncClient, auth_headers: dict):
 
     resp = await client.get(f"/api/v1/items/{item_id}")
     assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_list_items_cursor_pagination(client: AsyncClient, auth_headers: dict):
+    for i in range(5):
+        await client.post(
+            "/api/v1/items/",
+            json={
+                "title": f"Item {i}",
+                "description": "Paged",
+                "size": "M",
+                "condition": "good",
+                "category": "tops",
+            },
+            headers=auth_headers,
+        )
+
+    titles = []
+    params = {"limit": 2}
+    while True:
+        resp = await client.get("/api/v1/items/", params=params)
+        assert resp.status_code == 200
+        titles.extend(item["title"] for item in resp.json())
+        next_cursor = resp.headers.get("X-Next-Cursor")
+        if next_cursor is None:
+            break
+        params = {"limit": 2, "cursor": next_cursor}
+    assert titles == [f"Item {i}" for i in reversed(range(5))]
+
+
+@pytest.mark.asyncio
+async def test_list_items_invalid_cursor(client: AsyncClient):
+    resp = await client.get("/api/v1/items/", params={"cursor": "not-a-cursor"})
+    assert resp.status_code == 400
+
+
+async def _create_item(client: AsyncClient, auth_headers: dict, **fields) -> int:
+    data = {
+        "description": "",
+        "size": "M",
+        "condition": "good",
+        "category": "outerwear",
+        **fields,
+    }
+    resp = await client.post("/api/v1/items/", json=data, headers=auth_headers)
+    return resp.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_search_items_ranks_title_matches_first(
+    client: AsyncClient, auth_headers: dict
+):
+    in_description = await _create_item(
+        client,
+        auth_headers,
+        title="Blue jacket",
+        description="Vintage wash, goes well with denim",
+    )
+    in_title = await _create_item(
+        client, auth_headers, title="Vintage denim jacket", description="Barely worn"
+    )
+    await _create_item(client, auth_headers, title="Denim skirt", category="bottoms")
+
+    resp = await client.get("/api/v1/items/search", params={"q": "vintage denim jackets"})
+    assert resp.status_code == 200
+    assert [item["id"] for item in resp.json()] == [in_title, in_description]
+
+    resp = await client.get(
+        "/api/v1/items/search", params={"q": "denim", "category": "bottoms"}
+    )
+    assert [item["title"] for item in resp.json()] == ["Denim skirt"]
+
+
+@pytest.mark.asyncio
+async def test_search_items_follows_updates_and_deletes(
+    client: AsyncClient, auth_headers: dict
+):
+    item_id = await _create_item(client, auth_headers, title="Wool coat")
+    await client.put(
+        f"/api/v1/items/{item_id}", json={"title": "Linen shirt"}, headers=auth_headers
+    )
+
+    resp = await client.get("/api/v1/items/search", params={"q": "wool"})
+    assert resp.json() == []
+    resp = await client.get("/api/v1/items/search", params={"q": "linen"})
+    assert [item["id"] for item in resp.json()] == [item_id]
+
+    await client.delete(f"/api/v1/items/{item_id}", headers=auth_headers)
+    resp = await client.get("/api/v1/items/search", params={"q": "linen"})
+    assert resp.json() == []
+
+
+@pytest.mark.asyncio
+async def test_search_items_cursor_pagination(client: AsyncClient, auth_headers: dict):
+    for i in range(5):
+        await _create_item(client, auth_headers, title=f"Denim jacket {i}")
+
+    ids = []
+    params = {"q": "denim", "limit": 2}
+    while True:
+        resp = await client.get("/api/v1/items/search", params=params)
+        assert resp.status_code == 200
+        ids.extend(item["id"] for item in resp.json())
+        next_cursor = resp.headers.get("X-Next-Cursor")
+        if next_cursor is None:
+            break
+        params = {"q": "denim", "limit": 2, "cursor": next_cursor}
+    assert len(ids) == 5
+    assert len(set(ids)) == 5
+
+
+@pytest.mark.asyncio
+async def test_search_items_ignores_query_syntax(client: AsyncClient, auth_headers: dict):
+    await _create_item(client, auth_headers, title="Denim jacket")
+    resp = await client.get("/api/v1/items/search", params={"q": 'denim" (*'})
+    assert resp.status_code == 200
+    assert len(resp.json()) == 1
+
+    resp = await client.get("/api/v1/items/search", params={"q": "!!"})
+    assert resp.json() == []
@@ -0,0 +1,246 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from helpers import future, past
+from httpx import AsyncClient
+from sqlalchemy import update
+
+from app.events.noop import NoOpEventPublisher
+from app.models.auction import Auction, AuctionStatus
+from app.services import lifecycle
+from app.services.lifecycle import END, START, AuctionScheduler, process_auction_transitions
+
+
+def in_seconds(seconds: float) -> datetime:
+    return datetime.now(timezone.utc) + timedelta(seconds=seconds)
+
+
+class RecordingTransition:
+    def __init__(self):
+        self.calls: list[tuple[float, set[int] | None]] = []
+
+    async def __call__(self, auction_ids=None):
+        self.calls.append((time.time(), auction_ids))
+        return set(auction_ids or ())
+
+
+class BatchRecordingPublisher(NoOpEventPublisher):
+    def __init__(self):
+        self.batches = []
+
+    async def publish_batch(self, events):
+        self.batches.append(list(events))
+
+
+async def run_scheduler(scheduler: AuctionScheduler, seconds: float) -> None:
+    task = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(seconds)
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_scheduler_fires_at_deadline(session_factory):
+    transition = RecordingTransition()
+    scheduler = AuctionScheduler(transition, session_factory, reconcile_interval=60)
+    deadline = in_seconds(0.2)
+    scheduler.schedule(1, END, deadline)
+    scheduler.schedule(2, START, in_seconds(0.2))
+
+    await run_scheduler(scheduler, 0.5)
+
+    fired = [(at, ids) for at, ids in transition.calls if ids is not None]
+    assert len(fired) == 1
+    at, ids = fired[0]
+    assert ids == {1, 2}
+    assert 0 <= at - deadline.timestamp() < 0.1
+
+
+@pytest.mark.asyncio
+async def test_scheduler_skips_superseded_deadlines(session_factory):
+    transition = RecordingTransition()
+    scheduler = AuctionScheduler(transition, session_factory, reconcile_interval=60)
+    scheduler.schedule(1, END, in_seconds(0.1))
+    scheduler.schedule(1, END, in_seconds(0.3))
+    scheduler.schedule(2, END, in_seconds(0.1))
+    scheduler.unschedule(2)
+
+    await run_scheduler(scheduler, 0.5)
+
+    fired = [ids for _, ids in transition.calls if ids is not None]
+    assert fired == [{1}]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_retries_auction_locked_at_deadline(
+    active_auction, session_factory, db_session
+):
+    end = in_seconds(0.1)
+    auction_id = await active_auction(start=past(10), end=end.isoformat())
+    locked = {auction_id}
+
+    async def transition(auction_ids=None):
+        # SQLite has no row locks: skip the way FOR UPDATE SKIP LOCKED would
+        if auction_ids is not None:
+            auction_ids = set(auction_ids) - locked
+        return await process_auction_transitions(auction_ids, session_factory)
+
+    async def release():
+        await asyncio.sleep(0.2)
+        locked.clear()
+
+    scheduler = AuctionScheduler(
+        transition, session_factory, reconcile_interval=60, retry_delay=0.05
+    )
+    scheduler.schedule(auction_id, END, end)
+    await asyncio.gather(run_scheduler(scheduler, 0.6), release())
+
+    auction = await db_session.get(Auction, auction_id)
+    assert auction.status == AuctionStatus.ENDED
+
+
+@pytest.mark.asyncio
+async def test_scheduler_retries_failed_transition(session_factory):
+    calls = []
+
+    async def transition(auction_ids=None):
+        calls.append(auction_ids)
+        if len(calls) == 2:
+            raise RuntimeError("database went away")
+        return set(auction_ids or ())
+
+    scheduler = AuctionScheduler(
+        transition, session_factory, reconcile_interval=60, retry_delay=0.05
+    )
+    scheduler.schedule(1, END, in_seconds(0.1))
+
+    await run_scheduler(scheduler, 0.4)
+
+    assert [ids for ids in calls if ids is not None] == [{1}, {1}]
+
+
+@pytest.mark.asyncio
+async def test_process_transitions_ends_due_auction(active_auction, session_factory):
+    auction_id = await active_auction(start=past(10), end=past(5))
+
+    await process_auction_transitions({auction_id}, session_factory=session_factory)
+
+    async with session_factory() as db:
+        auction = await db.get(Auction, auction_id)
+    assert auction.status == AuctionStatus.ENDED
+
+
+@pytest.mark.asyncio
+async def test_process_transitions_resolves_in_bulk(
+    client: AsyncClient,
+    second_auth_headers: dict,
+    active_auction,
+    session_factory,
+    monkeypatch,
+):
+    publisher = BatchRecordingPublisher()
+    monkeypatch.setattr(lifecycle, "get_event_publisher", lambda: publisher)
+
+    with_bids = await active_auction(
+        bidder=second_auth_headers, amounts=["12.00", "18.00"]
+    )
+    without_bids = await active_auction()
+    pending = await active_auction(start=future(1))
+    me = await client.get("/api/v1/auth/me", headers=second_auth_headers)
+
+    async with session_factory() as db:
+        await db.execute(
+            update(Auction)
+            .where(Auction.id.in_([with_bids, without_bids]))
+            .values(end_time=datetime.now(timezone.utc) - timedelta(seconds=1))
+        )
+        await db.execute(
+            update(Auction)
+            .where(Auction.id == pending)
+            .values(start_time=datetime.now(timezone.utc) - timedelta(seconds=1))
+        )
+        await db.commit()
+
+    await process_auction_transitions(session_factory=session_factory)
+
+    async with session_factory() as db:
+        won = await db.get(Auction, with_bids)
+        unsold = await db.get(Auction, without_bids)
+        started = await db.get(Auction, pending)
+    assert won.status == AuctionStatus.ENDED
+    assert won.winner_id == me.json()["id"]
+    assert str(won.current_highest_bid) == "18.00"
+    assert unsold.status == AuctionStatus.ENDED
+    assert unsold.winner_id is None
+    assert started.status == AuctionStatus.ACTIVE
+
+    assert len(publisher.batches) == 1
+    assert {e.auction_id: e.winner_id for e in publisher.batches[0]} == {
+        with_bids: me.json()["id"],
+        without_bids: None,
+    }
+
+
+async def auction_with_bids(active_auction, bidder: dict, session_factory) -> int:
+    auction_id = await active_auction(bidder=bidder, amounts=["12.00", "18.00"])
+    async with session_factory() as db:
+        await db.execute(
+            update(Auction)
+            .where(Auction.id == auction_id)
+            .values(end_time=datetime.now(timezone.utc) - timedelta(seconds=1))
+        )
+        await db.commit()
+    return auction_id
+
+
+@pytest.mark.asyncio
+async def test_read_resolves_from_tracked_leader(
+    client: AsyncClient, second_auth_headers: dict, active_auction, session_factory
+):
+    auction_id = await auction_with_bids(
+        active_auction, second_auth_headers, session_factory
+    )
+    me = await client.get("/api/v1/auth/me", headers=second_auth_headers)
+
+    resp = await client.get(f"/api/v1/auctions/{auction_id}")
+    assert resp.json()["status"] == "ended"
+    assert resp.json()["winner_id"] == me.json()["id"]
+    assert resp.json()["current_highest_bid"] == "18.00"
+
+
+@pytest.mark.asyncio
+async def test_verify_mode_skips_wrong_leader(
+    client: AsyncClient,
+    second_auth_headers: dict,
+    active_auction,
+    session_factory,
+    monkeypatch,
+    caplog,
+):
+    monkeypatch.setattr(lifecycle.settings, "AUCTION_RESOLUTION_VERIFY", True)
+    drifted = await auction_with_bids(active_auction, second_auth_headers, session_factory)
+    healthy = await auction_with_bids(active_auction, second_auth_headers, session_factory)
+    async with session_factory() as db:
+        await db.execute(
+            update(Auction).where(Auction.id == drifted).values(leading_bidder_id=None)
+        )
+        await db.commit()
+
+    await process_auction_transitions(
+        {drifted, healthy}, session_factory=session_factory
+    )
+
+    async with session_factory() as db:
+        assert (await db.get(Auction, drifted)).status == AuctionStatus.ACTIVE
+        assert (await db.get(Auction, healthy)).status == AuctionStatus.ENDED
+    assert f"Auction {drifted} resolved to bidder None" in caplog.text
+
+    resp = await client.get(f"/api/v1/auctions/{drifted}")
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "active"
+    assert resp.json()["winner_id"] is None
@@ -0,0 +1,212 @@
+import asyncio
+import json
+import time
+from datetime import datetime, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app import metrics
+from app.database import _engine_options, pool_stats, prefill_pool
+from app.metrics import Counter, Histogram, Registry
+from app.models.item import Item
+from app.services.item_import import import_items
+from app.services.lifecycle import END, AuctionScheduler
+
+
+def test_exposition_format():
+    registry = Registry()
+    histogram = Histogram(
+        "demo_seconds", "Demo", ("route",), buckets=(0.1, 1.0), registry=registry
+    )
+    histogram.observe(0.05, ("/a",))
+    histogram.observe(0.5, ("/a",))
+    histogram.observe(5, ("/a",))
+    counter = Counter("demo_total", "Demo", ("status",), registry=registry)
+    counter.inc(labels=(200,))
+
+    assert histogram.samples() == [
+        'demo_seconds_bucket{route="/a",le="0.1"} 1',
+        'demo_seconds_bucket{route="/a",le="1.0"} 2',
+        'demo_seconds_bucket{route="/a",le="+Inf"} 3',
+        'demo_seconds_sum{route="/a"} 5.55',
+        'demo_seconds_count{route="/a"} 3',
+    ]
+    assert registry.render().endswith(
+        "# HELP demo_total Demo\n"
+        "# TYPE demo_total counter\n"
+        'demo_total{status="200"} 1\n'
+    )
+    with pytest.raises(ValueError):
+        Counter("demo_total", "Duplicate", registry=registry)
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reports_routes_and_queries(
+    client: AsyncClient, second_auth_headers: dict, active_auction
+):
+    route = "/api/v1/auctions/{auction_id}"
+    requests_before = metrics.HTTP_REQUEST_DURATION.count(("GET", route))
+    queries_before = metrics.HTTP_REQUEST_DB_QUERIES.sum((route,))
+    locks_before = metrics.BID_LOCK_WAIT.count()
+
+    auction_id = await active_auction()
+    await client.post(
+        f"/api/v1/auctions/{auction_id}/bids",
+        json={"amount": "11.00"},
+        headers=second_auth_headers,
+    )
+    await client.get(f"/api/v1/auctions/{auction_id}")
+
+    assert metrics.HTTP_REQUEST_DURATION.count(("GET", route)) == requests_before + 1
+    assert metrics.HTTP_REQUEST_DB_QUERIES.sum((route,)) > queries_before
+    assert metrics.BID_LOCK_WAIT.count() == locks_before + 1
+
+    resp = await client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert f'http_requests_total{{method="GET",route="{route}",status="200"}}' in resp.text
+    assert "# TYPE db_pool_checkout_wait_seconds histogram" in resp.text
+    assert "event_stream_subscribers 0" in resp.text
+    assert "# TYPE password_hash_queue_wait_seconds histogram" in resp.text
+    assert "password_hash_rejected_total 0" in resp.text
+    assert "# TYPE user_cache_hits_total counter" in resp.text
+    assert "user_cache_size " in resp.text
+
+
+def test_scheduler_records_lag():
+    scheduler = AuctionScheduler(reconcile_interval=60)
+    before = metrics.LIFECYCLE_LAG.count()
+    scheduler.schedule(1, END, datetime.now(timezone.utc))
+
+    assert scheduler._pop_due(time.time() + 0.5) == [(1, END)]
+    assert metrics.LIFECYCLE_LAG.count() == before + 1
+
+
+@pytest.mark.asyncio
+async def test_list_auctions_query_count_is_constant(
+    client: AsyncClient, active_auction
+):
+    await active_auction()
+    with metrics.track_queries() as few:
+        await client.get("/api/v1/auctions/", params={"limit": 50})
+
+    for _ in range(4):
+        await active_auction()
+    with metrics.track_queries() as many:
+        await client.get("/api/v1/auctions/", params={"limit": 50})
+
+    many.assert_no_repeats()
+    many.assert_max_queries(few.queries)
+
+
+@pytest.mark.asyncio
+async def test_debug_headers(client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(metrics.settings, "DEBUG", False)
+    resp = await client.get("/api/v1/auctions/")
+    assert "x-db-query-count" not in resp.headers
+
+    monkeypatch.setattr(metrics.settings, "DEBUG", True)
+    resp = await client.get("/api/v1/auctions/", params={"limit": 5})
+    assert int(resp.headers["x-db-query-count"]) >= 1
+    assert float(resp.headers["x-db-query-ms"]) >= 0
+
+
+@pytest.mark.asyncio
+async def test_repeated_statements_are_flagged(db_session):
+    with metrics.track_queries() as stats:
+        for item_id in range(3):
+            await db_session.execute(select(Item).where(Item.id == item_id))
+
+    assert stats.queries == 3
+    assert list(stats.repeated(3).values()) == [3]
+    with pytest.raises(AssertionError, match="possible N\\+1"):
+        stats.assert_no_repeats()
+    with pytest.raises(AssertionError, match="at most 2 queries"):
+        stats.assert_max_queries(2)
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_batches_are_not_repeats(
+    client: AsyncClient, auth_headers: dict, db_session
+):
+    me = await client.get("/api/v1/auth/me", headers=auth_headers)
+    rows = [
+        {
+            "title": f"Item {index}",
+            "description": "Desc",
+            "size": "M",
+            "condition": "good",
+            "category": "tops",
+        }
+        for index in range(24)
+    ]
+    body = "\n".join(json.dumps(row) for row in rows).encode()
+
+    async def chunks():
+        yield body
+
+    with metrics.track_queries() as stats:
+        result = await import_items(db_session, me.json()["id"], chunks(), chunk_size=2)
+
+    assert len(result.created) == 24
+    assert stats.queries >= 12
+    assert stats.repeated(10) == {}
+
+
+@pytest.mark.asyncio
+async def test_pool_prefill_and_stats(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}"
+    bind = create_async_engine(url, **{**_engine_options(url), "pool_size": 3})
+    try:
+        assert await prefill_pool(bind, size=5) == 3
+        stats = pool_stats(bind)
+        assert stats["pool"] == "TimedQueuePool"
+        assert stats["size"] == 3
+        assert stats["checked_in"] == 3
+        assert stats["checked_out"] == 0
+
+        async with bind.connect():
+            stats = pool_stats(bind)
+        assert stats["checked_out"] == 1
+        assert stats["checkouts"] == 4
+    finally:
+        await bind.dispose()
+
+
+class FailingSecondConnect:
+    def __init__(self, bind):
+        self.bind = bind
+        self.pool = bind.pool
+        self.calls = 0
+
+    def connect(self):
+        self.calls += 1
+        if self.calls == 2:
+            return self
+        return self.bind.connect()
+
+    async def start(self):
+        raise ConnectionRefusedError("database is down")
+
+
+@pytest.mark.asyncio
+async def test_pool_prefill_failure_returns_connections(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}"
+    bind = create_async_engine(url, **{**_engine_options(url), "pool_size": 3})
+    try:
+        with pytest.raises(ConnectionRefusedError):
+            await prefill_pool(FailingSecondConnect(bind), size=3)
+        await asyncio.sleep(0.05)
+        assert bind.pool.checkedout() == 0
+    finally:
+        await bind.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_endpoint(client: AsyncClient):
+    resp = await client.get("/internal/db-pool")
+    assert resp.status_code == 200
+    assert resp.json() == pool_stats()
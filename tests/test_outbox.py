@@ -0,0 +1,152 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, update
+
+from app.config import settings
+from app.events import get_event_hub
+from app.events.interface import BidPlacedEvent
+from app.events.noop import NoOpEventPublisher
+from app.events.outbox import OutboxRelay, deserialize_event, serialize_event
+from app.models.auction import Auction
+from app.models.outbox import OutboxEvent
+
+
+class RecordingPublisher(NoOpEventPublisher):
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.events = []
+
+    async def publish_batch(self, events):
+        if self.fail:
+            raise RuntimeError("push backend down")
+        self.events.extend(events)
+
+
+@pytest.fixture
+def outbox_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "EVENT_OUTBOX_ENABLED", True)
+
+
+def test_event_serialization_round_trip():
+    event = BidPlacedEvent(
+        auction_id=1,
+        bid_id=2,
+        bidder_id=3,
+        amount=Decimal("15.50"),
+        new_end_time=datetime(2030, 1, 1, tzinfo=timezone.utc),
+        was_extended=True,
+    )
+    assert deserialize_event(event.type, serialize_event(event)) == event
+
+
+@pytest.mark.asyncio
+async def test_bid_writes_outbox_row(
+    second_auth_headers: dict,
+    active_auction,
+    session_factory,
+    outbox_enabled,
+):
+    auction_id = await active_auction(bidder=second_auth_headers, amounts=["15.00"])
+
+    async with session_factory() as db:
+        rows = (await db.scalars(select(OutboxEvent))).all()
+    assert len(rows) == 1
+    assert rows[0].event_type == "bid_placed"
+    assert rows[0].auction_id == auction_id
+    assert rows[0].payload["amount"] == "15.00"
+    assert rows[0].delivered_at is None
+
+
+@pytest.mark.asyncio
+async def test_rejected_bid_writes_nothing(
+    second_auth_headers: dict,
+    active_auction,
+    session_factory,
+    outbox_enabled,
+):
+    await active_auction(bidder=second_auth_headers, amounts=["5.00"])
+
+    async with session_factory() as db:
+        assert (await db.scalars(select(OutboxEvent))).all() == []
+
+
+@pytest.mark.asyncio
+async def test_resolution_on_read_writes_outbox_row(
+    client: AsyncClient,
+    second_auth_headers: dict,
+    active_auction,
+    session_factory,
+    outbox_enabled,
+):
+    auction_id = await active_auction(bidder=second_auth_headers, amounts=["15.00"])
+    async with session_factory() as db:
+        await db.execute(
+            update(Auction)
+            .where(Auction.id == auction_id)
+            .values(end_time=datetime(2020, 1, 1, tzinfo=timezone.utc))
+        )
+        await db.commit()
+    hub = get_event_hub()
+    subscription = hub.subscribe(auction_id)
+
+    resp = await client.get(f"/api/v1/auctions/{auction_id}")
+    assert resp.json()["status"] == "ended"
+
+    async with session_factory() as db:
+        rows = (await db.scalars(select(OutboxEvent).order_by(OutboxEvent.id))).all()
+    assert [row.event_type for row in rows] == ["bid_placed", "auction_ended"]
+    assert rows[1].payload["final_price"] == "15.00"
+    frame = await asyncio.wait_for(subscription.get(), timeout=1)
+    assert frame.startswith(b"event: auction_ended")
+    # The stream ends with the auction
+    assert await subscription.get() is None
+
+
+@pytest.mark.asyncio
+async def test_relay_delivers_in_order(
+    second_auth_headers: dict,
+    active_auction,
+    session_factory,
+    outbox_enabled,
+):
+    await active_auction(bidder=second_auth_headers, amounts=["11.00", "12.00", "13.00"])
+    publisher = RecordingPublisher()
+    relay = OutboxRelay(publisher, session_factory, batch_size=2)
+
+    assert await relay.drain_once() == 2
+    assert await relay.drain_once() == 1
+    assert await relay.drain_once() == 0
+
+    assert [e.amount for e in publisher.events] == [
+        Decimal("11.00"),
+        Decimal("12.00"),
+        Decimal("13.00"),
+    ]
+    async with session_factory() as db:
+        rows = (await db.scalars(select(OutboxEvent))).all()
+    assert all(row.delivered_at is not None for row in rows)
+
+
+@pytest.mark.asyncio
+async def test_relay_keeps_events_on_failure(
+    second_auth_headers: dict,
+    active_auction,
+    session_factory,
+    outbox_enabled,
+):
+    await active_auction(bidder=second_auth_headers, amounts=["15.00"])
+    relay = OutboxRelay(RecordingPublisher(fail=True), session_factory)
+
+    with pytest.raises(RuntimeError):
+        await relay.drain_once()
+
+    async with session_factory() as db:
+        row = (await db.scalars(select(OutboxEvent))).one()
+    assert row.delivered_at is None
+    assert row.attempts == 1
+    assert "push backend down" in row.last_error
@@ -0,0 +1,161 @@
+import pytest
+from helpers import past
+from httpx import AsyncClient
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database import Base, ReplicaSet, get_replica_set
+from app.dependencies import get_read_session_factory
+from app.main import app
+from app.models.auction import Auction, AuctionStatus
+
+
+async def read_only_copy(session_factory, path) -> str:
+    """Copies the primary into a SQLite file and returns a read-only URL to it."""
+    bind = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with session_factory() as db, bind.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        for table in Base.metadata.sorted_tables:
+            rows = (await db.execute(select(table))).mappings().all()
+            if rows:
+                await conn.execute(insert(table), [dict(row) for row in rows])
+    await bind.dispose()
+    return f"sqlite+aiosqlite:///file:{path}?mode=ro&uri=true"
+
+
+@pytest.mark.asyncio
+async def test_round_robin_and_health_checks(session_factory, tmp_path):
+    urls = [
+        f"sqlite+aiosqlite:///{tmp_path / 'replica-a.db'}",
+        f"sqlite+aiosqlite:///{tmp_path / 'replica-b.db'}",
+        f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica-c.db'}",
+    ]
+    replicas = ReplicaSet(urls, primary=session_factory, check_interval=1)
+    try:
+        await replicas.check()
+        assert replicas.healthy == [True, True, False]
+
+        picked = [replicas.session_factory() for _ in range(4)]
+        assert picked == [replicas.factories[i] for i in (0, 1, 0, 1)]
+
+        replicas.healthy = [False, False, False]
+        assert replicas.session_factory() is session_factory
+    finally:
+        await replicas.close()
+
+
+@pytest.mark.asyncio
+async def test_recent_writer_reads_from_primary(session_factory, tmp_path):
+    replicas = ReplicaSet(
+        [f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"],
+        primary=session_factory,
+        read_your_writes=60,
+    )
+    try:
+        replicas.mark_write(1)
+        assert replicas.session_factory(1) is session_factory
+        assert replicas.session_factory(2) is replicas.factories[0]
+        assert replicas.session_factory() is replicas.factories[0]
+    finally:
+        await replicas.close()
+
+
+@pytest.mark.asyncio
+async def test_pinned_writers_are_bounded(session_factory, tmp_path):
+    replicas = ReplicaSet(
+        [f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"],
+        primary=session_factory,
+        read_your_writes=60,
+        max_writers=2,
+    )
+    try:
+        for user_id in (1, 2, 3):
+            replicas.mark_write(user_id)
+        assert [replicas.pinned(user_id) for user_id in (1, 2, 3)] == [False, True, True]
+    finally:
+        await replicas.close()
+
+
+@pytest.mark.asyncio
+async def test_bid_pins_bidder_to_primary(
+    client: AsyncClient,
+    second_auth_headers: dict,
+    active_auction,
+    session_factory,
+    tmp_path,
+):
+    replicas = ReplicaSet(
+        [f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"], primary=session_factory
+    )
+    app.dependency_overrides[get_replica_set] = lambda: replicas
+    try:
+        auction_id = await active_auction()
+        resp = await client.post(
+            f"/api/v1/auctions/{auction_id}/bids",
+            json={"amount": "11.00"},
+            headers=second_auth_headers,
+        )
+        assert resp.status_code == 201
+        bidder_id = resp.json()["bid"]["bidder_id"]
+        assert replicas.session_factory(bidder_id) is session_factory
+        assert replicas.session_factory() is replicas.factories[0]
+    finally:
+        await replicas.close()
+
+
+@pytest.mark.asyncio
+async def test_overdue_auction_is_resolved_on_primary(
+    client: AsyncClient, active_auction, session_factory, tmp_path
+):
+    ended = await active_auction(start=past(10), end=past(5))
+    closing = await active_auction(start=past(10), end=past(5))
+    url = await read_only_copy(session_factory, tmp_path / "replica.db")
+    replicas = ReplicaSet([url], primary=session_factory)
+    app.dependency_overrides.pop(get_read_session_factory)
+    app.dependency_overrides[get_replica_set] = lambda: replicas
+    try:
+        resp = await client.get(f"/api/v1/auctions/{ended}")
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "ended"
+
+        resp = await client.get(f"/api/v1/auctions/{closing}/stream")
+        assert resp.status_code == 400
+        assert resp.json()["detail"] == "Auction is closed"
+
+        # The replica was only read from
+        async with replicas.factories[0]() as db:
+            statuses = await db.scalars(select(Auction.status))
+            assert set(statuses) == {AuctionStatus.ACTIVE}
+    finally:
+        await replicas.close()
+
+
+@pytest.mark.asyncio
+async def test_cached_replica_read_does_not_hide_own_bid(
+    client: AsyncClient,
+    second_auth_headers: dict,
+    active_auction,
+    session_factory,
+    tmp_path,
+):
+    auction_id = await active_auction()
+    # The replica lags: it never sees the bid below
+    url = await read_only_copy(session_factory, tmp_path / "replica.db")
+    replicas = ReplicaSet([url], primary=session_factory, read_your_writes=60)
+    app.dependency_overrides.pop(get_read_session_factory)
+    app.dependency_overrides[get_replica_set] = lambda: replicas
+    try:
+        resp = await client.post(
+            f"/api/v1/auctions/{auction_id}/bids",
+            json={"amount": "11.00"},
+            headers=second_auth_headers,
+        )
+        assert resp.status_code == 201
+
+        stale = await client.get(f"/api/v1/auctions/{auction_id}")
+        assert stale.json()["current_highest_bid"] is None
+
+        own = await client.get(f"/api/v1/auctions/{auction_id}", headers=second_auth_headers)
+        assert own.json()["current_highest_bid"] == "11.00"
+    finally:
+        await replicas.close()
@@ -0,0 +1,153 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from helpers import FakeClock
+from httpx import AsyncClient
+from sqlalchemy import update
+from starlette.requests import Request
+
+from app.config import settings
+from app.models.auction import Auction
+from app.response_cache import ResponseCache, auction_tag, get_response_cache
+from app.services.lifecycle import process_auction_transitions
+
+
+def make_request(path: str, headers: dict | None = None) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": b"",
+            "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_conditional_get(client: AsyncClient, active_auction):
+    auction_id = await active_auction()
+
+    first = await client.get(f"/api/v1/auctions/{auction_id}")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    second = await client.get(f"/api/v1/auctions/{auction_id}")
+    assert second.headers["ETag"] == etag
+    assert second.json() == first.json()
+
+    resp = await client.get(
+        f"/api/v1/auctions/{auction_id}", headers={"If-None-Match": etag}
+    )
+    assert resp.status_code == 304
+    assert resp.content == b""
+
+
+@pytest.mark.asyncio
+async def test_bid_invalidates_auction_and_bid_list(
+    client: AsyncClient, second_auth_headers: dict, active_auction, monkeypatch
+):
+    clock = FakeClock()
+    monkeypatch.setattr(get_response_cache()._entries, "clock", clock)
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_LIST_TTL_SECONDS", 5)
+    auction_id = await active_auction()
+    before = await client.get(f"/api/v1/auctions/{auction_id}")
+    assert (await client.get(f"/api/v1/auctions/{auction_id}/bids")).json() == []
+    listed = await client.get("/api/v1/auctions/")
+
+    await client.post(
+        f"/api/v1/auctions/{auction_id}/bids",
+        json={"amount": "15.00"},
+        headers=second_auth_headers,
+    )
+
+    after = await client.get(
+        f"/api/v1/auctions/{auction_id}",
+        headers={"If-None-Match": before.headers["ETag"]},
+    )
+    assert after.status_code == 200
+    assert after.json()["current_highest_bid"] == "15.00"
+    bids = await client.get(f"/api/v1/auctions/{auction_id}/bids")
+    assert [bid["amount"] for bid in bids.json()] == ["15.00"]
+    # Lists are left alone by bids and only catch up after their TTL
+    relisted = await client.get("/api/v1/auctions/")
+    assert relisted.headers["ETag"] == listed.headers["ETag"]
+
+    clock.now = 5
+    relisted = await client.get("/api/v1/auctions/")
+    assert relisted.json()[0]["current_highest_bid"] == "15.00"
+
+
+@pytest.mark.asyncio
+async def test_item_update_invalidates(client: AsyncClient, auth_headers: dict):
+    resp = await client.post(
+        "/api/v1/items/",
+        json={
+            "title": "Old title",
+            "description": "Desc",
+            "size": "M",
+            "condition": "good",
+            "category": "tops",
+        },
+        headers=auth_headers,
+    )
+    item_id = resp.json()["id"]
+    assert (await client.get(f"/api/v1/items/{item_id}")).json()["title"] == "Old title"
+    await client.get("/api/v1/items/")
+
+    await client.put(
+        f"/api/v1/items/{item_id}", json={"title": "New title"}, headers=auth_headers
+    )
+
+    assert (await client.get(f"/api/v1/items/{item_id}")).json()["title"] == "New title"
+    assert (await client.get("/api/v1/items/")).json()[0]["title"] == "New title"
+
+
+@pytest.mark.asyncio
+async def test_resolver_invalidates(
+    client: AsyncClient, active_auction, db_session, session_factory
+):
+    auction_id = await active_auction()
+    assert (await client.get(f"/api/v1/auctions/{auction_id}")).json()["status"] == "active"
+
+    await db_session.execute(
+        update(Auction)
+        .where(Auction.id == auction_id)
+        .values(end_time=datetime.now(timezone.utc) - timedelta(seconds=1))
+    )
+    await db_session.commit()
+    await process_auction_transitions(session_factory=session_factory)
+
+    assert (await client.get(f"/api/v1/auctions/{auction_id}")).json()["status"] == "ended"
+
+
+def test_read_racing_a_write_is_not_stored():
+    cache = ResponseCache(maxsize=10, ttl=60, enabled=True)
+    request = make_request("/api/v1/auctions/1")
+    tags = [auction_tag(1)]
+
+    version = cache.version(tags)
+    cache.invalidate(auction_tag(1))
+    resp = cache.store(request, b'{"stale":true}', tags, version)
+    assert resp.status_code == 200
+    assert cache.lookup(request) is None
+
+    cache.store(request, b'{"fresh":true}', tags, cache.version(tags))
+    assert cache.lookup(request).body == b'{"fresh":true}'
+
+    cached = cache.lookup(make_request("/api/v1/auctions/1", {"If-None-Match": "*"}))
+    assert cached.status_code == 304
+
+
+def test_replica_reads_expire_within_lag():
+    clock = FakeClock()
+    cache = ResponseCache(maxsize=10, ttl=60, enabled=True)
+    cache._entries.clock = clock
+    request = make_request("/api/v1/auctions/1")
+    request.state.max_staleness = 2
+    tags = [auction_tag(1)]
+    cache.store(request, b"{}", tags, cache.version(tags))
+    assert cache.lookup(request) is not None
+
+    clock.now = 2
+    assert cache.lookup(request) is None
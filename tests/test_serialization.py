@@ -0,0 +1,123 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient
+
+from app import serialization
+from app.config import settings
+from app.models.auction import AuctionStatus
+from app.response_cache import get_response_cache
+from app.schemas.auction import AuctionFeedEntry, AuctionResponse
+from app.schemas.bid import BidResponse
+from app.schemas.item import ItemSummary
+from app.serialization import render_json
+
+
+def auction_row(**overrides) -> SimpleNamespace:
+    values = {
+        "id": 1,
+        "item_id": 2,
+        "seller_id": 3,
+        "start_price": Decimal("10.00"),
+        "current_highest_bid": None,
+        "start_time": datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc),
+        "end_time": datetime(2026, 1, 1, 12, 30, 0, 500000, tzinfo=timezone.utc),
+        "original_end_time": datetime(2026, 1, 1, 12, 30, 0, 123),
+        "status": AuctionStatus.ACTIVE,
+        "winner_id": None,
+        "bid_count": 0,
+        "last_bid_at": None,
+        "leading_bidder_id": None,
+        "created_at": datetime(2026, 1, 1, 11, 0, 0, 1, tzinfo=timezone.utc),
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+@pytest.mark.parametrize("fast_json", ["orjson", "json"])
+def test_fast_path_matches_pydantic(monkeypatch, fast_json):
+    if fast_json == "orjson" and serialization.orjson is None:
+        pytest.skip("orjson is not installed")
+    if fast_json == "json":
+        monkeypatch.setattr(serialization, "dumps", serialization._stdlib_dumps)
+    rows = [
+        auction_row(),
+        auction_row(
+            id=4,
+            current_highest_bid=Decimal("1E+2"),
+            winner_id=9,
+            bid_count=3,
+            last_bid_at=datetime(2026, 1, 1, 12, 10, tzinfo=timezone.utc),
+            leading_bidder_id=9,
+        ),
+    ]
+    bid = SimpleNamespace(
+        id=1,
+        auction_id=2,
+        bidder_id=3,
+        amount=Decimal("15.50"),
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+    feed = [
+        AuctionFeedEntry(
+            **{
+                name: getattr(rows[1], name)
+                for name in AuctionFeedEntry.model_fields
+                if name != "item"
+            },
+            item=ItemSummary(
+                id=2,
+                title="Jacket",
+                size="M",
+                condition="good",
+                category="outerwear",
+                image_url=None,
+            ),
+        )
+    ]
+
+    monkeypatch.setattr(settings, "FAST_SERIALIZATION", False)
+    expected = [
+        render_json(list[AuctionResponse], rows),
+        render_json(AuctionResponse, rows[0]),
+        render_json(list[BidResponse], [bid]),
+        render_json(list[AuctionFeedEntry], feed),
+    ]
+    monkeypatch.setattr(settings, "FAST_SERIALIZATION", True)
+    actual = [
+        render_json(list[AuctionResponse], rows),
+        render_json(AuctionResponse, rows[0]),
+        render_json(list[BidResponse], [bid]),
+        render_json(list[AuctionFeedEntry], feed),
+    ]
+    assert actual == expected
+
+
+@pytest.mark.asyncio
+async def test_fast_path_endpoints_match(
+    client: AsyncClient, second_auth_headers: dict, active_auction, monkeypatch
+):
+    auction_id = await active_auction(
+        title="Fast Item",
+        description="Désc",
+        image_urls=["https://example.com/a.jpg"],
+        bidder=second_auth_headers,
+        amounts=["12.50"],
+    )
+    monkeypatch.setattr(get_response_cache(), "enabled", False)
+    item_id = (await client.get(f"/api/v1/auctions/{auction_id}")).json()["item_id"]
+
+    paths = [
+        "/api/v1/items/",
+        f"/api/v1/items/{item_id}",
+        "/api/v1/auctions/",
+        f"/api/v1/auctions/{auction_id}",
+        f"/api/v1/auctions/{auction_id}/bids",
+    ]
+    monkeypatch.setattr(settings, "FAST_SERIALIZATION", False)
+    expected = [(await client.get(path)).content for path in paths]
+    monkeypatch.setattr(settings, "FAST_SERIALIZATION", True)
+    actual = [(await client.get(path)).content for path in paths]
+    assert actual == expected